@@ -1,17 +1,41 @@
-from datetime import datetime
+import hashlib
+import logging
+import pickle
+import time
+from datetime import UTC, datetime, timedelta
 
 from cerberus import Validator
 from dateutil import parser
+from dateutil.relativedelta import relativedelta
+from django.conf import settings
 from django.db import connection
 from django.db.models import Case, FloatField, Value, When
 from django.db.models.fields.json import KeyTextTransform
 from django.db.models.functions import Cast, Trunc
 from django.utils import timezone
 from django.utils.functional import cached_property
+from redis.exceptions import RedisError
 from rest_framework.exceptions import ValidationError
+from shared.metrics import Counter, Histogram, inc_counter
 
 from codecov_auth.models import Owner
 from core.models import Repository
+from services.redis_configuration import get_redis_connection
+
+log = logging.getLogger(__name__)
+
+CHART_CACHE_COUNTER = Counter(
+    "api_chart_cache_lookups",
+    "Number of organization chart historical segment cache lookups",
+    ["result"],
+)
+
+CHART_QUERY_LATENCIES = Histogram(
+    "api_chart_query_runtime_seconds",
+    "Runtime in seconds of the organization chart queries",
+    ["segment"],
+    buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30],
+)
 
 
 class ChartParamValidator(Validator):
@@ -133,10 +157,32 @@ def apply_grouping(queryset, data):
     # should be the one with the min/max value we want to aggregate by
 
 
+def truncate_date(date, grouping_unit):
+    """
+    Python equivalent of Postgres' DATE_TRUNC for the grouping units accepted
+    by the ChartQueryRunner.
+    """
+    if grouping_unit == "week":
+        return date - timedelta(days=date.weekday())
+    if grouping_unit == "month":
+        return date.replace(day=1)
+    if grouping_unit == "quarter":
+        return date.replace(month=3 * ((date.month - 1) // 3) + 1, day=1)
+    if grouping_unit == "year":
+        return date.replace(month=1, day=1)
+    return date
+
+
 class ChartQueryRunner:
     """
     Houses the SQL query that retrieves data for analytics chart, and
     the associated parameter validation + transformation required for it.
+
+    The datapoints are split in two segments: the historical segment, made of
+    every time window that ended before the current one, and the live tail,
+    starting at the time window containing today. Commits landing on the default
+    branch only ever change the live tail, so the historical segment is cached
+    in redis and only the (cheap) live tail is recomputed on each request.
     """
 
     def __init__(self, user, request_params):
@@ -186,6 +232,27 @@ class ChartQueryRunner:
     def grouping_unit(self):
         return self.request_params.get("grouping_unit")
 
+    @property
+    def interval_delta(self):
+        if self.grouping_unit == "quarter":
+            return relativedelta(months=3)
+        return relativedelta(**{f"{self.grouping_unit}s": 1})
+
+    @property
+    def live_tail_start_date(self):
+        """
+        First date of the time window containing today. Datapoints on or after
+        this date can still change as new commits land.
+        """
+        return truncate_date(datetime.date(timezone.now()), self.grouping_unit)
+
+    @property
+    def historical_end_date(self):
+        """
+        Last date of the date spine whose datapoint can no longer change.
+        """
+        return min(self.end_date, self.live_tail_start_date - timedelta(days=1))
+
     @property
     def ordering(self):
         """
@@ -290,6 +357,134 @@ class ChartQueryRunner:
         if not self.first_complete_commit_date:
             return []
 
+        start_date = truncate_date(self.start_date, self.grouping_unit)
+        datapoints = self._historical_datapoints() + self._live_tail_datapoints()
+        results = [
+            datapoint
+            for datapoint in datapoints
+            if datapoint["date"].date() >= start_date
+        ]
+        if self.ordering == "DESC":
+            results.reverse()
+        return results
+
+    @property
+    def _historical_cache_key(self):
+        key_data = "|".join(
+            (
+                self.request_params["service"],
+                self.request_params["owner_username"],
+                self.repoids,
+                self.grouping_unit,
+                self.interval,
+                str(self.first_complete_commit_date),
+                str(self.historical_end_date),
+            )
+        )
+        return f"chart/historical/{hashlib.sha256(key_data.encode()).hexdigest()}"
+
+    def _historical_datapoints(self):
+        """
+        Datapoints of the historical segment, in ascending date order. Since the
+        cache key contains the last date of the segment, entries naturally roll
+        over when a new time window starts. Commits completed after the segment
+        was cached (e.g. with past timestamps) are only included once it
+        expires, hence its short TTL.
+        """
+        if self.historical_end_date < self.first_complete_commit_date:
+            return []
+        if not settings.CHART_CACHE_TTL_SECONDS:
+            return self._query_historical_datapoints()
+
+        key = self._historical_cache_key
+        try:
+            redis = get_redis_connection()
+            cached = redis.get(key)
+        except (OSError, RedisError) as e:
+            log.warning(f"Error connecting to redis: {e}")
+            redis, cached = None, None
+
+        if cached is not None:
+            inc_counter(CHART_CACHE_COUNTER, labels=dict(result="hit"))
+            return pickle.loads(cached)
+        inc_counter(CHART_CACHE_COUNTER, labels=dict(result="miss"))
+
+        datapoints = self._query_historical_datapoints()
+        if redis is not None:
+            try:
+                redis.set(
+                    key, pickle.dumps(datapoints), ex=settings.CHART_CACHE_TTL_SECONDS
+                )
+            except (OSError, RedisError) as e:
+                log.warning(f"Error connecting to redis: {e}")
+        return datapoints
+
+    def _query_historical_datapoints(self):
+        start = time.perf_counter()
+        datapoints = self._run_historical_query()
+        CHART_QUERY_LATENCIES.labels(segment="historical").observe(
+            time.perf_counter() - start
+        )
+        return datapoints
+
+    def _live_tail_datapoints(self):
+        """
+        Datapoints from the time window containing today up to 'end_date'. Each
+        of them aggregates the latest complete commit of every repository.
+        """
+        dates = []
+        date = max(self.live_tail_start_date, self.first_complete_commit_date)
+        while date <= self.end_date:
+            dates.append(date)
+            date += self.interval_delta
+        if not dates:
+            return []
+
+        start = time.perf_counter()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                WITH latest_commits AS (
+                    SELECT DISTINCT ON (c.repoid)
+                        c.totals
+                    FROM commits c
+                    INNER JOIN repos r ON r.repoid = c.repoid
+                        AND r.branch = c.branch
+                    WHERE r.repoid IN {self.repoids}
+                        AND c.state = 'complete'
+                    ORDER BY c.repoid, c.timestamp DESC NULLS LAST
+                ), parsed_totals AS (
+                    SELECT
+                        COALESCE((totals->>'h')::numeric, 0) AS hits,
+                        COALESCE((totals->>'m')::numeric, 0) AS misses,
+                        COALESCE((totals->>'p')::numeric, 0) AS partials,
+                        COALESCE((totals->>'n')::numeric, 0) AS lines
+                    FROM latest_commits
+                )
+
+                SELECT
+                    SUM(hits) AS total_hits,
+                    SUM(misses) AS total_misses,
+                    SUM(partials) AS total_partials,
+                    SUM(lines) AS total_lines,
+                    ROUND((SUM(hits) + SUM(partials)) / NULLIF(SUM(lines), 0) * 100, 2) AS coverage
+                FROM parsed_totals;
+                """
+            )
+            totals = self._dictfetchall(cursor)[0]
+        CHART_QUERY_LATENCIES.labels(segment="live_tail").observe(
+            time.perf_counter() - start
+        )
+
+        return [
+            {
+                "date": datetime.combine(date, datetime.min.time(), UTC),
+                **totals,
+            }
+            for date in dates
+        ]
+
+    def _run_historical_query(self):
         with connection.cursor() as cursor:
             cursor.execute(
                 f"""
@@ -298,7 +493,7 @@ class ChartQueryRunner:
                         t::date AS "date"
                     FROM generate_series(
                         timestamp '{self.first_complete_commit_date}',
-                        timestamp '{self.end_date}',
+                        timestamp '{self.historical_end_date}',
                         '{self.interval}'
                     ) t
                 ), graph_repos AS (
@@ -330,6 +525,7 @@ class ChartQueryRunner:
                     INNER JOIN graph_repos r ON r.repoid = c.repoid
                         AND r.branch = c.branch
                         AND c.state = 'complete'
+                        AND c.timestamp < timestamp '{self.live_tail_start_date}'
                 ), commits_spine AS (
                     SELECT
                         s.date AS spine_date,
@@ -395,13 +591,12 @@ class ChartQueryRunner:
                     FROM
                         parsed_totals
                     GROUP BY spine_date
-                    ORDER BY spine_date {self.ordering}
+                    ORDER BY spine_date
                 )
 
                 SELECT
                     *
-                FROM summed_totals
-                WHERE date >= DATE_TRUNC('{self.grouping_unit}', timestamp '{self.start_date}');
+                FROM summed_totals;
                 """
             )
 
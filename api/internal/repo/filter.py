@@ -11,7 +11,22 @@ class RepositoryOrderingFilter(filters.OrderingFilter):
     so that they only slow down requests that require them.
     """
 
+    # denormalized totals annotated by `with_cached_latest_commit_totals`
+    cached_totals_fields = {
+        "coverage": "latest_commit_coverage",
+        "lines": "latest_commit_lines",
+        "hits": "latest_commit_hits",
+        "partials": "latest_commit_partials",
+        "misses": "latest_commit_misses",
+    }
+
     def _order_by_totals_field(self, ordering_field, queryset):
+        field_name = ordering_field.lstrip("-")
+        cached_field = self.cached_totals_fields.get(field_name)
+        if cached_field in queryset.query.annotations:
+            descending = ordering_field.startswith("-")
+            return queryset.order_by(f"{'-' if descending else ''}{cached_field}")
+
         if ordering_field in ["coverage", "-coverage"]:
             annotation_args = dict(
                 coverage=Cast(
@@ -8,6 +8,7 @@ from rest_framework.exceptions import PermissionDenied
 from api.internal.repo.filter import RepositoryOrderingFilter
 from api.shared.repo.filter import RepositoryFilters
 from api.shared.repo.mixins import RepositoryViewSetMixin
+from repository_totals.helpers import with_cached_latest_commit_totals
 
 from .serializers import (
     RepoDetailsSerializer,
@@ -58,14 +59,19 @@ class RepositoryViewSet(
         queryset = super().get_queryset()
 
         if self.action == "list":
-            before_date = self.request.query_params.get(
-                "before_date", timezone.now().isoformat()
-            )
+            before_date = self.request.query_params.get("before_date", None)
             branch = self.request.query_params.get("branch", None)
 
-            queryset = queryset.with_latest_commit_totals_before(
-                before_date=before_date, branch=branch, include_previous_totals=True
-            ).with_latest_coverage_change()
+            if before_date is None and branch is None:
+                # current default branch totals are denormalized, no need to
+                # look up the latest commit of each repository
+                queryset = with_cached_latest_commit_totals(queryset)
+            else:
+                queryset = queryset.with_latest_commit_totals_before(
+                    before_date=before_date or timezone.now().isoformat(),
+                    branch=branch,
+                    include_previous_totals=True,
+                ).with_latest_coverage_change()
 
             if self.request.query_params.get("exclude_uncovered", False):
                 queryset = queryset.exclude_uncovered()
@@ -4,9 +4,11 @@ from math import isclose
 from random import randint
 from unittest.mock import patch
 
+import fakeredis
 import pytest
 from dateutil.relativedelta import relativedelta
 from ddf import G
+from django.conf import settings
 from django.test import TestCase, override_settings
 from django.utils import timezone
 from factory.faker import faker
@@ -20,6 +22,7 @@ from api.internal.chart.helpers import (
     ChartQueryRunner,
     annotate_commits_with_totals,
     apply_grouping,
+    truncate_date,
     validate_params,
 )
 from codecov.tests.base_test import InternalAPITest
@@ -672,6 +675,85 @@ class TestChartQueryRunnerQuery(TestCase):
                 },
             ).run_query()
 
+    @override_settings(CHART_CACHE_TTL_SECONDS=3600)
+    @patch("api.internal.chart.helpers.get_redis_connection")
+    def test_query_caches_historical_segment(self, get_redis_connection_mock):
+        redis = fakeredis.FakeStrictRedis()
+        get_redis_connection_mock.return_value = redis
+        self.commit1.timestamp = timezone.now() - timedelta(days=3)
+        self.commit1.save()
+        request_params = {
+            "owner_username": self.org.username,
+            "service": self.org.service,
+            "end_date": str(timezone.now()),
+            "grouping_unit": "day",
+        }
+
+        results = ChartQueryRunner(
+            user=self.user, request_params=request_params
+        ).run_query()
+
+        with patch.object(ChartQueryRunner, "_run_historical_query") as query_mock:
+            cached_results = ChartQueryRunner(
+                user=self.user, request_params=request_params
+            ).run_query()
+            query_mock.assert_not_called()
+
+        assert cached_results == results
+        (key,) = redis.keys("chart/historical/*")
+        assert 0 < redis.ttl(key) <= settings.CHART_CACHE_TTL_SECONDS
+        assert len(results) == 4
+        assert results[0]["total_hits"] == 100
+        assert results[-1]["total_hits"] == 114
+        assert results[-1]["total_lines"] == 145
+
+    @patch("api.internal.chart.helpers.get_redis_connection")
+    def test_query_cache_disabled(self, get_redis_connection_mock):
+        self.commit1.timestamp = timezone.now() - timedelta(days=3)
+        self.commit1.save()
+        request_params = {
+            "owner_username": self.org.username,
+            "service": self.org.service,
+            "end_date": str(timezone.now()),
+            "grouping_unit": "day",
+        }
+
+        results = ChartQueryRunner(
+            user=self.user, request_params=request_params
+        ).run_query()
+
+        get_redis_connection_mock.assert_not_called()
+        assert len(results) == 4
+
+    @override_settings(CHART_CACHE_TTL_SECONDS=3600)
+    @patch("api.internal.chart.helpers.get_redis_connection")
+    def test_query_recomputes_live_tail(self, get_redis_connection_mock):
+        get_redis_connection_mock.return_value = fakeredis.FakeStrictRedis()
+        self.commit1.timestamp = timezone.now() - timedelta(days=3)
+        self.commit1.save()
+        request_params = {
+            "owner_username": self.org.username,
+            "service": self.org.service,
+            "end_date": str(timezone.now()),
+            "grouping_unit": "day",
+        }
+        ChartQueryRunner(user=self.user, request_params=request_params).run_query()
+
+        G(
+            model=Commit,
+            repository=self.repo1,
+            totals={"h": 110, "n": 120, "p": 5, "m": 5},
+            branch=self.repo1.branch,
+            state="complete",
+        )
+        results = ChartQueryRunner(
+            user=self.user, request_params=request_params
+        ).run_query()
+
+        assert results[0]["total_hits"] == 100
+        assert results[-1]["total_hits"] == 124
+        assert results[-1]["total_partials"] == 11
+
 
 class TestChartQueryRunnerHelperMethods(TestCase):
     """
@@ -835,7 +917,7 @@ class TestChartQueryRunnerHelperMethods(TestCase):
             ).end_date == datetime.date(timezone.now())
 
 
-@patch("api.shared.permissions.RepositoryPermissionsService.has_read_permissions")
+@patch("api.shared.permissions.RepositoryPermissionsService.has_read_permissions_on_all")
 class RepositoryCoverageChartTest(InternalAPITest):
     def _retrieve(self, kwargs={}, data={}):
         return self.client.post(
@@ -996,3 +1078,17 @@ class TestOrganizationChartHandler(InternalAPITest):
         assert response.data["coverage"][0]["total_lines"] == 145
         assert response.data["coverage"][0]["total_misses"] == 15
         assert response.data["coverage"][0]["total_partials"] == 16
+
+
+@pytest.mark.parametrize(
+    "grouping_unit,expected",
+    [
+        ("day", datetime(2024, 5, 15).date()),
+        ("week", datetime(2024, 5, 13).date()),
+        ("month", datetime(2024, 5, 1).date()),
+        ("quarter", datetime(2024, 4, 1).date()),
+        ("year", datetime(2024, 1, 1).date()),
+    ],
+)
+def test_truncate_date(grouping_unit, expected):
+    assert truncate_date(datetime(2024, 5, 15).date(), grouping_unit) == expected
@@ -1,7 +1,13 @@
+from unittest.mock import patch
+
+from django.test import TestCase
 from rest_framework.reverse import reverse
 from rest_framework.test import APITestCase
 from shared.django_apps.core.tests.factories import OwnerFactory
 
+from api.shared.pagination import CountingPaginator
+from codecov_auth.models import Owner
+from utils.counts import CountMode
 from utils.test_utils import Client
 
 
@@ -39,3 +45,31 @@ class PageNumberPaginationTests(APITestCase):
         response = _list(query_params={"page_size": "100"})
 
         assert response.data["total_pages"] == 1
+
+
+class CountingPaginatorTests(TestCase):
+    def setUp(self):
+        self.owner = OwnerFactory()
+        OwnerFactory(organizations=[self.owner.ownerid])
+        OwnerFactory(organizations=[self.owner.ownerid])
+        self.queryset = Owner.objects.filter(
+            organizations__contains=[self.owner.ownerid]
+        ).order_by("ownerid")
+
+    def test_exact_count(self):
+        paginator = CountingPaginator(self.queryset, 1)
+        assert paginator.count == 2
+        assert paginator.num_pages == 2
+
+    @patch("api.shared.pagination.count_queryset")
+    def test_count_mode(self, count_queryset_mock):
+        count_queryset_mock.return_value = 100
+
+        paginator = CountingPaginator(self.queryset, 10, count_mode=CountMode.CACHED)
+        assert paginator.count == 100
+        assert paginator.num_pages == 10
+        count_queryset_mock.assert_called_once_with(self.queryset, CountMode.CACHED)
+
+    def test_estimated_count_mode(self):
+        with self.assertRaises(ValueError):
+            CountingPaginator(self.queryset, 10, count_mode=CountMode.ESTIMATED)
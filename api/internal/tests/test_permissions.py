@@ -1,5 +1,6 @@
 from unittest.mock import patch
 
+import fakeredis
 from django.test import TestCase, override_settings
 from rest_framework.exceptions import APIException
 from shared.django_apps.core.tests.factories import OwnerFactory, RepositoryFactory
@@ -84,6 +85,71 @@ class TestRepositoryPermissionsService(TestCase):
         owner.refresh_from_db()
         assert repo.repoid in owner.permission
 
+    @patch("api.shared.repo.repository_accessors.RepoAccessors.get_repos_permissions")
+    def test_has_read_permissions_on_all_only_fetches_unknown_repos(
+        self, get_repos_permissions
+    ):
+        get_repos_permissions.return_value = [(True, False), (True, True)]
+        owner = OwnerFactory(permission=[])
+        own_repo = RepositoryFactory(author=owner)
+        public_repo = RepositoryFactory(private=False)
+        repo1 = RepositoryFactory()
+        repo2 = RepositoryFactory()
+
+        assert self.permissions_service.has_read_permissions_on_all(
+            owner, [own_repo, public_repo, repo1, repo2]
+        )
+
+        get_repos_permissions.assert_called_once_with(owner, [repo1, repo2])
+        owner.refresh_from_db()
+        assert owner.permission == [repo1.repoid, repo2.repoid]
+
+    @patch("api.shared.repo.repository_accessors.RepoAccessors.get_repos_permissions")
+    def test_has_read_permissions_on_all_missing_permission(
+        self, get_repos_permissions
+    ):
+        get_repos_permissions.return_value = [(True, False), (False, False)]
+        owner = OwnerFactory(permission=[])
+        repo1 = RepositoryFactory()
+        repo2 = RepositoryFactory()
+
+        assert not self.permissions_service.has_read_permissions_on_all(
+            owner, [repo1, repo2]
+        )
+
+        owner.refresh_from_db()
+        assert owner.permission == [repo1.repoid]
+
+    def test_has_read_permissions_on_all_no_owner(self):
+        public_repo = RepositoryFactory(private=False)
+        private_repo = RepositoryFactory()
+
+        assert self.permissions_service.has_read_permissions_on_all(None, [public_repo])
+        assert not self.permissions_service.has_read_permissions_on_all(
+            None, [public_repo, private_repo]
+        )
+
+    @override_settings(PROVIDER_PERMISSIONS_CACHE_TTL_SECONDS=300)
+    @patch("services.permissions_cache.get_redis_connection")
+    @patch("api.shared.repo.repository_accessors.RepoAccessors.get_repo_permissions")
+    def test_fetch_provider_permissions_cached(
+        self, get_repo_permissions, get_redis_connection
+    ):
+        get_redis_connection.return_value = fakeredis.FakeStrictRedis()
+        get_repo_permissions.return_value = (False, False)
+        repo = RepositoryFactory()
+        owner = OwnerFactory()
+
+        assert self.permissions_service._fetch_provider_permissions(owner, repo) == (
+            False,
+            False,
+        )
+        assert self.permissions_service._fetch_provider_permissions(owner, repo) == (
+            False,
+            False,
+        )
+        get_repo_permissions.assert_called_once_with(owner, repo)
+
     def test_user_is_activated_returns_false_if_user_not_in_owner_org(self):
         with self.subTest("user orgs is None"):
             user = OwnerFactory()
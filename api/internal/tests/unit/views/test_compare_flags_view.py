@@ -16,7 +16,6 @@ current_file = Path(__file__)
 
 @patch("services.comparison.Comparison.git_comparison", new_callable=PropertyMock)
 @patch("shared.api_archive.archive.ArchiveService.read_chunks")
-@patch("shared.reports.filtered.FilteredReport.apply_diff")
 @patch(
     "api.shared.repo.repository_accessors.RepoAccessors.get_repo_permissions",
     lambda self, repo, user: (True, True),
@@ -42,9 +41,7 @@ class TestCompareFlagsView(InternalAPITest):
         self.client.session["current_owner_id"] = self.repo.author.pk
         self.client.force_login(self.repo.author.user)
 
-    def test_compare_flags___success(
-        self, diff_totals_mock, read_chunks_mock, git_comparison_mock
-    ):
+    def test_compare_flags___success(self, read_chunks_mock, git_comparison_mock):
         head_chunks = open(
             current_file.parent.parent.parent
             / f"samples/{self.commit.commitid}_chunks.txt",
@@ -58,21 +55,6 @@ class TestCompareFlagsView(InternalAPITest):
         read_chunks_mock.side_effect = (
             lambda x: head_chunks if x == self.commit.commitid else base_chunks
         )
-        diff_totals_mock.return_value = ReportTotals(
-            files=0,
-            lines=0,
-            hits=0,
-            misses=0,
-            partials=0,
-            coverage="0",
-            branches=0,
-            methods=0,
-            messages=0,
-            sessions=0,
-            complexity=0,
-            complexity_total=0,
-            diff=0,
-        )
         git_comparison_mock.return_value = {"diff": {"files": {}}}
         response = self._get_compare_flags(
             kwargs={
@@ -106,22 +88,7 @@ class TestCompareFlagsView(InternalAPITest):
                     "partials": 0,
                     "sessions": 1,
                 },
-                "diff_totals": {
-                    "branches": 0,
-                    "complexity": 0,
-                    "complexity_total": 0,
-                    "complexity_ratio": 0,
-                    "coverage": 0,
-                    "diff": 0,
-                    "files": 0,
-                    "hits": 0,
-                    "lines": 0,
-                    "messages": 0,
-                    "methods": 0,
-                    "misses": 0,
-                    "partials": 0,
-                    "sessions": 0,
-                },
+                "diff_totals": None,
                 "head_report_totals": {
                     "branches": 0,
                     "complexity": 0,
@@ -157,22 +124,7 @@ class TestCompareFlagsView(InternalAPITest):
                     "partials": 0,
                     "sessions": 1,
                 },
-                "diff_totals": {
-                    "branches": 0,
-                    "complexity": 0,
-                    "complexity_total": 0,
-                    "complexity_ratio": 0,
-                    "coverage": 0,
-                    "diff": 0,
-                    "files": 0,
-                    "hits": 0,
-                    "lines": 0,
-                    "messages": 0,
-                    "methods": 0,
-                    "misses": 0,
-                    "partials": 0,
-                    "sessions": 0,
-                },
+                "diff_totals": None,
                 "head_report_totals": {
                     "branches": 0,
                     "complexity": 0,
@@ -193,7 +145,7 @@ class TestCompareFlagsView(InternalAPITest):
         ]
 
     def test_compare_flags_with_report_with_cff_and_non_cff(
-        self, diff_totals_mock, read_chunks_mock, git_comparison_mock
+        self, read_chunks_mock, git_comparison_mock
     ):
         commit_with_custom_reports = CommitWithReportFactory.create(
             message="test_report_serializer",
@@ -234,21 +186,6 @@ class TestCompareFlagsView(InternalAPITest):
             if x == commit_with_custom_reports.commitid
             else base_chunks
         )
-        diff_totals_mock.return_value = ReportTotals(
-            files=0,
-            lines=0,
-            hits=0,
-            misses=0,
-            partials=0,
-            coverage="0",
-            branches=0,
-            methods=0,
-            messages=0,
-            sessions=0,
-            complexity=0,
-            complexity_total=0,
-            diff=0,
-        )
         git_comparison_mock.return_value = {"diff": {"files": {}}}
         response = self._get_compare_flags(
             kwargs={
@@ -283,22 +220,7 @@ class TestCompareFlagsView(InternalAPITest):
                     "partials": 0,
                     "sessions": 1,
                 },
-                "diff_totals": {
-                    "branches": 0,
-                    "complexity": 0,
-                    "complexity_total": 0,
-                    "complexity_ratio": 0,
-                    "coverage": 0,
-                    "diff": 0,
-                    "files": 0,
-                    "hits": 0,
-                    "lines": 0,
-                    "messages": 0,
-                    "methods": 0,
-                    "misses": 0,
-                    "partials": 0,
-                    "sessions": 0,
-                },
+                "diff_totals": None,
                 "head_report_totals": {
                     "branches": 0,
                     "complexity": 0,
@@ -333,11 +255,10 @@ class TestCompareFlagsView(InternalAPITest):
     @patch("redis.Redis.get", lambda self, key: None)
     @patch("redis.Redis.set", lambda self, key, val, ex: None)
     def test_compare_flags_view_accepts_pullid_query_param(
-        self, diff_totals_mock, read_chunks_mock, git_comparison_mock
+        self, read_chunks_mock, git_comparison_mock
     ):
         git_comparison_mock.return_value = {"diff": {"files": {}}}
         read_chunks_mock.return_value = ""
-        diff_totals_mock.return_value = ReportTotals()
 
         response = self._get_compare_flags(
             kwargs={
@@ -361,12 +282,11 @@ class TestCompareFlagsView(InternalAPITest):
 
     @patch("services.comparison.FlagComparison.base_report", new_callable=PropertyMock)
     def test_compare_flags_doesnt_crash_if_base_doesnt_have_flags(
-        self, base_flag_mock, diff_totals_mock, read_chunks_mock, git_comparison_mock
+        self, base_flag_mock, read_chunks_mock, git_comparison_mock
     ):
         git_comparison_mock.return_value = {"diff": {"files": {}}}
         read_chunks_mock.return_value = ""
         base_flag_mock.return_value = None
-        diff_totals_mock.return_value = ReportTotals()
 
         # should not crash
         self._get_compare_flags(
@@ -381,16 +301,26 @@ class TestCompareFlagsView(InternalAPITest):
             },
         )
 
-    @patch("shared.reports.resources.Report.totals", new_callable=PropertyMock)
+    @patch("services.report_filters.ReportFilters.totals")
     def test_compare_flags_view_doesnt_crash_if_coverage_is_none(
         self,
         report_totals_mock,
-        diff_totals_mock,
         read_chunks_mock,
         git_comparison_mock,
     ):
-        diff_totals_mock.return_value = ReportTotals()
-        read_chunks_mock.return_value = ""
+        head_chunks = open(
+            current_file.parent.parent.parent
+            / f"samples/{self.commit.commitid}_chunks.txt",
+            "r",
+        ).read()
+        base_chunks = open(
+            current_file.parent.parent.parent
+            / f"samples/{self.parent_commit.commitid}_chunks.txt",
+            "r",
+        ).read()
+        read_chunks_mock.side_effect = (
+            lambda x: head_chunks if x == self.commit.commitid else base_chunks
+        )
         git_comparison_mock.return_value = {"diff": {"files": {}}}
         report_totals_mock.return_value = ReportTotals(
             branches=0,
@@ -409,7 +339,7 @@ class TestCompareFlagsView(InternalAPITest):
         )
 
         # should not crash
-        self._get_compare_flags(
+        response = self._get_compare_flags(
             kwargs={
                 "service": self.repo.author.service,
                 "owner_username": self.repo.author.username,
@@ -420,3 +350,6 @@ class TestCompareFlagsView(InternalAPITest):
                 "head": self.commit.commitid,
             },
         )
+
+        assert response.status_code == 200
+        report_totals_mock.assert_called()
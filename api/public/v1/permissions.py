@@ -6,5 +6,5 @@ class PullUpdatePermission(BasePermission):
         return (
             request.auth
             and "upload" in request.auth.get_scopes()
-            and view.repo in request.auth.get_repositories()
+            and request.auth.allows_repo(view.repo)
         )
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterator
 
 from rest_framework import serializers
 
@@ -14,13 +14,11 @@ from services.comparison import Comparison
 class ComparisonSerializer(BaseComparisonSerializer):
     commit_uploads = CommitSerializer(many=True, source="upload_commits")
 
-    def get_files(self, comparison: Comparison) -> List[dict]:
-        data = []
+    def iter_files(self, comparison: Comparison) -> Iterator[dict]:
         for filename in comparison.head_report.files:
             file = comparison.get_file_comparison(filename, bypass_max_diff=True)
             if self._should_include_file(file):
-                data.append(FileComparisonSerializer(file).data)
-        return data
+                yield FileComparisonSerializer(file).data
 
 
 class ComponentComparisonSerializer(serializers.Serializer):
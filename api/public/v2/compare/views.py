@@ -1,11 +1,14 @@
+from itertools import islice
+
 from distutils.util import strtobool
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import mixins
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 
-from api.public.v2.schema import repo_parameters
+from api.public.v2.schema import files_page_parameters, repo_parameters
 from api.shared.compare.mixins import CompareViewSetMixin
 from api.shared.compare.serializers import (
     FileComparisonSerializer,
@@ -13,6 +16,8 @@ from api.shared.compare.serializers import (
     ImpactedFilesComparisonSerializer,
     ImpactedFileSegmentsSerializer,
 )
+from api.shared.streaming import StreamingJSONResponse, page_slice
+from services.comparison import MissingComparisonReport
 from services.components import ComponentComparison, commit_components
 from services.decorators import torngit_safe
 
@@ -60,13 +65,34 @@ class CompareViewSet(
 
     @extend_schema(
         summary="Comparison",
-        parameters=comparison_parameters,
+        parameters=comparison_parameters + files_page_parameters,
     )
+    @torngit_safe
     def retrieve(self, request, *args, **kwargs):
         """
         Returns a comparison for either a pair of commits or a pull
+
+        The compared files can be paginated by specifying:
+        * `page` - page of the compared files to return
+        * `page_size` - number of compared files per page
+
+        The compared files are sent as they are compared: if an error occurs
+        meanwhile, the response body is truncated (i.e. it isn't valid JSON).
         """
-        return super().retrieve(request, *args, **kwargs)
+        comparison = self.get_retrieve_comparison()
+        serializer = self.get_serializer(comparison)
+
+        # everything but the files (and the first of them) is serialized before
+        # the response starts, the files are compared and sent one at a time
+        serializer.fields.pop("files")
+        files = serializer.iter_files(comparison)
+        page = page_slice(request)
+        if page is not None:
+            files = islice(files, page.start, page.stop)
+        try:
+            return StreamingJSONResponse(serializer.data, "files", files)
+        except MissingComparisonReport:
+            raise NotFound("Raw report not found for base or head reference.")
 
     @extend_schema(
         summary="File comparison",
@@ -8,16 +8,17 @@ from rest_framework.decorators import action
 from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.response import Response
 from shared.reports.resources import Report
-from shared.utils.match import match
 
+import services.report as report_service
 from api.public.v2.report.serializers import (
     CoverageReportSerializer,
     FileReportSerializer,
 )
-from api.public.v2.schema import repo_parameters
+from api.public.v2.schema import files_page_parameters, repo_parameters
 from api.shared.mixins import RepoPropertyMixin
 from api.shared.permissions import RepositoryArtifactPermissions, SuperTokenPermissions
 from api.shared.report.serializers import TreeSerializer
+from api.shared.streaming import StreamingJSONResponse, page_slice
 from codecov_auth.authentication import (
     SuperTokenAuthentication,
     UserTokenAuthentication,
@@ -25,6 +26,7 @@ from codecov_auth.authentication import (
 from core.models import Commit
 from services.components import commit_components
 from services.path import ReportPaths, dashboard_commit_file_url
+from utils.match import path_matcher
 
 
 class ReportMixin:
@@ -108,7 +110,7 @@ class BaseReportViewSet(
                     f"The component {component_id} does not exist in commit {commit.commitid}"
                 )
 
-            if path and not match(component.paths, path):
+            if path and not path_matcher(component.paths).match(path):
                 # empty report since the path is not part of the component
                 return Report()
 
@@ -155,7 +157,17 @@ class BaseReportViewSet(
     def retrieve(self, request, *args, **kwargs):
         report = self.get_object()
         serializer = self.get_serializer(report)
-        return Response(serializer.data)
+
+        # everything but the files (and the first of them) is serialized before
+        # the response starts, the files are loaded and sent one at a time
+        serializer.fields.pop("files")
+        filenames = report.files
+        page = page_slice(request)
+        if page is not None:
+            filenames = filenames[page]
+        return StreamingJSONResponse(
+            serializer.data, "files", serializer.iter_files(report, filenames)
+        )
 
 
 class TotalsViewSet(BaseReportViewSet):
@@ -164,7 +176,7 @@ class TotalsViewSet(BaseReportViewSet):
         context.update({"include_line_coverage": False})
         return context
 
-    @extend_schema(summary="Commit coverage totals")
+    @extend_schema(summary="Commit coverage totals", parameters=files_page_parameters)
     def retrieve(self, request, *args, **kwargs):
         """
         Returns the coverage totals for a given commit and the
@@ -178,6 +190,13 @@ class TotalsViewSet(BaseReportViewSet):
         * `path` - only show totals for pathnames that start with this value
         * `flag` - only show totals that applies to the specified flag name
         * `component_id` - only show totals that applies to the specified component
+
+        The files can be paginated by specifying:
+        * `page` - page of the files to return
+        * `page_size` - number of files per page
+
+        The files are sent as they are loaded: if an error occurs meanwhile, the
+        response body is truncated (i.e. it isn't valid JSON).
         """
         return super().retrieve(request, *args, **kwargs)
 
@@ -199,7 +218,7 @@ class ReportViewSet(BaseReportViewSet):
         context.update({"include_line_coverage": True})
         return context
 
-    @extend_schema(summary="Commit coverage report")
+    @extend_schema(summary="Commit coverage report", parameters=files_page_parameters)
     def retrieve(self, request, *args, **kwargs):
         """
         Similar to the coverage totals endpoint but also returns line-by-line
@@ -213,6 +232,13 @@ class ReportViewSet(BaseReportViewSet):
         * `path` - only show report info for pathnames that start with this value
         * `flag` - only show report info that applies to the specified flag name
         * `component_id` - only show report info that applies to the specified component
+
+        The files can be paginated by specifying:
+        * `page` - page of the files to return
+        * `page_size` - number of files per page
+
+        The files are sent as they are loaded: if an error occurs meanwhile, the
+        response body is truncated (i.e. it isn't valid JSON).
         """
         return super().retrieve(request, *args, **kwargs)
 
@@ -310,32 +336,35 @@ class FileReportViewSet(
             raise ValidationError("walk_back must be <= 20")
 
         self.commit = self.get_commit()
-        report = self.commit.full_report
-
         oldest_sha = self.request.query_params.get("oldest_sha")
 
+        # ancestors are checked with their file manifest, only the reports of the
+        # commits listing the file are loaded
+        report, looked_up = None, False
         for i in range(walk_back):
-            if self._is_valid_commit(self.commit) and self._is_valid_report(
-                report, self.path
-            ):
-                break
-            else:
-                # walk commit ancestors until we find coverage info for the given path
-                if not self.commit.parent_commit_id:
-                    report = None
+            if self._is_valid_commit(self.commit):
+                report = self._report_with_file(self.commit, self.path)
+                if report is not None:
+                    looked_up = True
                     break
-                self.commit = self.repo.commits.filter(
+
+            # walk commit ancestors until we find coverage info for the given path
+            parent = None
+            if self.commit.parent_commit_id:
+                parent = self.repo.commits.filter(
                     commitid=self.commit.parent_commit_id
                 ).first()
-                if not self.commit:
-                    report = None
-                    break
-                report = self.commit.full_report
+            if not parent:
+                report, looked_up = None, True
+                break
+            self.commit = parent
 
-                if oldest_sha and oldest_sha == self.commit.commitid:
-                    break
+            if oldest_sha and oldest_sha == self.commit.commitid:
+                break
 
-        if not self._is_valid_report(report, self.path):
+        if not looked_up:
+            report = self._report_with_file(self.commit, self.path)
+        if report is None:
             raise NotFound(f"coverage info not found for path '{self.path}'")
 
         return report.get(self.path)
@@ -366,6 +395,16 @@ class FileReportViewSet(
     def _is_valid_commit(self, commit: Commit) -> bool:
         return commit.state == Commit.CommitStates.COMPLETE
 
+    def _has_file(self, commit: Commit, path: str) -> bool:
+        manifest = report_service.commit_file_manifest(commit)
+        return manifest is not None and path in manifest
+
+    def _report_with_file(self, commit: Commit, path: str) -> Optional[Report]:
+        if not self._has_file(commit, path):
+            return None
+        report = commit.full_report
+        return report if self._is_valid_report(report, path) else None
+
     def _is_valid_report(self, report: Report, path: str) -> bool:
         if report is None:
             return False
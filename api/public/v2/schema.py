@@ -27,3 +27,18 @@ repo_name_parameter = OpenApiParameter(
 
 owner_parameters = [service_parameter, owner_username_parameter]
 repo_parameters = owner_parameters + [repo_name_parameter]
+
+files_page_parameters = [
+    OpenApiParameter(
+        "page",
+        OpenApiTypes.INT,
+        OpenApiParameter.QUERY,
+        description="page of the files to return (all files by default)",
+    ),
+    OpenApiParameter(
+        "page_size",
+        OpenApiTypes.INT,
+        OpenApiParameter.QUERY,
+        description="number of files per page",
+    ),
+]
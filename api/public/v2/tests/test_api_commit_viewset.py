@@ -1,3 +1,4 @@
+from datetime import timedelta
 from unittest.mock import patch
 
 from django.test import TestCase
@@ -161,6 +162,39 @@ class RepoCommitListTestCase(BaseRepoCommitTestCase):
             ],
         }
 
+    def test_commit_list_cursor_pagination(self, get_repo_permissions):
+        get_repo_permissions.return_value = (True, True)
+
+        older_commit = CommitFactory(
+            author=self.org,
+            repository=self.repo,
+            timestamp=self.commit.timestamp - timedelta(days=1),
+        )
+
+        url = reverse(
+            "api-v2-commits-list",
+            kwargs={
+                "service": self.org.service,
+                "owner_username": self.org.username,
+                "repo_name": self.repo.name,
+            },
+        )
+        response = self.client.get(f"{url}?page_size=1&cursor=")
+        assert response.status_code == 200
+        data = response.json()
+        assert [commit["commitid"] for commit in data["results"]] == [
+            self.commit.commitid
+        ]
+        assert data["previous"] is None
+
+        response = self.client.get(data["next"])
+        assert response.status_code == 200
+        data = response.json()
+        assert [commit["commitid"] for commit in data["results"]] == [
+            older_commit.commitid
+        ]
+        assert data["next"] is None
+
     def test_commit_list_null_coverage(self, get_repo_permissions):
         get_repo_permissions.return_value = (True, True)
 
@@ -23,7 +23,7 @@ from compare.models import CommitComparison
 from compare.tests.factories import CommitComparisonFactory
 from services.comparison import ComparisonReport
 from services.components import Component
-from utils.test_utils import APIClient
+from utils.test_utils import APIClient, streamed_json
 
 
 def sample_report1():
@@ -407,7 +407,34 @@ class TestCompareViewSetRetrieve(APITestCase):
         response = self._get_comparison()
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data["files"] == self.expected_files
+        assert streamed_json(response)["files"] == self.expected_files
+
+    def test_files_page(self, adapter_mock, base_report_mock, head_report_mock):
+        adapter_mock.return_value = self.mocked_compare_adapter
+        base_report_mock.return_value = self.base_report
+        head_report_mock.return_value = self.head_report
+
+        response = self._get_comparison(
+            query_params={
+                "base": self.base.commitid,
+                "head": self.head.commitid,
+                "page": 1,
+                "page_size": 1,
+            }
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert streamed_json(response)["files"] == self.expected_files
+
+        response = self._get_comparison(
+            query_params={
+                "base": self.base.commitid,
+                "head": self.head.commitid,
+                "page": 2,
+                "page_size": 1,
+            }
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert streamed_json(response)["files"] == []
 
     def test_returns_404_if_base_or_head_references_not_found(
         self, adapter_mock, base_report_mock, head_report_mock
@@ -450,7 +477,7 @@ class TestCompareViewSetRetrieve(APITestCase):
         )
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data["files"] == self.expected_files
+        assert streamed_json(response)["files"] == self.expected_files
 
     @patch("redis.Redis.get", lambda self, key: None)
     @patch("redis.Redis.set", lambda self, key, val, ex: None)
@@ -477,7 +504,7 @@ class TestCompareViewSetRetrieve(APITestCase):
         )
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data["files"] == []
+        assert streamed_json(response)["files"] == []
 
         response = self._get_comparison(
             query_params={
@@ -487,7 +514,7 @@ class TestCompareViewSetRetrieve(APITestCase):
         )
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data["files"] == self.expected_files
+        assert streamed_json(response)["files"] == self.expected_files
 
     def test_pullid_with_nonexistent_base_returns_404(
         self, adapter_mock, base_report_mock, head_report_mock
@@ -592,7 +619,7 @@ class TestCompareViewSetRetrieve(APITestCase):
         response = self._get_comparison()
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data["totals"]["base"] is None
+        assert streamed_json(response)["totals"]["base"] is None
 
     def test_no_raw_reports_returns_404(
         self, adapter_mock, base_report_mock, head_report_mock
@@ -655,7 +682,7 @@ class TestCompareViewSetRetrieve(APITestCase):
         update_base_report_mock.assert_called_once()
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data["files"] == self.expected_files
+        assert streamed_json(response)["files"] == self.expected_files
 
     def test_flags_comparison(self, adapter_mock, base_report_mock, head_report_mock):
         adapter_mock.return_value = self.mocked_compare_adapter
@@ -13,6 +13,7 @@ from shared.reports.resources import Report, ReportFile, ReportLine
 from shared.utils.sessions import Session
 
 from core.models import Branch
+from services.report import FileManifest
 from utils.test_utils import APIClient
 
 
@@ -90,10 +91,37 @@ class FileReportViewSetTestCase(TestCase):
         url = f"{url}?{qs}"
         return self.client.get(url)
 
+    def _mock_reports(self, build_report_from_commit, commit_file_manifest, reports):
+        # reports of commit3, commit2 and commit1
+        reports = dict(
+            zip(
+                [self.commit3.commitid, self.commit2.commitid, self.commit1.commitid],
+                reports,
+            )
+        )
+
+        def manifest(commit):
+            report = reports.get(commit.commitid)
+            if report is None:
+                return None
+            return FileManifest(
+                {name: [i, None] for i, name in enumerate(report.files)}
+            )
+
+        commit_file_manifest.side_effect = manifest
+        build_report_from_commit.side_effect = lambda commit: reports.get(
+            commit.commitid
+        )
+
+    @patch("services.report.commit_file_manifest")
     @patch("shared.reports.api_report_service.build_report_from_commit")
-    def test_file_report(self, build_report_from_commit, get_repo_permissions):
+    def test_file_report(
+        self, build_report_from_commit, commit_file_manifest, get_repo_permissions
+    ):
         get_repo_permissions.return_value = (True, True)
-        build_report_from_commit.side_effect = [sample_report()]
+        self._mock_reports(
+            build_report_from_commit, commit_file_manifest, [sample_report()]
+        )
 
         res = self._request_file_report(path="foo/file1.py")
         assert res.status_code == 200
@@ -131,38 +159,51 @@ class FileReportViewSetTestCase(TestCase):
 
         build_report_from_commit.assert_called_once_with(self.commit3)
 
+    @patch("services.report.commit_file_manifest")
     @patch("shared.reports.api_report_service.build_report_from_commit")
     def test_file_report_no_walk_back(
-        self, build_report_from_commit, get_repo_permissions
+        self, build_report_from_commit, commit_file_manifest, get_repo_permissions
     ):
         get_repo_permissions.return_value = (True, True)
-        build_report_from_commit.side_effect = [None, sample_report()]
+        self._mock_reports(
+            build_report_from_commit, commit_file_manifest, [None, sample_report()]
+        )
 
         res = self._request_file_report(path="foo/file1.py")
         assert res.status_code == 404
 
-        build_report_from_commit.assert_called_once_with(self.commit3)
+        commit_file_manifest.assert_called_once_with(self.commit3)
+        build_report_from_commit.assert_not_called()
 
+    @patch("services.report.commit_file_manifest")
     @patch("shared.reports.api_report_service.build_report_from_commit")
     def test_file_report_not_enough_walk_back(
-        self, build_report_from_commit, get_repo_permissions
+        self, build_report_from_commit, commit_file_manifest, get_repo_permissions
     ):
         get_repo_permissions.return_value = (True, True)
-        build_report_from_commit.side_effect = [None, None, sample_report()]
+        self._mock_reports(
+            build_report_from_commit,
+            commit_file_manifest,
+            [None, None, sample_report()],
+        )
 
         res = self._request_file_report(path="foo/file1.py", walk_back=1)
         assert res.status_code == 404
 
-        build_report_from_commit.assert_has_calls(
-            [call(self.commit3), call(self.commit2)]
-        )
+        commit_file_manifest.assert_has_calls([call(self.commit3), call(self.commit2)])
+        build_report_from_commit.assert_not_called()
 
+    @patch("services.report.commit_file_manifest")
     @patch("shared.reports.api_report_service.build_report_from_commit")
     def test_file_report_with_walk_back(
-        self, build_report_from_commit, get_repo_permissions
+        self, build_report_from_commit, commit_file_manifest, get_repo_permissions
     ):
         get_repo_permissions.return_value = (True, True)
-        build_report_from_commit.side_effect = [None, None, sample_report()]
+        self._mock_reports(
+            build_report_from_commit,
+            commit_file_manifest,
+            [None, None, sample_report()],
+        )
 
         res = self._request_file_report(path="foo/file1.py", walk_back=2)
         assert res.status_code == 200
@@ -198,16 +239,22 @@ class FileReportViewSetTestCase(TestCase):
             "commit_file_url": f"{settings.CODECOV_DASHBOARD_URL}/{self.service}/{self.username}/{self.repo_name}/commit/{self.commit1.commitid}/blob/foo/file1.py",
         }
 
-        build_report_from_commit.assert_has_calls(
+        commit_file_manifest.assert_has_calls(
             [call(self.commit3), call(self.commit2), call(self.commit1)]
         )
+        build_report_from_commit.assert_called_once_with(self.commit1)
 
+    @patch("services.report.commit_file_manifest")
     @patch("shared.reports.api_report_service.build_report_from_commit")
     def test_file_report_with_walk_back_oldest_sha(
-        self, build_report_from_commit, get_repo_permissions
+        self, build_report_from_commit, commit_file_manifest, get_repo_permissions
     ):
         get_repo_permissions.return_value = (True, True)
-        build_report_from_commit.side_effect = [None, None, sample_report()]
+        self._mock_reports(
+            build_report_from_commit,
+            commit_file_manifest,
+            [None, None, sample_report()],
+        )
 
         res = self._request_file_report(
             path="foo/file1.py", walk_back=2, oldest_sha=self.commit2.commitid
@@ -215,40 +262,49 @@ class FileReportViewSetTestCase(TestCase):
         assert res.status_code == 404
 
         # does not walk back to commit1
-        build_report_from_commit.assert_has_calls(
-            [call(self.commit3), call(self.commit2)]
-        )
+        commit_file_manifest.assert_has_calls([call(self.commit3), call(self.commit2)])
+        build_report_from_commit.assert_not_called()
 
+    @patch("services.report.commit_file_manifest")
     @patch("shared.reports.api_report_service.build_report_from_commit")
     def test_file_report_large_walk_back(
-        self, build_report_from_commit, get_repo_permissions
+        self, build_report_from_commit, commit_file_manifest, get_repo_permissions
     ):
         get_repo_permissions.return_value = (True, True)
-        build_report_from_commit.side_effect = [sample_report()]
+        self._mock_reports(
+            build_report_from_commit, commit_file_manifest, [sample_report()]
+        )
 
         res = self._request_file_report(path="foo/file1.py", walk_back=21)
         assert res.status_code == 400
 
+    @patch("services.report.commit_file_manifest")
     @patch("shared.reports.api_report_service.build_report_from_commit")
     def test_file_report_walk_back_no_parent(
-        self, build_report_from_commit, get_repo_permissions
+        self, build_report_from_commit, commit_file_manifest, get_repo_permissions
     ):
         get_repo_permissions.return_value = (True, True)
-        build_report_from_commit.side_effect = [None, None, None]
+        self._mock_reports(
+            build_report_from_commit, commit_file_manifest, [None, None, None]
+        )
 
         res = self._request_file_report(path="foo/file1.py", walk_back=20)
         assert res.status_code == 404
 
-        build_report_from_commit.assert_has_calls(
+        commit_file_manifest.assert_has_calls(
             [call(self.commit3), call(self.commit2), call(self.commit1)]
         )
+        build_report_from_commit.assert_not_called()
 
+    @patch("services.report.commit_file_manifest")
     @patch("shared.reports.api_report_service.build_report_from_commit")
     def test_file_report_walk_back_commit_not_found(
-        self, build_report_from_commit, get_repo_permissions
+        self, build_report_from_commit, commit_file_manifest, get_repo_permissions
     ):
         get_repo_permissions.return_value = (True, True)
-        build_report_from_commit.side_effect = [None, None, None]
+        self._mock_reports(
+            build_report_from_commit, commit_file_manifest, [None, None, None]
+        )
 
         self.commit3.parent_commit_id = "wrong"
         self.commit3.save()
@@ -256,22 +312,28 @@ class FileReportViewSetTestCase(TestCase):
         res = self._request_file_report(path="foo/file1.py", walk_back=20)
         assert res.status_code == 404
 
-        build_report_from_commit.assert_has_calls([call(self.commit3)])
+        commit_file_manifest.assert_has_calls([call(self.commit3)])
+        build_report_from_commit.assert_not_called()
 
+    @patch("services.report.commit_file_manifest")
     @patch("shared.reports.api_report_service.build_report_from_commit")
     def test_file_report_walk_back_commit_not_complete(
-        self, build_report_from_commit, get_repo_permissions
+        self, build_report_from_commit, commit_file_manifest, get_repo_permissions
     ):
         get_repo_permissions.return_value = (True, True)
 
         self.commit1.state = "pending"
         self.commit1.save()
 
-        build_report_from_commit.side_effect = [
-            sample_report(),  # skips since the state is pending
-            None,  # skips since there's no report
-            sample_report(),  # found
-        ]
+        self._mock_reports(
+            build_report_from_commit,
+            commit_file_manifest,
+            [
+                sample_report(),  # skips since the state is pending
+                None,  # skips since there's no report
+                sample_report(),  # found
+            ],
+        )
 
         res = self._request_file_report(path="foo/file1.py", walk_back=20)
         assert res.status_code == 200
@@ -307,50 +369,94 @@ class FileReportViewSetTestCase(TestCase):
             "commit_file_url": f"{settings.CODECOV_DASHBOARD_URL}/{self.service}/{self.username}/{self.repo_name}/commit/{self.commit3.commitid}/blob/foo/file1.py",
         }
 
-        build_report_from_commit.assert_has_calls([call(self.commit3)])
+        commit_file_manifest.assert_has_calls([call(self.commit3)])
+        build_report_from_commit.assert_called_once_with(self.commit3)
 
+    @patch("services.report.commit_file_manifest")
     @patch("shared.reports.api_report_service.build_report_from_commit")
     def test_file_report_walk_back_found(
-        self, build_report_from_commit, get_repo_permissions
+        self, build_report_from_commit, commit_file_manifest, get_repo_permissions
     ):
         get_repo_permissions.return_value = (True, True)
-        build_report_from_commit.side_effect = [None, sample_report(), sample_report()]
+        self._mock_reports(
+            build_report_from_commit,
+            commit_file_manifest,
+            [None, sample_report(), sample_report()],
+        )
 
         res = self._request_file_report(path="foo/file1.py", walk_back=20)
         assert res.status_code == 200
 
+        commit_file_manifest.assert_has_calls([call(self.commit3), call(self.commit2)])
+        build_report_from_commit.assert_called_once_with(self.commit2)
+
+    @patch("services.report.commit_file_manifest")
+    @patch("shared.reports.api_report_service.build_report_from_commit")
+    def test_file_report_walk_back_file_missing_from_report(
+        self, build_report_from_commit, commit_file_manifest, get_repo_permissions
+    ):
+        get_repo_permissions.return_value = (True, True)
+        self._mock_reports(
+            build_report_from_commit,
+            commit_file_manifest,
+            [None, sample_report(), sample_report()],
+        )
+        # commit2's manifest lists the file but its report doesn't have it
+        report_without_file = Report()
+        report_without_file.append(sample_report().get("bar/file2.py"))
+        build_report_from_commit.side_effect = lambda commit: (
+            report_without_file
+            if commit.commitid == self.commit2.commitid
+            else sample_report()
+        )
+
+        res = self._request_file_report(path="foo/file1.py", walk_back=20)
+        assert res.status_code == 200
+        assert res.json()["commit_sha"] == self.commit1.commitid
+
         build_report_from_commit.assert_has_calls(
-            [call(self.commit3), call(self.commit2)]
+            [call(self.commit2), call(self.commit1)]
         )
 
+    @patch("services.report.commit_file_manifest")
     @patch("shared.reports.api_report_service.build_report_from_commit")
     def test_file_report_missing_file(
-        self, build_report_from_commit, get_repo_permissions
+        self, build_report_from_commit, commit_file_manifest, get_repo_permissions
     ):
         get_repo_permissions.return_value = (True, True)
-        build_report_from_commit.side_effect = [
-            sample_report(),
-            sample_report(),
-            sample_report(),
-        ]
+        self._mock_reports(
+            build_report_from_commit,
+            commit_file_manifest,
+            [
+                sample_report(),
+                sample_report(),
+                sample_report(),
+            ],
+        )
 
         res = self._request_file_report(path="bar/file1.py", walk_back=20)
         assert res.status_code == 404
 
-        build_report_from_commit.assert_has_calls(
+        commit_file_manifest.assert_has_calls(
             [call(self.commit3), call(self.commit2), call(self.commit1)]
         )
+        build_report_from_commit.assert_not_called()
 
+    @patch("services.report.commit_file_manifest")
     @patch("shared.reports.api_report_service.build_report_from_commit")
     def test_file_report_missing_parent_commit(
-        self, build_report_from_commit, get_repo_permissions
+        self, build_report_from_commit, commit_file_manifest, get_repo_permissions
     ):
         get_repo_permissions.return_value = (True, True)
-        build_report_from_commit.side_effect = [
-            sample_report(),
-            sample_report(),
-            sample_report(),
-        ]
+        self._mock_reports(
+            build_report_from_commit,
+            commit_file_manifest,
+            [
+                sample_report(),
+                sample_report(),
+                sample_report(),
+            ],
+        )
 
         self.commit3.parent_commit_id = None
         self.commit3.save()
@@ -358,4 +464,5 @@ class FileReportViewSetTestCase(TestCase):
         res = self._request_file_report(path="bar/file1.py", walk_back=20)
         assert res.status_code == 404
 
-        build_report_from_commit.assert_has_calls([call(self.commit3)])
+        commit_file_manifest.assert_has_calls([call(self.commit3)])
+        build_report_from_commit.assert_not_called()
@@ -17,7 +17,7 @@ from shared.reports.resources import Report, ReportFile, ReportLine
 from shared.utils.sessions import Session
 
 from services.components import Component
-from utils.test_utils import APIClient
+from utils.test_utils import APIClient, streamed_json
 
 
 def sample_report():
@@ -172,7 +172,7 @@ class ReportViewSetTestCase(TestCase):
 
         res = self._request_report()
         assert res.status_code == 200
-        assert res.json() == {
+        assert streamed_json(res) == {
             "totals": {
                 "files": 2,
                 "lines": 10,
@@ -245,6 +245,65 @@ class ReportViewSetTestCase(TestCase):
 
         build_report_from_commit.assert_called_once_with(self.commit1)
 
+    @patch("shared.reports.api_report_service.build_report_from_commit")
+    def test_report_streamed(self, build_report_from_commit, get_repo_permissions):
+        get_repo_permissions.return_value = (True, True)
+        build_report_from_commit.return_value = sample_report()
+
+        res = self._request_report()
+        assert res.status_code == 200
+        assert res.streaming
+        assert res["Content-Type"] == "application/json"
+
+    @patch("shared.reports.api_report_service.build_report_from_commit")
+    def test_report_first_file_error(
+        self, build_report_from_commit, get_repo_permissions
+    ):
+        get_repo_permissions.return_value = (True, True)
+        build_report_from_commit.return_value = sample_report()
+
+        def iter_files(serializer, report, filenames):
+            raise ValueError("error loading the file")
+            yield
+
+        # the first file is loaded before the response starts, so it gets an error
+        # status instead of a truncated body
+        self.client.raise_request_exception = False
+        with patch(
+            "api.shared.commit.serializers.ReportSerializer.iter_files", iter_files
+        ):
+            res = self._request_report()
+        assert res.status_code == 500
+
+    @patch("shared.reports.api_report_service.build_report_from_commit")
+    def test_report_files_page(self, build_report_from_commit, get_repo_permissions):
+        get_repo_permissions.return_value = (True, True)
+        build_report_from_commit.return_value = sample_report()
+
+        res = self._request_report(page=2, page_size=1)
+        assert res.status_code == 200
+        data = streamed_json(res)
+        # the totals are still those of the whole report
+        assert data["totals"]["files"] == 2
+        assert [file["name"] for file in data["files"]] == ["bar/file2.py"]
+
+        res = self._request_report(page=3, page_size=1)
+        assert res.status_code == 200
+        assert streamed_json(res)["files"] == []
+
+    @patch("shared.reports.api_report_service.build_report_from_commit")
+    def test_report_invalid_files_page(
+        self, build_report_from_commit, get_repo_permissions
+    ):
+        get_repo_permissions.return_value = (True, True)
+        build_report_from_commit.return_value = sample_report()
+
+        res = self._request_report(page=0)
+        assert res.status_code == 400
+
+        res = self._request_report(page_size="all")
+        assert res.status_code == 400
+
     @patch("shared.reports.api_report_service.build_report_from_commit")
     def test_report_commit_sha(self, build_report_from_commit, get_repo_permissions):
         get_repo_permissions.return_value = (True, True)
@@ -252,7 +311,7 @@ class ReportViewSetTestCase(TestCase):
 
         res = self._request_report(sha=self.commit2.commitid)
         assert res.status_code == 200
-        assert res.json() == {
+        assert streamed_json(res) == {
             "totals": {
                 "files": 2,
                 "lines": 10,
@@ -335,7 +394,7 @@ class ReportViewSetTestCase(TestCase):
         sha = "aSD*FAJ#GVUAJS-random-sha"
         res = self._request_report(sha=sha)
         assert res.status_code == 404
-        assert res.json() == {
+        assert streamed_json(res) == {
             "detail": f"The commit {sha} is not in our records. Please specify valid commit."
         }
 
@@ -356,7 +415,7 @@ class ReportViewSetTestCase(TestCase):
 
         res = self._request_report(branch="test-branch")
         assert res.status_code == 200
-        assert res.json() == {
+        assert streamed_json(res) == {
             "totals": {
                 "files": 2,
                 "lines": 10,
@@ -439,7 +498,7 @@ class ReportViewSetTestCase(TestCase):
         branch = "random-nonexistent-branch-aaa"
         res = self._request_report(branch=branch)
         assert res.status_code == 404
-        assert res.json() == {
+        assert streamed_json(res) == {
             "detail": f"The branch '{branch}' in not in our records. Please provide a valid branch name."
         }
 
@@ -450,7 +509,7 @@ class ReportViewSetTestCase(TestCase):
 
         res = self._request_report(path="bar")
         assert res.status_code == 200
-        assert res.json() == {
+        assert streamed_json(res) == {
             "totals": {
                 "files": 1,
                 "lines": 2,
@@ -507,14 +566,14 @@ class ReportViewSetTestCase(TestCase):
         # Only match App/file1.py
         res = self._request_report(path="App/")
         assert res.status_code == 200
-        data = res.json()
+        data = streamed_json(res)
         assert data["totals"]["files"] == 1
         assert data["files"][0]["name"] == "App/file1.py"
 
         # Match both files
         res = self._request_report(path="App")
         assert res.status_code == 200
-        data = res.json()
+        data = streamed_json(res)
         assert data["totals"]["files"] == 2
         assert data["files"][0]["name"] in ["App/file1.py", "AppOld/file2.py"]
 
@@ -530,7 +589,7 @@ class ReportViewSetTestCase(TestCase):
 
         res = self._request_report(path=path)
         assert res.status_code == 404
-        assert res.json() == {
+        assert streamed_json(res) == {
             "detail": f"No files or directories found matching path: {path}"
         }
 
@@ -543,7 +602,7 @@ class ReportViewSetTestCase(TestCase):
 
         res = self._request_report(flag="flag-a")
         assert res.status_code == 200
-        assert res.json() == {
+        assert streamed_json(res) == {
             "totals": {
                 "files": 1,
                 "lines": 8,
@@ -618,7 +677,7 @@ class ReportViewSetTestCase(TestCase):
 
         res = self._request_report(flag="flag-b")
         assert res.status_code == 200
-        assert res.json() == {
+        assert streamed_json(res) == {
             "totals": {
                 "files": 1,
                 "lines": 2,
@@ -691,7 +750,7 @@ class ReportViewSetTestCase(TestCase):
 
         res = self._request_report(flag="flag-a", path="foo")
         assert res.status_code == 200
-        assert res.json() == {
+        assert streamed_json(res) == {
             "totals": {
                 "files": 1,
                 "lines": 8,
@@ -793,7 +852,7 @@ class ReportViewSetTestCase(TestCase):
         build_report_from_commit.return_value = sample_report()
         res = self._request_report("testaxs3o76rdcdpfzexuccx3uatui2nw73r")
         assert res.status_code == 200
-        assert res.json() == {
+        assert streamed_json(res) == {
             "totals": {
                 "files": 2,
                 "lines": 10,
@@ -880,7 +939,7 @@ class ReportViewSetTestCase(TestCase):
         )
         res = self._request_report(user_token.token)
         assert res.status_code == 200
-        assert res.json() == {
+        assert streamed_json(res) == {
             "totals": {
                 "files": 2,
                 "lines": 10,
@@ -980,7 +1039,7 @@ class ReportViewSetTestCase(TestCase):
         res = self._request_report(component_id="foo")
         commit_components.assert_called_once_with(self.commit1, self.org)
         assert res.status_code == 200
-        assert res.json() == {
+        assert streamed_json(res) == {
             "totals": {
                 "files": 1,
                 "lines": 8,
@@ -1033,7 +1092,7 @@ class ReportViewSetTestCase(TestCase):
 
         res = self._request_report(component_id="bar")
         assert res.status_code == 200
-        assert res.json() == {
+        assert streamed_json(res) == {
             "totals": {
                 "files": 1,
                 "lines": 2,
@@ -1080,7 +1139,7 @@ class ReportViewSetTestCase(TestCase):
 
         res = self._request_report(component_id="foo", path="bar")
         assert res.status_code == 200
-        assert res.json() == {
+        assert streamed_json(res) == {
             "totals": {
                 "files": 0,
                 "lines": 0,
@@ -1103,7 +1162,7 @@ class ReportViewSetTestCase(TestCase):
 
         res = self._request_report(component_id="foo", flag="flag-b")
         assert res.status_code == 200
-        assert res.json() == {
+        assert streamed_json(res) == {
             "totals": {
                 "files": 0,
                 "lines": 0,
@@ -14,7 +14,7 @@ from shared.reports.resources import Report, ReportFile, ReportLine
 from shared.utils.sessions import Session
 
 from services.components import Component
-from utils.test_utils import APIClient
+from utils.test_utils import APIClient, streamed_json
 
 
 def sample_report():
@@ -154,7 +154,7 @@ class TotalsViewSetTestCase(TestCase):
 
         res = self._request_report()
         assert res.status_code == 200
-        assert res.json() == {
+        assert streamed_json(res) == {
             "totals": {
                 "files": 2,
                 "lines": 10,
@@ -223,7 +223,7 @@ class TotalsViewSetTestCase(TestCase):
 
         res = self._request_report(sha=self.commit2.commitid)
         assert res.status_code == 200
-        assert res.json() == {
+        assert streamed_json(res) == {
             "totals": {
                 "files": 2,
                 "lines": 10,
@@ -295,7 +295,7 @@ class TotalsViewSetTestCase(TestCase):
         sha = "aSD*FAJ#GVUAJS-random-sha"
         res = self._request_report(sha=sha)
         assert res.status_code == 404
-        assert res.json() == {
+        assert streamed_json(res) == {
             "detail": f"The commit {sha} is not in our records. Please specify valid commit."
         }
 
@@ -306,7 +306,7 @@ class TotalsViewSetTestCase(TestCase):
 
         res = self._request_report(branch="test-branch")
         assert res.status_code == 200
-        assert res.json() == {
+        assert streamed_json(res) == {
             "totals": {
                 "files": 2,
                 "lines": 10,
@@ -378,7 +378,7 @@ class TotalsViewSetTestCase(TestCase):
         branch = "random-nonexistent-branch-aaa"
         res = self._request_report(branch=branch)
         assert res.status_code == 404
-        assert res.json() == {
+        assert streamed_json(res) == {
             "detail": f"The branch '{branch}' in not in our records. Please provide a valid branch name."
         }
 
@@ -389,7 +389,7 @@ class TotalsViewSetTestCase(TestCase):
 
         res = self._request_report(path="bar")
         assert res.status_code == 200
-        assert res.json() == {
+        assert streamed_json(res) == {
             "totals": {
                 "files": 1,
                 "lines": 2,
@@ -440,7 +440,7 @@ class TotalsViewSetTestCase(TestCase):
 
         res = self._request_report(path=path)
         assert res.status_code == 404
-        assert res.json() == {
+        assert streamed_json(res) == {
             "detail": f"No files or directories found matching path: {path}"
         }
 
@@ -453,7 +453,7 @@ class TotalsViewSetTestCase(TestCase):
 
         res = self._request_report(flag="flag-a")
         assert res.status_code == 200
-        assert res.json() == {
+        assert streamed_json(res) == {
             "totals": {
                 "files": 1,
                 "lines": 8,
@@ -517,7 +517,7 @@ class TotalsViewSetTestCase(TestCase):
 
         res = self._request_report(flag="flag-b")
         assert res.status_code == 200
-        assert res.json() == {
+        assert streamed_json(res) == {
             "totals": {
                 "files": 1,
                 "lines": 2,
@@ -623,7 +623,7 @@ class TotalsViewSetTestCase(TestCase):
         res = self._request_report(component_id="foo")
         commit_components.assert_called_once_with(self.commit1, self.org)
         assert res.status_code == 200
-        assert res.json() == {
+        assert streamed_json(res) == {
             "totals": {
                 "files": 1,
                 "lines": 8,
@@ -666,7 +666,7 @@ class TotalsViewSetTestCase(TestCase):
 
         res = self._request_report(component_id="bar")
         assert res.status_code == 200
-        assert res.json() == {
+        assert streamed_json(res) == {
             "totals": {
                 "files": 1,
                 "lines": 2,
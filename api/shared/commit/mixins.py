@@ -1,16 +1,22 @@
 from rest_framework import viewsets
 
 from api.shared.mixins import RepoPropertyMixin
+from api.shared.pagination import PaginationMixin
 from api.shared.permissions import RepositoryArtifactPermissions
+from utils.counts import CountMode
 
 from .filters import CommitFilters
 
 
 class CommitsViewSetMixin(
+    PaginationMixin,
     viewsets.GenericViewSet,
     RepoPropertyMixin,
 ):
     filterset_class = CommitFilters
+    # repos can have millions of commits, don't count them on every page
+    pagination_count_mode = CountMode.CACHED
+    ordering = ("-timestamp",)
     permission_classes = [RepositoryArtifactPermissions]
     lookup_field = "commitid"
 
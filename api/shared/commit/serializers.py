@@ -1,3 +1,5 @@
+from typing import Iterable, Iterator
+
 from rest_framework import serializers
 from shared.reports.resources import Report, ReportFile
 from shared.utils.merge import line_type
@@ -103,7 +105,8 @@ class ReportSerializer(serializers.Serializer):
     files = serializers.SerializerMethodField(label="file specific coverage totals")
 
     def get_files(self, report: Report) -> ReportFileSerializer:
-        return [
-            ReportFileSerializer(report.get(file), context=self.context).data
-            for file in report.files
-        ]
+        return list(self.iter_files(report, report.files))
+
+    def iter_files(self, report: Report, filenames: Iterable[str]) -> Iterator[dict]:
+        for file in filenames:
+            yield ReportFileSerializer(report.get(file), context=self.context).data
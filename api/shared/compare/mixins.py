@@ -82,8 +82,7 @@ class CompareViewSetMixin(CompareSlugMixin, viewsets.GenericViewSet):
             return new_comparison
         return commit_comparison[0]
 
-    @torngit_safe
-    def retrieve(self, request, *args, **kwargs):
+    def get_retrieve_comparison(self) -> Comparison:
         comparison = self.get_object()
 
         # Some checks here for pseudo-comparisons. Basically, when pseudo-comparing,
@@ -91,6 +90,11 @@ class CompareViewSetMixin(CompareSlugMixin, viewsets.GenericViewSet):
         if isinstance(comparison, PullRequestComparison):
             if comparison.pseudo_diff_adjusts_tracked_lines:
                 comparison.update_base_report_with_pseudo_diff()
+        return comparison
+
+    @torngit_safe
+    def retrieve(self, request, *args, **kwargs):
+        comparison = self.get_retrieve_comparison()
         serializer = self.get_serializer(comparison)
 
         try:
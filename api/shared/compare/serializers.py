@@ -1,6 +1,6 @@
 import dataclasses
 import logging
-from typing import List
+from typing import Iterator, List
 
 from rest_framework import serializers
 
@@ -63,11 +63,12 @@ class ComparisonSerializer(serializers.Serializer):
         return {"git_commits": comparison.git_commits}
 
     def get_files(self, comparison: Comparison) -> List[dict]:
-        return [
-            FileComparisonSerializer(file).data
-            for file in comparison.files
-            if self._should_include_file(file)
-        ]
+        return list(self.iter_files(comparison))
+
+    def iter_files(self, comparison: Comparison) -> Iterator[dict]:
+        for file in comparison.files:
+            if self._should_include_file(file):
+                yield FileComparisonSerializer(file).data
 
     def _should_include_file(self, file: FileComparison):
         if "has_diff" in self.context:
@@ -79,12 +80,12 @@ class ComparisonSerializer(serializers.Serializer):
 class FlagComparisonSerializer(serializers.Serializer):
     name = serializers.CharField(source="flag_name")
     base_report_totals = serializers.SerializerMethodField()
-    head_report_totals = ReportTotalsSerializer(source="head_report.totals")
+    head_report_totals = ReportTotalsSerializer(source="head_totals")
     diff_totals = ReportTotalsSerializer()
 
     def get_base_report_totals(self, obj):
         if obj.base_report:
-            return ReportTotalsSerializer(obj.base_report.totals).data
+            return ReportTotalsSerializer(obj.base_totals).data
 
 
 class ImpactedFileSegmentSerializer(serializers.Serializer):
@@ -1,12 +1,56 @@
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from rest_framework.filters import OrderingFilter
 from rest_framework.pagination import CursorPagination, PageNumberPagination
 
+from utils.counts import CountMode, count_queryset
+
 
 class CodecovCursorPagination(CursorPagination):
     page_size_query_param = "page_size"
 
+    def get_ordering(self, request, queryset, view):
+        # views without an `OrderingFilter` can still seek on their own `ordering`
+        has_ordering_filter = any(
+            issubclass(backend, OrderingFilter)
+            for backend in getattr(view, "filter_backends", [])
+        )
+        ordering = getattr(view, "ordering", None)
+        if not has_ordering_filter and ordering:
+            return (ordering,) if isinstance(ordering, str) else tuple(ordering)
+        return super().get_ordering(request, queryset, view)
+
+
+class CountingPaginator(Paginator):
+    """
+    Django paginator computing the total count of a queryset according to `count_mode`.
+    The count bounds the page numbers, so planner estimates can't be used.
+    """
+
+    def __init__(self, *args, count_mode=CountMode.EXACT, **kwargs):
+        if count_mode == CountMode.ESTIMATED:
+            raise ValueError("Page number pagination requires an exact or cached count")
+        super().__init__(*args, **kwargs)
+        self.count_mode = count_mode
+
+    @cached_property
+    def count(self):
+        if self.count_mode == CountMode.EXACT or isinstance(self.object_list, list):
+            return super().count
+        return count_queryset(self.object_list, self.count_mode)
+
 
 class StandardPageNumberPagination(PageNumberPagination):
     page_size_query_param = "page_size"
+    count_mode = CountMode.EXACT
+
+    def django_paginator_class(self, object_list, per_page):
+        return CountingPaginator(object_list, per_page, count_mode=self.count_mode)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        # views can opt into cached counts with `pagination_count_mode`
+        self.count_mode = getattr(view, "pagination_count_mode", self.count_mode)
+        return super().paginate_queryset(queryset, request, view=view)
 
     def get_paginated_response(self, data):
         response = super(StandardPageNumberPagination, self).get_paginated_response(
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Tuple
+from typing import Any, List, Tuple
 
 from asgiref.sync import async_to_sync
 from django.conf import settings
@@ -16,36 +16,88 @@ from codecov_auth.models import Owner
 from core.models import Repository
 from services.activation import try_auto_activate
 from services.decorators import torngit_safe
+from services.permissions_cache import cached_provider_check, cached_provider_checks
 from services.repo_providers import get_generic_adapter_params, get_provider
 
 log = logging.getLogger(__name__)
 
 
 class RepositoryPermissionsService:
+    def _save_read_permissions(self, owner: Owner, repoids: List[int]) -> None:
+        new_repoids = [
+            repoid for repoid in repoids if repoid not in (owner.permission or [])
+        ]
+        if new_repoids:
+            owner.permission = (owner.permission or []) + new_repoids
+            owner.save(update_fields=["permission"])
+
     @torngit_safe
     def _fetch_provider_permissions(
         self, owner: Owner, repo: Repository
     ) -> Tuple[bool, bool]:
-        can_view, can_edit = RepoAccessors().get_repo_permissions(owner, repo)
+        can_view, can_edit = cached_provider_check(
+            "repo_permissions",
+            (owner.ownerid, repo.repoid),
+            lambda: RepoAccessors().get_repo_permissions(owner, repo),
+        )
 
         if can_view:
-            owner.permission = owner.permission or []
-            owner.permission.append(repo.repoid)
-            owner.save(update_fields=["permission"])
+            self._save_read_permissions(owner, [repo.repoid])
 
         return can_view, can_edit
 
-    def has_read_permissions(self, owner: Owner, repo: Repository) -> bool:
+    @torngit_safe
+    def _fetch_provider_read_permissions(
+        self, owner: Owner, repos: List[Repository]
+    ) -> List[bool]:
+        def fetch(indexes: List[int]) -> List[Tuple[bool, bool]]:
+            return RepoAccessors().get_repos_permissions(
+                owner, [repos[index] for index in indexes]
+            )
+
+        permissions = cached_provider_checks(
+            "repo_permissions",
+            [(owner.ownerid, repo.repoid) for repo in repos],
+            fetch,
+        )
+        can_view = [can_view for can_view, _ in permissions]
+
+        self._save_read_permissions(
+            owner, [repo.repoid for repo, view in zip(repos, can_view) if view]
+        )
+
+        return can_view
+
+    def _has_stored_read_permissions(self, owner: Owner, repo: Repository) -> bool:
         return not repo.private or (
             owner is not None
             and (
                 repo.author.ownerid == owner.ownerid
-                or owner.permission
-                and repo.repoid in owner.permission
-                or self._fetch_provider_permissions(owner, repo)[0]
+                or bool(owner.permission and repo.repoid in owner.permission)
             )
         )
 
+    def has_read_permissions(self, owner: Owner, repo: Repository) -> bool:
+        return self._has_stored_read_permissions(owner, repo) or (
+            owner is not None and self._fetch_provider_permissions(owner, repo)[0]
+        )
+
+    def has_read_permissions_on_all(
+        self, owner: Owner, repos: List[Repository]
+    ) -> bool:
+        """
+        Same as `has_read_permissions` for several repos, the permissions we don't
+        have stored are fetched from the provider concurrently.
+        """
+        unknown_repos = [
+            repo for repo in repos if not self._has_stored_read_permissions(owner, repo)
+        ]
+        if not unknown_repos:
+            return True
+        if owner is None:
+            return False
+        return all(self._fetch_provider_read_permissions(owner, unknown_repos))
+
     def has_write_permissions(self, user: Owner, repo: Repository) -> bool:
         return user.is_authenticated and (
             repo.author.ownerid == user.ownerid
@@ -129,14 +181,10 @@ class ChartPermissions(BasePermission):
             f"Coverage chart has repositories {view.repositories}",
             extra=dict(user=request.current_owner),
         )
-        for repo in view.repositories:
-            # TODO: this can cause a provider-api request for every repo in the list,
-            # can we just rely on our stored read permissions? In fact, it seems like
-            # permissioning is built into api.internal.charts.filter.add_simple_filters
-            if not self.permissions_service.has_read_permissions(
-                request.current_owner, repo
-            ):
-                raise Http404
+        if not self.permissions_service.has_read_permissions_on_all(
+            request.current_owner, list(view.repositories)
+        ):
+            raise Http404
         return True
 
 
@@ -164,22 +212,25 @@ class UserIsAdminPermissions(BasePermission):
 
     @torngit_safe
     def _is_admin_on_provider(self, user: Owner, owner: Owner) -> bool:
-        torngit_provider_adapter = get_provider(
-            owner.service,
-            {
-                **get_generic_adapter_params(user, owner.service),
-                **{
-                    "owner": {
-                        "username": owner.username,
-                        "service_id": owner.service_id,
-                    }
+        def fetch() -> bool:
+            torngit_provider_adapter = get_provider(
+                owner.service,
+                {
+                    **get_generic_adapter_params(user, owner.service),
+                    **{
+                        "owner": {
+                            "username": owner.username,
+                            "service_id": owner.service_id,
+                        }
+                    },
                 },
-            },
-        )
+            )
 
-        return async_to_sync(torngit_provider_adapter.get_is_admin)(
-            user={"username": user.username, "service_id": user.service_id}
-        )
+            return async_to_sync(torngit_provider_adapter.get_is_admin)(
+                user={"username": user.username, "service_id": user.service_id}
+            )
+
+        return cached_provider_check("is_admin", (user.ownerid, owner.ownerid), fetch)
 
 
 class MemberOfOrgPermissions(BasePermission):
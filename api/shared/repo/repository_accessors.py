@@ -1,7 +1,9 @@
+import asyncio
 import logging
 
 import sentry_sdk
 from asgiref.sync import async_to_sync
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
 from django.utils import timezone
 
@@ -31,6 +33,32 @@ class RepoAccessors:
             RepoProviderService().get_adapter(owner=user, repo=repo).get_authenticated
         )()
 
+    def get_repos_permissions(self, user, repos):
+        """
+        Same as `get_repo_permissions` for several repos, the provider is queried
+        concurrently for all of them.
+        """
+        adapters = [
+            None
+            if user == repo.author
+            else RepoProviderService().get_adapter(owner=user, repo=repo)
+            for repo in repos
+        ]
+        semaphore = asyncio.Semaphore(settings.PROVIDER_PERMISSIONS_MAX_CONCURRENCY)
+
+        async def get_authenticated(adapter):
+            if adapter is None:
+                return True, True
+            async with semaphore:
+                return await adapter.get_authenticated()
+
+        async def get_all():
+            return await asyncio.gather(
+                *(get_authenticated(adapter) for adapter in adapters)
+            )
+
+        return async_to_sync(get_all)()
+
     @sentry_sdk.trace
     def get_repo_details(
         self, user, repo_name, repo_owner_username, repo_owner_service
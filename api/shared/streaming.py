@@ -0,0 +1,100 @@
+import itertools
+import json
+import logging
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+
+log = logging.getLogger(__name__)
+
+# encoded items are sent in chunks of about this size instead of one write per item
+CHUNK_SIZE = 64 * 1024
+
+
+def _dumps(value: Any) -> str:
+    # same output as DRF's `JSONRenderer` with the default settings
+    return json.dumps(
+        value,
+        cls=JSONEncoder,
+        ensure_ascii=not api_settings.UNICODE_JSON,
+        allow_nan=not api_settings.STRICT_JSON,
+        separators=(",", ":") if api_settings.COMPACT_JSON else None,
+    )
+
+
+def stream_json(data: Dict, key: str, items: Iterable[Any]) -> Iterator[bytes]:
+    """
+    Encodes `data` as a JSON object with `items` as its `key` list.  The items
+    are consumed and encoded one at a time, so only one of them and the current
+    chunk are in memory at once.
+    """
+    head = _dumps(dict(data))[:-1]
+    buffer = [f"{head}{',' if data else ''}{_dumps(key)}:["]
+    size = len(buffer[0])
+    separator = ""
+    for item in items:
+        encoded = separator + _dumps(item)
+        separator = ","
+        buffer.append(encoded)
+        size += len(encoded)
+        if size >= CHUNK_SIZE:
+            yield "".join(buffer).encode()
+            buffer, size = [], 0
+    buffer.append("]}")
+    yield "".join(buffer).encode()
+
+
+def _log_errors(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    try:
+        yield from chunks
+    except Exception:
+        log.exception("Error while streaming a JSON response, its body is truncated")
+        raise
+
+
+class StreamingJSONResponse(StreamingHttpResponse):
+    """
+    JSON response of `data` with a large `key` list (e.g. the files of a report)
+    which is encoded while it is sent instead of being held in memory.  `data`
+    should already be fully serialized, and the first item is loaded before the
+    response starts, so that errors (e.g. a missing report) get their status.
+
+    The status and headers are sent before the other items are loaded: errors
+    loading them are logged and truncate the body, which clients see as invalid
+    JSON with a 200 status.  Loading them also happens once the middlewares have
+    returned, so it isn't accounted to the request (e.g. its database queries).
+    """
+
+    def __init__(self, data: Dict, key: str, items: Iterable[Any], **kwargs):
+        kwargs.setdefault("content_type", "application/json")
+        items = iter(items)
+        first = list(itertools.islice(items, 1))
+        super().__init__(
+            _log_errors(stream_json(data, key, itertools.chain(first, items))),
+            **kwargs,
+        )
+
+
+def page_slice(request: Request) -> Optional[slice]:
+    """
+    Slice of a streamed list selected by the `page` and `page_size` query params,
+    or None when neither is given and the whole list is returned.
+    """
+    params = request.query_params
+    if "page" not in params and "page_size" not in params:
+        return None
+
+    try:
+        page = int(params.get("page", 1))
+        page_size = int(params.get("page_size", api_settings.PAGE_SIZE))
+    except ValueError:
+        raise ValidationError("page and page_size must be integers")
+    if page < 1 or page_size < 1:
+        raise ValidationError("page and page_size must be greater than 0")
+
+    start = (page - 1) * page_size
+    return slice(start, start + page_size)
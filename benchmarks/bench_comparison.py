@@ -0,0 +1,63 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from benchmarks.synthetic import (
+    FILES,
+    LINES,
+    file_path,
+    synthetic_comparison_data,
+    synthetic_report,
+    synthetic_segments,
+)
+from services.comparison import (
+    ComparisonReport,
+    CreateChangeSummaryVisitor,
+    CreateLineComparisonVisitor,
+    FileComparisonTraverseManager,
+)
+
+
+@pytest.fixture(scope="module")
+def report_files():
+    base = synthetic_report(files=1, lines=LINES, seed=0)
+    head = synthetic_report(files=1, lines=LINES, seed=1)
+    return base.get(file_path(0)), head.get(file_path(0))
+
+
+def test_traverse_file_comparison(benchmark, report_files):
+    base_file, head_file = report_files
+    segments = synthetic_segments()
+    src = [f"line {ln}" for ln in range(1, LINES + 1)]
+
+    def traverse():
+        visitors = [
+            CreateChangeSummaryVisitor(base_file, head_file),
+            CreateLineComparisonVisitor(base_file, head_file),
+        ]
+        FileComparisonTraverseManager(
+            head_file_eof=head_file.eof,
+            base_file_eof=base_file.eof,
+            segments=segments,
+            src=src,
+        ).apply(visitors)
+        return visitors
+
+    summary_visitor, lines_visitor = benchmark(traverse)
+    assert lines_visitor.lines
+
+
+def test_comparison_report_impacted_file(benchmark):
+    comparison_report = ComparisonReport(commit_comparison=MagicMock())
+    with patch.object(
+        ComparisonReport,
+        "_fetch_raw_comparison_data",
+        return_value=synthetic_comparison_data(),
+    ):
+        # the files are read from storage once, the lookups are benchmarked
+        assert len(comparison_report.files) == FILES
+
+    # the last file is the worst case of a lookup by path
+    path = file_path(FILES - 1)
+    impacted_file = benchmark(comparison_report.impacted_file, path)
+    assert impacted_file.head_name == path
@@ -0,0 +1,63 @@
+import fnmatch
+import os
+
+import pytest
+import regex
+from shared.utils.match import match
+
+from benchmarks.synthetic import file_path
+from upload.views.empty_upload import GLOB_NON_TESTABLE_FILES
+from utils.match import AnyPathMatcher, PathMatcher
+
+PATHS = int(os.getenv("BENCHMARK_PATHS", 100000))
+
+# paths of the components and flags of a repo
+PATTERNS = (
+    [f"^src/module{index}/.*" for index in range(0, 20, 2)]
+    + [rf"src/module1/package{index}/file\d+\.py" for index in range(6)]
+    + ["^!src/module3/.*", "!.*/package6/.*"]
+)
+
+NON_TESTABLE_PATTERNS = [fnmatch.translate(path) for path in GLOB_NON_TESTABLE_FILES]
+
+
+@pytest.fixture(scope="module")
+def paths():
+    return [file_path(index) for index in range(PATHS)]
+
+
+def test_path_matcher(benchmark, paths):
+    def filter_paths():
+        return PathMatcher(tuple(PATTERNS)).filter(paths)
+
+    assert benchmark(filter_paths)
+
+
+def test_path_matcher_per_pattern(benchmark, paths):
+    # matching with `shared`, one pattern at a time
+    def filter_paths():
+        return [path for path in paths if match(PATTERNS, path)]
+
+    assert benchmark(filter_paths) == PathMatcher(tuple(PATTERNS)).filter(paths)
+
+
+def test_any_path_matcher(benchmark, paths):
+    def filter_paths():
+        return AnyPathMatcher(tuple(NON_TESTABLE_PATTERNS), timeout=2).filter(paths)
+
+    benchmark(filter_paths)
+
+
+def test_any_path_matcher_per_pattern(benchmark, paths):
+    # matching like the upload views did, one pattern at a time
+    def filter_paths():
+        compiled = [regex.compile(pattern) for pattern in NON_TESTABLE_PATTERNS]
+        return [
+            path
+            for path in paths
+            if any(pattern.match(path, timeout=2) for pattern in compiled)
+        ]
+
+    assert benchmark(filter_paths) == AnyPathMatcher(
+        tuple(NON_TESTABLE_PATTERNS), timeout=2
+    ).filter(paths)
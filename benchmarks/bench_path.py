@@ -0,0 +1,33 @@
+import pytest
+
+from benchmarks.synthetic import FILES, synthetic_report
+from services.path import Dir, ReportPaths
+
+
+@pytest.fixture(scope="module")
+def report():
+    return synthetic_report()
+
+
+def test_report_paths_single_directory(benchmark, report):
+    def list_directory():
+        return ReportPaths(report).single_directory()
+
+    (src,) = benchmark(list_directory)
+    assert isinstance(src, Dir)
+    assert src.lines > 0
+
+
+def test_report_paths_subdirectory(benchmark, report):
+    def list_directory():
+        return ReportPaths(report, path="src/module1").single_directory()
+
+    assert benchmark(list_directory)
+
+
+def test_report_paths_full_filelist_with_flags(benchmark, report):
+    def list_files():
+        return ReportPaths(report, filter_flags=["flag0"]).full_filelist()
+
+    files = benchmark(list_files)
+    assert 0 < len(files) < FILES
@@ -0,0 +1,19 @@
+import pytest
+
+from benchmarks.synthetic import FILES, synthetic_report
+from services.report import files_belonging_to_flags, files_in_sessions
+
+
+@pytest.fixture(scope="module")
+def report():
+    return synthetic_report()
+
+
+def test_files_belonging_to_flags(benchmark, report):
+    files = benchmark(files_belonging_to_flags, report, ["flag0", "flag1"])
+    assert 0 < len(files) < FILES
+
+
+def test_files_in_sessions(benchmark, report):
+    files = benchmark(files_in_sessions, report, list(report.sessions.keys()))
+    assert len(files) == FILES
@@ -0,0 +1,41 @@
+import os
+
+import pytest
+
+from utils.sampling_profiler import StackSampler
+
+# depth of the stacks of the synthetic requests, about that of a Django view
+DEPTH = int(os.getenv("BENCHMARK_STACK_DEPTH", 30))
+REQUESTS = int(os.getenv("BENCHMARK_REQUESTS", 100))
+
+
+def handle(depth: int = DEPTH) -> int:
+    if depth:
+        return handle(depth - 1)
+    return sum(i * i for i in range(10000))
+
+
+def serve(sampler=None) -> None:
+    for request in range(REQUESTS):
+        if sampler is None:
+            handle()
+        else:
+            with sampler.sampling(request):
+                handle()
+
+
+def test_requests(benchmark):
+    benchmark(serve)
+
+
+# the default interval, and one 10 times shorter
+@pytest.mark.parametrize("interval", [0.01, 0.001])
+def test_requests_sampled(benchmark, tmp_path, interval):
+    sampler = StackSampler(str(tmp_path), label=str, interval=interval)
+    sampler.start()
+    try:
+        benchmark(serve, sampler)
+    finally:
+        sampler.stop()
+    assert sampler.flush() is None
+    assert list(tmp_path.glob("*.folded"))
@@ -0,0 +1,37 @@
+import pytest
+from shared.django_apps.core.tests.factories import RepositoryFactory
+
+from benchmarks.synthetic import synthetic_test_results
+from graphql_api.types.enums import OrderingDirection, TestResultsOrderingParameter
+from graphql_api.types.enums.enum_types import MeasurementInterval
+from graphql_api.types.test_analytics.test_analytics import generate_test_results
+
+
+@pytest.fixture
+def repository(db, mocker):
+    # the rollup is read once from redis or storage, its processing is benchmarked
+    mocker.patch(
+        "graphql_api.types.test_analytics.test_analytics.get_results",
+        return_value=synthetic_test_results(),
+    )
+    return RepositoryFactory()
+
+
+@pytest.mark.parametrize(
+    "ordering",
+    [
+        TestResultsOrderingParameter.FAILURE_RATE,
+        TestResultsOrderingParameter.AVG_DURATION,
+    ],
+)
+def test_generate_test_results(benchmark, repository, ordering):
+    results = benchmark(
+        generate_test_results,
+        ordering=ordering,
+        ordering_direction=OrderingDirection.DESC,
+        repoid=repository.repoid,
+        measurement_interval=MeasurementInterval.INTERVAL_30_DAY,
+        first=20,
+        flags=["flag0"],
+    )
+    assert len(results.edges) == 20
@@ -0,0 +1,71 @@
+import asyncio
+import random
+from typing import Any, Dict, List
+
+from benchmarks.synthetic import LINES, file_path, synthetic_segments
+
+# number of files changed by the diffs returned by `FakeProvider.get_compare`
+CHANGED_FILES = 20
+
+
+class FakeProvider:
+    """
+    Stands in for a torngit adapter without any network access: every call
+    waits `latency` seconds (plus up to `jitter`) and returns synthetic data
+    matching the synthetic reports of the load harness.
+    """
+
+    def __init__(self, latency: float = 0.05, jitter: float = 0.0, seed: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.random = random.Random(seed)
+
+    async def _wait(self) -> None:
+        await asyncio.sleep(self.latency + self.random.random() * self.jitter)
+
+    async def get_compare(self, base: str, head: str, **kwargs) -> Dict[str, Any]:
+        await self._wait()
+        return {
+            "diff": {
+                "files": {
+                    file_path(index): {
+                        "type": "modified",
+                        "before": None,
+                        "segments": synthetic_segments(seed=index),
+                        "stats": {"added": LINES // 10, "removed": LINES // 20},
+                    }
+                    for index in range(CHANGED_FILES)
+                }
+            },
+            "commits": [
+                {"commitid": base, "message": "base"},
+                {"commitid": head, "message": "head"},
+            ],
+        }
+
+    async def get_source(self, path: str, ref: str, **kwargs) -> Dict[str, Any]:
+        await self._wait()
+        content = "\n".join(f"line {ln} of {path}" for ln in range(1, LINES + 1))
+        return {"content": content, "commitid": ref}
+
+    async def list_files(self, ref: str, dir_path: str = "", **kwargs) -> List[Dict]:
+        await self._wait()
+        return [{"name": "README.md", "path": "README.md", "type": "file"}]
+
+    async def get_authenticated(self, **kwargs):
+        await self._wait()
+        return True, True
+
+    async def get_is_admin(self, user: Dict, **kwargs) -> bool:
+        await self._wait()
+        return True
+
+    def __getattr__(self, name: str):
+        if not name.startswith(("get_", "list_", "find_")):
+            raise AttributeError(name)
+
+        async def call(*args, **kwargs):
+            await self._wait()
+            return None
+
+        return call
@@ -0,0 +1,182 @@
+import os
+import re
+import resource
+import statistics
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from django.db import connections
+
+from codecov.db.query_budget import QueryCounter
+from codecov_auth.models import Owner
+from utils.test_utils import Client
+
+OPERATIONS_DIR = Path(__file__).parent / "operations"
+VARIABLE = re.compile(r"\$(\w+)\s*:")
+
+
+def load_operations(names: Optional[Iterable[str]] = None) -> Dict[str, str]:
+    """
+    Queries of the corpus of frontend operations, by operation name.
+    """
+    operations = {
+        path.stem: path.read_text() for path in sorted(OPERATIONS_DIR.glob("*.graphql"))
+    }
+    if names:
+        unknown = set(names) - set(operations)
+        if unknown:
+            raise ValueError(f"Unknown operations: {', '.join(sorted(unknown))}")
+        operations = {name: operations[name] for name in names}
+    return operations
+
+
+def _rss() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # no procfs (e.g. macOS), the peak of the whole process is reported instead
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class PeakRSS:
+    """
+    Peak resident set size of the process while the block runs, sampled every
+    `interval` seconds.
+    """
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.peak = 0
+        self._stopped = threading.Event()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.peak = max(self.peak, _rss())
+
+    def __enter__(self) -> "PeakRSS":
+        self.peak = _rss()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._stopped.set()
+        self._thread.join()
+        self.peak = max(self.peak, _rss())
+
+
+@dataclass
+class OperationStats:
+    name: str
+    latencies: List[float] = field(default_factory=list)
+    queries: List[int] = field(default_factory=list)
+    errors: int = 0
+    duration: float = 0.0
+    peak_rss: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def percentile(self, p: int) -> float:
+        if len(self.latencies) < 2:
+            return self.latencies[0] if self.latencies else 0.0
+        return statistics.quantiles(self.latencies, n=100)[p - 1]
+
+    def summary(self) -> Dict:
+        return {
+            "operation": self.name,
+            "requests": len(self.latencies),
+            "errors": self.errors,
+            "p50_ms": round(self.percentile(50) * 1000, 1),
+            "p95_ms": round(self.percentile(95) * 1000, 1),
+            "p99_ms": round(self.percentile(99) * 1000, 1),
+            "throughput_rps": round(len(self.latencies) / self.duration, 1)
+            if self.duration
+            else 0.0,
+            "queries_mean": round(statistics.mean(self.queries), 1)
+            if self.queries
+            else 0.0,
+            "queries_max": max(self.queries, default=0),
+            "peak_rss_mb": round(self.peak_rss / 2**20, 1),
+        }
+
+
+def _request(client: Client, query: str, variables: Dict, stats: OperationStats):
+    counter = QueryCounter()
+    start = time.perf_counter()
+    with counter.installed():
+        response = client.post(
+            "/graphql/gh",
+            {"query": query, "variables": variables},
+            content_type="application/json",
+        )
+    latency = time.perf_counter() - start
+
+    failed = response.status_code != 200 or "errors" in response.json()
+    with stats.lock:
+        stats.latencies.append(latency)
+        stats.queries.append(counter.count)
+        if failed:
+            stats.errors += 1
+
+
+def run_operation(
+    name: str,
+    query: str,
+    user: Owner,
+    targets: List[Dict],
+    requests: int,
+    concurrency: int,
+) -> OperationStats:
+    """
+    Makes `requests` requests of the operation, by `concurrency` threads, with
+    the variables of each of the `targets` in turn.
+    """
+    names = set(VARIABLE.findall(query))
+    variables = [
+        {key: value for key, value in target.items() if key in names}
+        for target in targets
+    ]
+    stats = OperationStats(name)
+
+    def worker(offset: int) -> None:
+        client = Client()
+        client.force_login_owner(user)
+        try:
+            for index in range(offset, requests, concurrency):
+                _request(client, query, variables[index % len(variables)], stats)
+        finally:
+            connections.close_all()
+
+    # not measured: the first request loads the schema, templates, etc.
+    worker_client = Client()
+    worker_client.force_login_owner(user)
+    _request(worker_client, query, variables[0], OperationStats(name))
+
+    threads = [
+        threading.Thread(target=worker, args=(offset,)) for offset in range(concurrency)
+    ]
+    with PeakRSS() as peak_rss:
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats.duration = time.perf_counter() - start
+    stats.peak_rss = peak_rss.peak
+    return stats
+
+
+def format_table(summaries: List[Dict]) -> str:
+    if not summaries:
+        return ""
+    columns = list(summaries[0])
+    rows = [columns] + [
+        [str(summary[column]) for column in columns] for summary in summaries
+    ]
+    widths = [max(len(row[i]) for row in rows) for i in range(len(columns))]
+    return "\n".join(
+        "  ".join(cell.ljust(width) for cell, width in zip(row, widths)) for row in rows
+    )
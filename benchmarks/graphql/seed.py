@@ -0,0 +1,144 @@
+import json
+from typing import Dict, List
+
+from shared.api_archive.archive import ArchiveService
+from shared.django_apps.codecov_auth.tests.factories import UserFactory
+from shared.django_apps.core.tests.factories import (
+    CommitFactory,
+    OwnerFactory,
+    PullFactory,
+    RepositoryFactory,
+)
+
+from benchmarks.synthetic import (
+    synthetic_comparison_data,
+    synthetic_report,
+    synthetic_test_results,
+)
+from codecov_auth.models import Owner
+from compare.models import CommitComparison
+from compare.tests.factories import CommitComparisonFactory
+from core.models import Commit, Pull, Repository
+from services.redis_configuration import get_redis_connection
+from utils.test_results import redis_key
+
+# test results are read for the default interval of the test analytics page
+TEST_RESULTS_INTERVAL = 30
+
+
+def member_username(org_username: str) -> str:
+    return f"{org_username}-member"
+
+
+def _seed_commit(
+    repository: Repository, parent: Commit, index: int, files: int, lines: int
+) -> Commit:
+    report = synthetic_report(files=files, lines=lines, seed=index)
+    totals, report_json = report.to_database()
+    if isinstance(report_json, str):
+        report_json = json.loads(report_json)
+
+    commit = CommitFactory(
+        repository=repository,
+        author=repository.author,
+        branch=repository.branch,
+        parent_commit_id=parent.commitid if parent else None,
+        message=f"synthetic commit {index}",
+        totals=totals,
+        _report=report_json,
+    )
+    ArchiveService(repository).write_chunks(commit.commitid, report.to_archive())
+    return commit
+
+
+def _seed_repository(
+    org: Owner, index: int, commits: int, files: int, lines: int, tests: int
+) -> None:
+    repository = RepositoryFactory(
+        author=org,
+        name=f"repo-{index}",
+        private=False,
+        active=True,
+        activated=True,
+        branch="main",
+    )
+
+    chain = []
+    for commit_index in range(commits):
+        parent = chain[-1] if chain else None
+        chain.append(
+            _seed_commit(
+                repository, parent, index * commits + commit_index, files, lines
+            )
+        )
+    base, head = chain[-2] if len(chain) > 1 else chain[0], chain[-1]
+
+    # the impacted files of the pull are the ones computed by the worker
+    storage_path = f"v4/load/{repository.repoid}/{head.commitid}.json"
+    ArchiveService(repository).write_file(
+        storage_path, json.dumps(synthetic_comparison_data(files=files, seed=index))
+    )
+    CommitComparisonFactory(
+        base_commit=base,
+        compare_commit=head,
+        report_storage_path=storage_path,
+        state=CommitComparison.CommitComparisonStates.PROCESSED,
+    )
+    PullFactory(
+        repository=repository,
+        pullid=1,
+        title=f"synthetic pull of repo-{index}",
+        author=org,
+        head=head.commitid,
+        base=base.commitid,
+        compared_to=base.commitid,
+        state="open",
+    )
+
+    get_redis_connection().set(
+        redis_key(repository.repoid, repository.branch, TEST_RESULTS_INTERVAL),
+        synthetic_test_results(tests=tests, seed=index).write_ipc(None).getvalue(),
+    )
+
+
+def seed_org(
+    username: str,
+    repositories: int = 50,
+    commits: int = 3,
+    files: int = 200,
+    lines: int = 100,
+    tests: int = 2000,
+) -> None:
+    """
+    Creates the org `username` with `repositories` public repositories of
+    `commits` commits each, all with reports of `files` files of `lines` lines.
+    The head of each repository has a processed pull and test results.  A member
+    of the org, `member_username(username)`, is the user of the requests.
+    """
+    org = OwnerFactory(username=username, service="github")
+    OwnerFactory(
+        username=member_username(username),
+        service="github",
+        user=UserFactory(),
+        organizations=[org.ownerid],
+    )
+    for index in range(repositories):
+        _seed_repository(org, index, commits, files, lines, tests)
+
+
+def targets(username: str) -> List[Dict]:
+    """
+    Variables of the operations for each repository of the seeded org.
+    """
+    pulls = Pull.objects.filter(
+        repository__author__service="github", repository__author__username=username
+    ).select_related("repository")
+    return [
+        {
+            "owner": username,
+            "repo": pull.repository.name,
+            "commitid": pull.head,
+            "pullid": pull.pullid,
+        }
+        for pull in pulls.order_by("repository__name")
+    ]
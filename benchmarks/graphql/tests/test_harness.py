@@ -0,0 +1,79 @@
+import pytest
+
+from benchmarks.graphql.harness import OperationStats, format_table, load_operations
+
+
+def test_percentile():
+    assert OperationStats("op").percentile(50) == 0.0
+    assert OperationStats("op", latencies=[0.1]).percentile(99) == 0.1
+
+    stats = OperationStats("op", latencies=list(range(1, 101)))
+    assert stats.percentile(50) == pytest.approx(50.5)
+    assert stats.percentile(99) == pytest.approx(99.99)
+
+
+def test_summary():
+    stats = OperationStats(
+        "op",
+        latencies=[0.1, 0.2, 0.3],
+        queries=[2, 4, 6],
+        errors=1,
+        duration=2.0,
+        peak_rss=3 * 2**20,
+    )
+
+    assert stats.summary() == {
+        "operation": "op",
+        "requests": 3,
+        "errors": 1,
+        "p50_ms": 200.0,
+        "p95_ms": 380.0,
+        "p99_ms": 396.0,
+        "throughput_rps": 1.5,
+        "queries_mean": 4.0,
+        "queries_max": 6,
+        "peak_rss_mb": 3.0,
+    }
+
+
+def test_summary_without_requests():
+    summary = OperationStats("op").summary()
+
+    assert summary["requests"] == 0
+    assert summary["p50_ms"] == 0.0
+    assert summary["throughput_rps"] == 0.0
+    assert summary["queries_mean"] == 0.0
+    assert summary["queries_max"] == 0
+
+
+def test_load_operations():
+    operations = load_operations()
+    assert list(operations) == [
+        "CommitPage",
+        "PullImpactedFiles",
+        "RepoList",
+        "TestAnalytics",
+    ]
+    assert "query PullImpactedFiles" in operations["PullImpactedFiles"]
+
+    assert list(load_operations(["RepoList", "CommitPage"])) == [
+        "RepoList",
+        "CommitPage",
+    ]
+
+    with pytest.raises(ValueError, match="Unknown operations: Other"):
+        load_operations(["RepoList", "Other"])
+
+
+def test_format_table():
+    summaries = [
+        {"operation": "CommitPage", "requests": 100, "errors": 0},
+        {"operation": "RepoList", "requests": 5, "errors": 12},
+    ]
+
+    assert format_table(summaries).splitlines() == [
+        "operation   requests  errors",
+        "CommitPage  100       0     ",
+        "RepoList    5         12    ",
+    ]
+    assert format_table([]) == ""
@@ -0,0 +1,122 @@
+import datetime
+import os
+import random
+from typing import Any, Dict, List
+
+import polars as pl
+from shared.reports.resources import Report, ReportFile, ReportLine
+from shared.utils.sessions import Session
+
+# sizes of the synthetic data, can be changed to benchmark e.g. a large monorepo
+FILES = int(os.getenv("BENCHMARK_FILES", 1000))
+LINES = int(os.getenv("BENCHMARK_LINES", 100))
+SESSIONS = int(os.getenv("BENCHMARK_SESSIONS", 5))
+
+COVERAGES = [1, 1, 1, 0, "1/2"]
+
+
+def file_path(index: int) -> str:
+    return f"src/module{index % 20}/package{index % 7}/file{index}.py"
+
+
+def synthetic_report(
+    files: int = FILES, lines: int = LINES, sessions: int = SESSIONS, seed: int = 0
+) -> Report:
+    """
+    Report of `files` files with `lines` lines each, uploaded by `sessions`
+    sessions flagged `flag<session id>`.  Each file is covered by a couple of the
+    sessions.
+    """
+    rand = random.Random(seed)
+    report = Report()
+    for sid in range(sessions):
+        report.add_session(Session(flags=[f"flag{sid}"]))
+
+    for index in range(files):
+        report_file = ReportFile(file_path(index))
+        session_ids = rand.sample(range(sessions), min(2, sessions))
+        for ln in range(1, lines + 1):
+            coverage = rand.choice(COVERAGES)
+            report_file.append(
+                ln,
+                ReportLine.create(
+                    coverage=coverage,
+                    type="b" if coverage == "1/2" else None,
+                    sessions=[[sid, coverage] for sid in session_ids],
+                ),
+            )
+        report.append(report_file)
+    return report
+
+
+def synthetic_segments(lines: int = LINES, seed: int = 0) -> List[Dict]:
+    """
+    Diff segments of a file of `lines` lines, one hunk every 20 lines.
+    """
+    rand = random.Random(seed)
+    segments = []
+    for start in range(1, lines, 20):
+        hunk = [" unchanged", "-removed", "+added", "+added", " unchanged"]
+        rand.shuffle(hunk)
+        base_count = sum(1 for line in hunk if not line.startswith("+"))
+        head_count = sum(1 for line in hunk if not line.startswith("-"))
+        segments.append(
+            {
+                "header": [str(start), str(base_count), str(start), str(head_count)],
+                "lines": hunk,
+            }
+        )
+    return segments
+
+
+def synthetic_comparison_data(files: int = FILES, seed: int = 0) -> Dict[str, Any]:
+    """
+    Comparison data, as stored by the worker, of `files` impacted files.
+    """
+    rand = random.Random(seed)
+    totals = dict(hits=8, misses=1, partials=1)
+    return {
+        "files": [
+            {
+                "base_name": file_path(index),
+                "head_name": file_path(index),
+                "file_was_added_by_diff": False,
+                "file_was_removed_by_diff": False,
+                "base_coverage": totals,
+                "head_coverage": totals,
+                "added_diff_coverage": [[rand.randint(1, LINES), "h"]],
+                "unexpected_line_changes": [],
+            }
+            for index in range(files)
+        ]
+    }
+
+
+def synthetic_test_results(tests: int = FILES * 10, seed: int = 0) -> pl.DataFrame:
+    """
+    Test results rollup, as cached by the worker, of `tests` tests.
+    """
+    rand = random.Random(seed)
+    updated_at = datetime.datetime(2024, 1, 1)
+    rows = []
+    for index in range(tests):
+        fail_count = rand.randint(0, 5)
+        rows.append(
+            {
+                "name": f"test{index}",
+                "testsuite": f"testsuite{index % 10}",
+                "flags": [f"flag{index % SESSIONS}"],
+                "test_id": f"test_id{index}",
+                "failure_rate": fail_count / 10,
+                "flake_rate": 0.0,
+                "updated_at": updated_at + datetime.timedelta(minutes=index),
+                "avg_duration": rand.random() * 100,
+                "total_fail_count": fail_count,
+                "total_flaky_fail_count": 0,
+                "total_pass_count": 10 - fail_count,
+                "total_skip_count": 0,
+                "commits_where_fail": fail_count,
+                "last_duration": rand.random() * 100,
+            }
+        )
+    return pl.DataFrame(rows)
@@ -0,0 +1,137 @@
+import functools
+import logging
+import re
+import time
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+from typing import Dict, Iterator, List
+
+from django.conf import settings
+from django.db import connections
+from shared.metrics import Counter, Histogram, inc_counter
+
+log = logging.getLogger(__name__)
+
+DB_QUERIES_PER_REQUEST = Histogram(
+    "api_db_queries_per_request",
+    "Number of database queries made by a request",
+    ["view"],
+    buckets=[1, 2, 5, 10, 20, 50, 100, 200, 500, 1000],
+)
+
+DB_QUERY_SECONDS_PER_REQUEST = Histogram(
+    "api_db_query_seconds_per_request",
+    "Total time in seconds spent on database queries by a request",
+    ["view"],
+    buckets=[0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10],
+)
+
+DB_QUERY_REPEATS_COUNTER = Counter(
+    "api_db_query_repeats",
+    "Number of queries repeated more than `DB_QUERY_REPEAT_THRESHOLD` times within a request (likely N+1 queries)",
+    ["view"],
+)
+
+DB_QUERY_BUDGET_EXCEEDED_COUNTER = Counter(
+    "api_db_query_budget_exceeded",
+    "Number of requests that made more database queries than their budget",
+    ["view"],
+)
+
+STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+WHITESPACE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=4096)
+def fingerprint(sql: str) -> str:
+    """
+    SQL with its literal values and parameters replaced by `?`, so the same
+    query made with different values has the same fingerprint.
+    """
+    sql = sql.replace("%s", "?")
+    sql = STRING_LITERAL.sub("?", sql)
+    sql = NUMBER_LITERAL.sub("?", sql)
+    sql = PLACEHOLDER_LIST.sub("(...)", sql)
+    return WHITESPACE.sub(" ", sql).strip()
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+class QueryCounter:
+    """
+    Database `execute_wrapper` counting the queries, and the time spent on them,
+    by fingerprint.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.counts: Dict[str, int] = defaultdict(int)
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            self.counts[fingerprint(sql)] += 1
+
+    @contextmanager
+    def installed(self) -> Iterator["QueryCounter"]:
+        """
+        Counts the queries made on any database by the current thread.
+        """
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(self))
+            yield self
+
+    def repeated(self, threshold: int) -> Dict[str, int]:
+        return {sql: count for sql, count in self.counts.items() if count > threshold}
+
+    def most_common(self, n: int = 5) -> List[str]:
+        return sorted(self.counts, key=self.counts.get, reverse=True)[:n]
+
+
+def check_query_budget(name: str, counter: QueryCounter):
+    """
+    Exports the queries counted for a request of view (or GraphQL operation)
+    `name` and checks them against its budget in `DB_QUERY_BUDGETS`: exceeding it
+    logs a warning, or raises `QueryBudgetExceeded` when `DB_QUERY_BUDGET_RAISE`
+    is set (e.g. in tests).
+    """
+    DB_QUERIES_PER_REQUEST.labels(view=name).observe(counter.count)
+    DB_QUERY_SECONDS_PER_REQUEST.labels(view=name).observe(counter.duration)
+
+    repeated = counter.repeated(settings.DB_QUERY_REPEAT_THRESHOLD)
+    if repeated:
+        inc_counter(DB_QUERY_REPEATS_COUNTER, labels=dict(view=name))
+        log.warning(
+            "Repeated database queries, likely N+1",
+            extra=dict(view=name, repeated=repeated),
+        )
+
+    budget = settings.DB_QUERY_BUDGETS.get(name)
+    if budget is None or counter.count <= budget:
+        return
+
+    inc_counter(DB_QUERY_BUDGET_EXCEEDED_COUNTER, labels=dict(view=name))
+    log.warning(
+        "Database query budget exceeded",
+        extra=dict(
+            view=name,
+            budget=budget,
+            count=counter.count,
+            duration=counter.duration,
+            most_common=counter.most_common(),
+        ),
+    )
+    if settings.DB_QUERY_BUDGET_RAISE:
+        raise QueryBudgetExceeded(
+            f"{name} made {counter.count} database queries, its budget is {budget}"
+        )
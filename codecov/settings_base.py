@@ -1,4 +1,5 @@
 import os
+import tempfile
 
 import sentry_sdk
 from corsheaders.defaults import default_headers
@@ -42,6 +43,7 @@ INSTALLED_APPS = [
     "labelanalysis",
     "profiling",
     "reports",
+    "repository_totals",
     "staticanalysis",
     "timeseries",
     "django_prometheus",
@@ -56,6 +58,9 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "core.middleware.AppMetricsBeforeMiddlewareWithUA",
+    "core.middleware.QueryBudgetMiddleware",
+    "core.middleware.IOAccountingMiddleware",
+    "core.middleware.SamplingProfilerMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -110,11 +115,182 @@ GRAPHQL_MAX_DEPTH = get_config("setup", "graphql", "max_depth", default=20)
 
 GRAPHQL_MAX_ALIASES = get_config("setup", "graphql", "max_aliases", default=10)
 
+# fraction of GraphQL requests whose resolvers are timed
+GRAPHQL_RESOLVER_TIMING_SAMPLE_RATE = get_config(
+    "setup", "graphql", "resolver_timing_sample_rate", default=0.01
+)
+
+# results of `@cacheImmutable` fields of processed commits are cached in redis
+GRAPHQL_FIELD_CACHE_ENABLED = get_config(
+    "setup", "graphql", "field_cache_enabled", default=True
+)
+
+GRAPHQL_FIELD_CACHE_TTL_SECONDS = get_config(
+    "setup", "graphql", "field_cache_ttl_seconds", default=86400
+)
+
+# compressed results larger than this aren't cached
+GRAPHQL_FIELD_CACHE_MAX_BYTES = get_config(
+    "setup", "graphql", "field_cache_max_bytes", default=1024 * 1024
+)
+
+# Upload authentication
+
+UPLOAD_TOKEN_CACHE_TTL_SECONDS = get_config(
+    "setup", "upload_auth", "token_cache_ttl_seconds", default=60
+)
+
+OIDC_JWKS_CACHE_TTL_SECONDS = get_config(
+    "setup", "upload_auth", "jwks_cache_ttl_seconds", default=300
+)
+
+# Provider permissions
+
+# 0 disables caching of provider permission checks
+PROVIDER_PERMISSIONS_CACHE_TTL_SECONDS = get_config(
+    "setup", "provider_permissions", "cache_ttl_seconds", default=300
+)
+
+# cached permissions are refreshed once this fraction of their TTL has elapsed
+PROVIDER_PERMISSIONS_REFRESH_AHEAD = get_config(
+    "setup", "provider_permissions", "refresh_ahead", default=0.8
+)
+
+PROVIDER_PERMISSIONS_MAX_CONCURRENCY = get_config(
+    "setup", "provider_permissions", "max_concurrency", default=10
+)
+
+# Provider clients
+
+# share HTTP clients (and their connections) to git providers within a process
+PROVIDER_HTTP_POOLING_ENABLED = get_config(
+    "setup", "provider_clients", "http_pooling_enabled", default=True
+)
+
+# 0 disables caching of decrypted oauth tokens
+PROVIDER_TOKEN_CACHE_TTL_SECONDS = get_config(
+    "setup", "provider_clients", "token_cache_ttl_seconds", default=300
+)
+
+# Provider payloads
+
+# immutable provider payloads, e.g. the compare of two shas, are cached compressed
+# in redis, 0 disables caching
+PROVIDER_COMPARE_CACHE_TTL_SECONDS = get_config(
+    "setup", "provider_cache", "compare_ttl_seconds", default=7 * 86400
+)
+
+# larger (compressed) compares are not cached
+PROVIDER_COMPARE_CACHE_MAX_BYTES = get_config(
+    "setup", "provider_cache", "compare_max_bytes", default=5 * 1024 * 1024
+)
+
+# contents of files at a commit are cached by digest on disk and in redis, 0
+# disables caching
+PROVIDER_SOURCE_CACHE_TTL_SECONDS = get_config(
+    "setup", "provider_cache", "source_ttl_seconds", default=7 * 86400
+)
+
+# files missing from the provider are remembered for a shorter while
+PROVIDER_SOURCE_NOT_FOUND_TTL_SECONDS = get_config(
+    "setup", "provider_cache", "source_not_found_ttl_seconds", default=600
+)
+
+# larger (compressed) files are not cached
+PROVIDER_SOURCE_CACHE_MAX_FILE_BYTES = get_config(
+    "setup", "provider_cache", "source_max_file_bytes", default=1024 * 1024
+)
+
+# None disables the disk cache, least recently used files are evicted once the
+# directory grows over the max size
+PROVIDER_SOURCE_DISK_CACHE_DIR = get_config(
+    "setup",
+    "provider_cache",
+    "source_disk_dir",
+    default=os.path.join(tempfile.gettempdir(), "codecov-source-cache"),
+)
+
+PROVIDER_SOURCE_DISK_CACHE_MAX_BYTES = get_config(
+    "setup", "provider_cache", "source_disk_max_bytes", default=512 * 1024 * 1024
+)
+
+# Pagination
+
+# planner estimates below this are replaced by an exact count
+PAGINATION_EXACT_COUNT_THRESHOLD = get_config(
+    "setup", "pagination", "exact_count_threshold", default=10000
+)
+
+# 0 disables caching of counts
+PAGINATION_COUNT_CACHE_TTL_SECONDS = get_config(
+    "setup", "pagination", "count_cache_ttl_seconds", default=300
+)
+
+# Comparisons
+
+# parsed comparisons kept by each process, as their files are looked up one
+# request at a time (0 disables it)
+COMPARISON_REPORT_CACHE_SIZE = get_config(
+    "setup", "comparison", "report_cache_size", default=32
+)
+
+# Charts
+
+# commits with past timestamps (e.g. processed late) only show up in the cached
+# historical segment of charts once it expires (0 disables the cache)
+CHART_CACHE_TTL_SECONDS = get_config(
+    "setup",
+    "charts",
+    "cache_ttl_seconds",
+    default=3600,  # 1 hour
+)
+
+# Timeseries
+
+# size of the time range backfilled by a single task
+TIMESERIES_BACKFILL_CHUNK_DAYS = get_config(
+    "setup", "timeseries", "backfill_chunk_days", default=30
+)
+
+# max number of backfill tasks running in parallel for a single backfill request
+TIMESERIES_BACKFILL_MAX_CONCURRENCY = get_config(
+    "setup", "timeseries", "backfill_max_concurrency", default=4
+)
+
 # Database
 # https://docs.djangoproject.com/en/2.1/ref/settings/#databases
 
 DATABASE_ROUTERS = ["codecov.db.DatabaseRouter"]
 
+# database queries made by each request (see `codecov.db.query_budget`)
+DB_QUERY_COUNTING_ENABLED = get_config(
+    "setup", "db_query_budgets", "enabled", default=True
+)
+# queries repeated more than this many times in a request are logged as N+1s
+DB_QUERY_REPEAT_THRESHOLD = get_config(
+    "setup", "db_query_budgets", "repeat_threshold", default=10
+)
+# maximum number of queries by view name, or `graphql.<operation name>`
+DB_QUERY_BUDGETS = get_config("setup", "db_query_budgets", "budgets", default={})
+DB_QUERY_BUDGET_RAISE = False
+
+# storage, redis and provider calls made by each request (see `services.io_accounting`)
+IO_ACCOUNTING_ENABLED = get_config("setup", "io_accounting", "enabled", default=True)
+
+# in-process stack sampling of the gunicorn workers (see `utils.sampling_profiler`)
+SAMPLING_PROFILER_ENABLED = get_config(
+    "setup", "sampling_profiler", "enabled", default=False
+)
+SAMPLING_PROFILER_INTERVAL = get_config(
+    "setup", "sampling_profiler", "interval_seconds", default=0.01
+)
+SAMPLING_PROFILER_FLUSH_INTERVAL = get_config(
+    "setup", "sampling_profiler", "flush_interval_seconds", default=60
+)
+SAMPLING_PROFILER_DIR = get_config(
+    "setup", "sampling_profiler", "directory", default="/tmp/stack-samples"
+)
+
 # GCS
 GCS_BUCKET_NAME = get_config("services", "minio", "bucket", default="codecov")
 
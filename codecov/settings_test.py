@@ -12,3 +12,42 @@ SHELTER_PUBSUB_SYNC_REPO_TOPIC_ID = "test-topic-id"
 os.environ["PUBSUB_EMULATOR_HOST"] = "localhost"
 
 GRAPHQL_INTROSPECTION_ENABLED = True
+
+# tests mock provider permissions, they must not be served from a previous test's cache
+PROVIDER_PERMISSIONS_CACHE_TTL_SECONDS = 0
+
+# tests record provider requests per test and mock decrypted tokens
+PROVIDER_HTTP_POOLING_ENABLED = False
+PROVIDER_TOKEN_CACHE_TTL_SECONDS = 0
+
+# tests mock different compares and sources for the same shas
+PROVIDER_COMPARE_CACHE_TTL_SECONDS = 0
+PROVIDER_SOURCE_CACHE_TTL_SECONDS = 0
+
+# tests count the same querysets before and after creating rows
+PAGINATION_COUNT_CACHE_TTL_SECONDS = 0
+
+# tests create commits in the historical segment of charts between queries
+CHART_CACHE_TTL_SECONDS = 0
+
+# tests mock different comparison data for the same storage paths
+COMPARISON_REPORT_CACHE_SIZE = 0
+
+# requests exceeding their database query budget fail the test.  The budgets are
+# those of the lists prone to N+1 queries, whose tests list up to 200 rows.
+DB_QUERY_BUDGET_RAISE = True
+DB_QUERY_BUDGETS = {
+    # commit lists
+    "commits-list": 50,
+    "api-v2-commits-list": 50,
+    "graphql.FetchCommits": 50,
+    # commit uploads
+    "graphql.FetchCommit": 50,
+    # repository lists
+    "repos-list": 50,
+    "api-v2-repos-list": 50,
+    "graphql.Repositories": 50,
+}
+
+# tests mock different reports for the same processed commits
+GRAPHQL_FIELD_CACHE_ENABLED = False
@@ -0,0 +1,53 @@
+import pytest
+from django.test import TestCase, override_settings
+from shared.django_apps.core.tests.factories import OwnerFactory
+
+from codecov.db.query_budget import (
+    QueryBudgetExceeded,
+    QueryCounter,
+    check_query_budget,
+    fingerprint,
+)
+from codecov_auth.models import Owner
+
+
+def test_fingerprint():
+    assert fingerprint(
+        "SELECT * FROM owners WHERE ownerid = %s AND service = 'github'"
+    ) == fingerprint("SELECT * FROM owners WHERE ownerid = 12 AND service = 'gitlab'")
+    assert fingerprint(
+        'SELECT "id" FROM repos WHERE repoid IN (%s, %s,%s)\n LIMIT 21'
+    ) == ('SELECT "id" FROM repos WHERE repoid IN (...) LIMIT ?')
+    assert fingerprint("SELECT * FROM table1") == "SELECT * FROM table1"
+
+
+class QueryCounterTest(TestCase):
+    def test_count_by_fingerprint(self):
+        owners = OwnerFactory.create_batch(3)
+        counter = QueryCounter()
+
+        with counter.installed():
+            for owner in owners:
+                Owner.objects.filter(ownerid=owner.ownerid).first()
+            Owner.objects.count()
+        Owner.objects.count()
+
+        assert counter.count == 4
+        assert counter.duration > 0
+        assert sorted(counter.counts.values()) == [1, 3]
+        assert list(counter.repeated(2).values()) == [3]
+        assert counter.repeated(3) == {}
+
+    @override_settings(DB_QUERY_BUDGETS={"some-view": 1})
+    def test_check_query_budget(self):
+        counter = QueryCounter()
+        with counter.installed():
+            Owner.objects.count()
+
+        check_query_budget("some-view", counter)
+        check_query_budget("other-view", counter)
+
+        with counter.installed():
+            Owner.objects.count()
+        with pytest.raises(QueryBudgetExceeded):
+            check_query_budget("some-view", counter)
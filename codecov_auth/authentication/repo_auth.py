@@ -14,6 +14,10 @@ from rest_framework.views import exception_handler
 from shared.django_apps.codecov_auth.models import Owner
 
 from codecov_auth.authentication.helpers import get_upload_info_from_request_path
+from codecov_auth.authentication.token_cache import (
+    get_org_token_for_upload_token,
+    get_repository_for_upload_token,
+)
 from codecov_auth.authentication.types import RepositoryAsUser, RepositoryAuthInterface
 from codecov_auth.models import (
     OrganizationLevelToken,
@@ -59,26 +63,40 @@ def repo_auth_custom_exception_handler(exc, context):
     return response
 
 
-class LegacyTokenRepositoryAuth(RepositoryAuthInterface):
-    def __init__(self, repository, auth_data):
-        self._auth_data = auth_data
-        self._repository = repository
+class SingleRepositoryAuth(RepositoryAuthInterface):
+    """
+    Base class of the authentications scoped to `self._repository` only.
+    """
 
-    def get_scopes(self):
-        return [TokenTypeChoices.UPLOAD]
+    _repository: Repository
 
     def get_repositories(self):
         return [self._repository]
 
+    def get_repositories_queryset(self) -> QuerySet:
+        return Repository.objects.filter(repoid=self._repository.repoid)
+
+    def get_repository(self) -> Repository:
+        return self._repository
+
     def allows_repo(self, repository):
-        return repository in self.get_repositories()
+        return repository.repoid == self._repository.repoid
+
+
+class LegacyTokenRepositoryAuth(SingleRepositoryAuth):
+    def __init__(self, repository, auth_data):
+        self._auth_data = auth_data
+        self._repository = repository
+
+    def get_scopes(self):
+        return [TokenTypeChoices.UPLOAD]
 
 
 class OIDCTokenRepositoryAuth(LegacyTokenRepositoryAuth):
     pass
 
 
-class TableTokenRepositoryAuth(RepositoryAuthInterface):
+class TableTokenRepositoryAuth(SingleRepositoryAuth):
     def __init__(self, repository, token):
         self._token = token
         self._repository = repository
@@ -86,12 +104,6 @@ class TableTokenRepositoryAuth(RepositoryAuthInterface):
     def get_scopes(self):
         return [self._token.token_type]
 
-    def get_repositories(self):
-        return [self._repository]
-
-    def allows_repo(self, repository):
-        return repository in self.get_repositories()
-
 
 class OrgLevelTokenRepositoryAuth(RepositoryAuthInterface):
     def __init__(self, token: OrganizationLevelToken) -> None:
@@ -102,7 +114,7 @@ class OrgLevelTokenRepositoryAuth(RepositoryAuthInterface):
         return [self._token.token_type]
 
     def allows_repo(self, repository):
-        return repository.author.ownerid == self._org.ownerid
+        return repository.author_id == self._org.ownerid
 
     def get_repositories_queryset(self) -> QuerySet:
         """Returns the QuerySet that generates get_repositories list.
@@ -110,25 +122,23 @@ class OrgLevelTokenRepositoryAuth(RepositoryAuthInterface):
         """
         return Repository.objects.filter(author=self._org)
 
+    def get_repository(self) -> None:
+        # org tokens are scoped to all the repositories of the org
+        return None
+
     def get_repositories(self) -> List[Repository]:
         # This might be an expensive function depending on the owner in question (thousands of repos)
         # Consider using get_repositories_queryset if possible and adding more filters to it
-        return list(Repository.objects.filter(author=self._org).all())
+        return list(self.get_repositories_queryset())
 
 
-class TokenlessAuth(RepositoryAuthInterface):
+class TokenlessAuth(SingleRepositoryAuth):
     def __init__(self, repository: Repository) -> None:
         self._repository = repository
 
     def get_scopes(self):
         return [TokenTypeChoices.UPLOAD]
 
-    def allows_repo(self, repository):
-        return repository in self.get_repositories()
-
-    def get_repositories(self) -> List[Repository]:
-        return [self._repository]
-
 
 class RepositoryLegacyQueryTokenAuthentication(authentication.BaseAuthentication):
     def authenticate(self, request):
@@ -139,9 +149,8 @@ class RepositoryLegacyQueryTokenAuthentication(authentication.BaseAuthentication
             token = UUID(token)
         except ValueError:
             return None
-        try:
-            repository = Repository.objects.get(upload_token=token)
-        except Repository.DoesNotExist:
+        repository = get_repository_for_upload_token(token)
+        if repository is None:
             return None
         return (
             RepositoryAsUser(repository),
@@ -153,8 +162,10 @@ class RepositoryLegacyTokenAuthentication(authentication.TokenAuthentication):
     def authenticate_credentials(self, token):
         try:
             token = UUID(token)
-            repository = Repository.objects.get(upload_token=token)
-        except (ValueError, TypeError, Repository.DoesNotExist):
+        except (ValueError, TypeError):
+            return None  # continue to next auth class
+        repository = get_repository_for_upload_token(token)
+        if repository is None:
             return None  # continue to next auth class
         return (
             RepositoryAsUser(repository),
@@ -222,7 +233,7 @@ class OrgLevelTokenAuthentication(authentication.TokenAuthentication):
     def authenticate_credentials(self, key):
         if is_uuid(key):  # else, continue to next auth class
             # Actual verification for org level tokens
-            token = OrganizationLevelToken.objects.filter(token=key).first()
+            token = get_org_token_for_upload_token(UUID(key))
 
             if token is None:
                 return None
@@ -0,0 +1,129 @@
+import hashlib
+import json
+import logging
+from uuid import UUID
+
+from django.conf import settings
+from redis.exceptions import RedisError
+from shared.metrics import Counter, inc_counter
+
+from codecov_auth.models import OrganizationLevelToken
+from core.models import Repository
+from services.redis_configuration import get_redis_connection
+
+log = logging.getLogger(__name__)
+
+UPLOAD_TOKEN_CACHE_COUNTER = Counter(
+    "api_upload_token_cache_lookups",
+    "Number of upload token authentication cache lookups",
+    ["result"],
+)
+
+# kinds of upload tokens, `UNKNOWN` is cached for tokens matching nothing so the
+# other authentication classes can skip their own lookup
+REPOSITORY = "repository"
+ORG = "org"
+UNKNOWN = "unknown"
+
+
+def _cache_key(token: UUID) -> str:
+    # never store the plain token in redis
+    digest = hashlib.sha256(str(token).encode()).hexdigest()
+    return f"upload_token_auth/{digest}"
+
+
+def _get_cached(token: UUID) -> tuple[str, int | None] | None:
+    try:
+        cached = get_redis_connection().get(_cache_key(token))
+    except (OSError, RedisError) as e:
+        log.warning(f"Error connecting to redis: {e}")
+        return None
+    if cached is None:
+        inc_counter(UPLOAD_TOKEN_CACHE_COUNTER, labels=dict(result="miss"))
+        return None
+    inc_counter(UPLOAD_TOKEN_CACHE_COUNTER, labels=dict(result="hit"))
+    kind, pk = json.loads(cached)
+    return kind, pk
+
+
+def _set_cached(token: UUID, kind: str, pk: int | None) -> None:
+    try:
+        get_redis_connection().set(
+            _cache_key(token),
+            json.dumps([kind, pk]),
+            ex=settings.UPLOAD_TOKEN_CACHE_TTL_SECONDS,
+        )
+    except (OSError, RedisError) as e:
+        log.warning(f"Error connecting to redis: {e}")
+
+
+def invalidate_upload_token(token: UUID | str | None) -> None:
+    """
+    Drops the cached owner of `token`, called when a token is regenerated or revoked.
+    """
+    if not token:
+        return
+    try:
+        get_redis_connection().delete(_cache_key(token))
+    except (OSError, RedisError) as e:
+        log.warning(f"Error connecting to redis: {e}")
+
+
+def _fetch(token: UUID, kind: str, pk: int) -> Repository | OrganizationLevelToken:
+    # filtering on the token as well means a stale entry can never authenticate
+    # a regenerated or revoked token
+    if kind == REPOSITORY:
+        return Repository.objects.filter(repoid=pk, upload_token=token).first()
+    return (
+        OrganizationLevelToken.objects.select_related("owner")
+        .filter(id=pk, token=token)
+        .first()
+    )
+
+
+def _resolve(token: UUID) -> tuple[str, Repository | OrganizationLevelToken | None]:
+    repository = Repository.objects.filter(upload_token=token).first()
+    if repository is not None:
+        _set_cached(token, REPOSITORY, repository.repoid)
+        return REPOSITORY, repository
+
+    org_token = (
+        OrganizationLevelToken.objects.select_related("owner")
+        .filter(token=token)
+        .first()
+    )
+    if org_token is not None:
+        _set_cached(token, ORG, org_token.id)
+        return ORG, org_token
+
+    _set_cached(token, UNKNOWN, None)
+    return UNKNOWN, None
+
+
+def _lookup(
+    token: UUID, kind: str
+) -> tuple[str, Repository | OrganizationLevelToken | None]:
+    """
+    Finds what `token` belongs to with at most one query when it is cached.  Tokens
+    cached as belonging to something other than `kind` don't hit the DB at all.
+    """
+    cached = _get_cached(token)
+    if cached is not None:
+        cached_kind, pk = cached
+        if cached_kind != kind:
+            return cached_kind, None
+        obj = _fetch(token, cached_kind, pk)
+        if obj is not None:
+            return cached_kind, obj
+        invalidate_upload_token(token)
+    return _resolve(token)
+
+
+def get_repository_for_upload_token(token: UUID) -> Repository | None:
+    kind, obj = _lookup(token, REPOSITORY)
+    return obj if kind == REPOSITORY else None
+
+
+def get_org_token_for_upload_token(token: UUID) -> OrganizationLevelToken | None:
+    kind, obj = _lookup(token, ORG)
+    return obj if kind == ORG else None
@@ -1,6 +1,7 @@
-from typing import List
+from typing import List, Optional
 
 from django.contrib.auth.models import Group, Permission
+from django.db.models import QuerySet
 from django.db.models.manager import EmptyManager
 
 from core.models import Repository
@@ -21,6 +22,19 @@ class RepositoryAuthInterface(object):
     def get_repositories() -> List[Repository]:
         raise NotImplementedError()
 
+    def get_repositories_queryset(self) -> QuerySet:
+        """
+        Lazy QuerySet of the repositories in scope, prefer this over `get_repositories`
+        so scope checks are done by the DB, e.g. `filter(repository__in=...)`.
+        """
+        raise NotImplementedError()
+
+    def get_repository(self) -> Optional[Repository]:
+        """
+        The repository in scope when that is a single repository, None otherwise.
+        """
+        raise NotImplementedError()
+
     def allows_repo(self, repository: Repository) -> bool:
         raise NotImplementedError()
 
@@ -1,8 +1,9 @@
 from typing import Any, Dict, Optional, Type
 
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from codecov_auth.authentication.token_cache import invalidate_upload_token
 from codecov_auth.models import OrganizationLevelToken, Owner, OwnerProfile
 from utils.shelter import ShelterPubsub
 
@@ -31,6 +32,22 @@ def update_org_token(
     ShelterPubsub.get_instance().publish(data)
 
 
+@receiver(
+    post_save, sender=OrganizationLevelToken, dispatch_uid="upload_token_cache_org"
+)
+@receiver(
+    post_delete, sender=OrganizationLevelToken, dispatch_uid="upload_token_cache_org"
+)
+def invalidate_org_token(
+    sender: Type[OrganizationLevelToken],
+    instance: OrganizationLevelToken,
+    **kwargs: Dict[str, Any],
+) -> None:
+    # cached entries of a regenerated token are dropped on their next lookup since
+    # they no longer match, this takes care of tokens cached as unknown or deleted
+    invalidate_upload_token(instance.token)
+
+
 @receiver(post_save, sender=Owner, dispatch_uid="shelter_sync_owner")
 def update_owner(
     sender: Type[Owner], instance: Owner, **kwargs: Dict[str, Any]
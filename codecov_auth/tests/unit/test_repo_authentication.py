@@ -99,6 +99,10 @@ class TestRepositoryLegacyTokenAuthentication(object):
         assert user._repository == repo
         assert auth.get_repositories() == [repo]
         assert auth.get_scopes() == ["upload"]
+        assert auth.get_repository() == repo
+        assert list(auth.get_repositories_queryset()) == [repo]
+        assert auth.allows_repo(repo)
+        assert not auth.allows_repo(RepositoryFactory.create())
 
 
 class TestRepositoryTableTokenAuthentication(object):
@@ -418,6 +422,7 @@ class TestOrgLevelTokenAuthentication(object):
         assert auth.allows_repo(repository)
         assert auth.allows_repo(other_repo_from_owner)
         assert not auth.allows_repo(random_repo)
+        assert auth.get_repository() is None
 
     @override_settings(IS_ENTERPRISE=True)
     def test_orgleveltoken_success_auth_enterprise(self, db, mocker):
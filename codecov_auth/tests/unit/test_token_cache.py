@@ -0,0 +1,101 @@
+import uuid
+
+from django.test import override_settings
+from redis.exceptions import ConnectionError, TimeoutError
+from shared.django_apps.core.tests.factories import OwnerFactory, RepositoryFactory
+
+from codecov_auth.authentication.token_cache import (
+    get_org_token_for_upload_token,
+    get_repository_for_upload_token,
+    invalidate_upload_token,
+)
+from codecov_auth.models import OrganizationLevelToken
+
+
+class TestUploadTokenCache(object):
+    def test_repository_token(self, db, mock_redis, django_assert_num_queries):
+        repo = RepositoryFactory()
+
+        with django_assert_num_queries(1):
+            assert get_repository_for_upload_token(repo.upload_token) == repo
+        # cached lookups fetch the repository by primary key
+        with django_assert_num_queries(1):
+            assert get_repository_for_upload_token(repo.upload_token) == repo
+        # a repository token isn't an org token, no need to query
+        with django_assert_num_queries(0):
+            assert get_org_token_for_upload_token(repo.upload_token) is None
+
+    def test_org_token(self, db, mock_redis, django_assert_num_queries):
+        owner = OwnerFactory(plan="users-enterprisey")
+        org_token = OrganizationLevelToken.objects.create(owner=owner)
+
+        assert get_org_token_for_upload_token(org_token.token) == org_token
+        with django_assert_num_queries(0):
+            assert get_repository_for_upload_token(org_token.token) is None
+        with django_assert_num_queries(1):
+            cached = get_org_token_for_upload_token(org_token.token)
+            assert cached == org_token
+            assert cached.owner == owner
+
+    def test_unknown_token(self, db, mock_redis, django_assert_num_queries):
+        token = uuid.uuid4()
+
+        with django_assert_num_queries(2):
+            assert get_repository_for_upload_token(token) is None
+        with django_assert_num_queries(0):
+            assert get_repository_for_upload_token(token) is None
+            assert get_org_token_for_upload_token(token) is None
+
+    def test_regenerated_repository_token(self, db, mock_redis):
+        repo = RepositoryFactory()
+        old_token = repo.upload_token
+        assert get_repository_for_upload_token(old_token) == repo
+
+        repo.upload_token = uuid.uuid4()
+        repo.save()
+
+        assert get_repository_for_upload_token(old_token) is None
+        assert get_repository_for_upload_token(repo.upload_token) == repo
+
+    def test_stale_entry_is_not_trusted(self, db, mock_redis):
+        repo = RepositoryFactory()
+        old_token = repo.upload_token
+        assert get_repository_for_upload_token(old_token) == repo
+
+        # bypasses the signals invalidating the cache
+        type(repo).objects.filter(repoid=repo.repoid).update(upload_token=uuid.uuid4())
+
+        assert get_repository_for_upload_token(old_token) is None
+
+    def test_revoked_org_token(self, db, mock_redis):
+        owner = OwnerFactory(plan="users-enterprisey")
+        org_token = OrganizationLevelToken.objects.create(owner=owner)
+        assert get_org_token_for_upload_token(org_token.token) == org_token
+
+        org_token.delete()
+
+        assert get_org_token_for_upload_token(org_token.token) is None
+
+    @override_settings(UPLOAD_TOKEN_CACHE_TTL_SECONDS=60)
+    def test_cache_ttl(self, db, mock_redis):
+        repo = RepositoryFactory()
+        get_repository_for_upload_token(repo.upload_token)
+
+        keys = mock_redis.keys("upload_token_auth/*")
+        assert len(keys) == 1
+        assert str(repo.upload_token).encode() not in keys[0]
+        assert 0 < mock_redis.ttl(keys[0]) <= 60
+
+        invalidate_upload_token(repo.upload_token)
+        assert mock_redis.keys("upload_token_auth/*") == []
+
+    def test_redis_unavailable(self, db, mock_redis, mocker):
+        mocker.patch.object(mock_redis, "get", side_effect=ConnectionError())
+        mocker.patch.object(mock_redis, "set", side_effect=TimeoutError())
+        mocker.patch.object(mock_redis, "delete", side_effect=ConnectionError())
+        repo = RepositoryFactory()
+
+        # falls back to the database
+        assert get_repository_for_upload_token(repo.upload_token) == repo
+        assert get_org_token_for_upload_token(repo.upload_token) is None
+        invalidate_upload_token(repo.upload_token)
@@ -1,12 +1,11 @@
 import enum
 from typing import List, Optional
 
-from shared.utils.match import match
-
 import services.components as components
 from codecov.commands.base import BaseInteractor
 from services.comparison import Comparison, ComparisonReport, ImpactedFile
 from services.report import files_belonging_to_flags
+from utils.match import path_matcher
 
 
 class ImpactedFileParameter(enum.Enum):
@@ -74,11 +73,8 @@ class FetchImpactedFiles(BaseInteractor):
         res = impacted_files
 
         if components_paths:
-            res = [
-                file
-                for file in impacted_files
-                if match(components_paths, file.head_name)
-            ]
+            matcher = path_matcher(components_paths)
+            res = [file for file in impacted_files if matcher.match(file.head_name)]
         return res
 
     def get_attribute(
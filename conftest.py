@@ -47,6 +47,15 @@ def mock_redis(mocker):
     yield redis_server
 
 
+@pytest.fixture(autouse=True)
+def clear_jwks_clients():
+    yield
+    # JWKS clients are cached per url, don't leak (mocked) clients between tests
+    from upload.helpers import get_jwks_client
+
+    get_jwks_client.cache_clear()
+
+
 @pytest.fixture(scope="class")
 def sample_report(request):
     report = Report()
@@ -1,6 +1,8 @@
 from django.apps import AppConfig
+from shared.api_archive.archive import ArchiveService
 from shared.helpers.cache import RedisBackend
 
+from services.io_accounting import STORAGE, instrument_class
 from services.redis_configuration import get_redis_connection
 from utils.cache import cache
 from utils.config import RUN_ENV
@@ -12,6 +14,11 @@ class CoreConfig(AppConfig):
     def ready(self):
         import core.signals  # noqa: F401
 
+        # reports and their chunks are read through `shared`'s own archive service
+        instrument_class(
+            ArchiveService, ["read_file", "write_file", "delete_file"], STORAGE
+        )
+
         if RUN_ENV not in ["DEV", "TESTING"]:
             cache_backend = RedisBackend(get_redis_connection())
             cache.configure(cache_backend)
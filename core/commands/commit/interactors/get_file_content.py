@@ -1,24 +1,27 @@
 import logging
 
+from asgiref.sync import async_to_sync
+
 from codecov.commands.base import BaseInteractor
+from codecov.db import sync_to_async
 from services.repo_providers import RepoProviderService
+from services.source_cache import get_source_content
 
 log = logging.getLogger(__name__)
 
 
 class GetFileContentInteractor(BaseInteractor):
     async def get_file_from_service(self, commit, path):
-        try:
+        async def fetch_source():
             repository_service = await RepoProviderService().async_get_adapter(
                 owner=self.current_owner, repo=commit.repository
             )
-            content = await repository_service.get_source(path, commit.commitid)
+            return await repository_service.get_source(path, commit.commitid)
 
-            # When a file received from GH that is larger than 1MB the result will be
-            # pre-decoded and of string type; no need to decode again in that case
-            if isinstance(content.get("content"), str):
-                return content.get("content")
-            return content.get("content").decode("utf-8")
+        try:
+            return await sync_to_async(get_source_content)(
+                commit.repository_id, commit.commitid, path, async_to_sync(fetch_source)
+            )
         # TODO raise this to the API so we can handle it.
         except Exception:
             log.info(
@@ -0,0 +1,101 @@
+import json
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+from django.test import override_settings
+
+from benchmarks.graphql.fake_provider import FakeProvider
+from benchmarks.graphql.harness import format_table, load_operations, run_operation
+from benchmarks.graphql.seed import member_username, seed_org, targets
+from codecov_auth.models import Owner
+from utils.config import RUN_ENV
+
+
+class Command(BaseCommand):
+    help = (
+        "Replays the GraphQL operations of `benchmarks/graphql/operations` against "
+        "a seeded synthetic org, with a fake git provider, and reports their "
+        "latency, throughput, database queries and peak RSS.  It uses the "
+        "configured database, redis and storage, e.g. those of "
+        "`docker compose -f docker-compose.yml -f docker/docker-compose.load.yml`."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--org", default="load-org")
+        parser.add_argument(
+            "--seed", action="store_true", help="create the org before the run"
+        )
+        parser.add_argument("--repositories", type=int, default=50)
+        parser.add_argument("--commits", type=int, default=3)
+        parser.add_argument("--files", type=int, default=200)
+        parser.add_argument("--lines", type=int, default=100)
+        parser.add_argument("--tests", type=int, default=2000)
+        parser.add_argument(
+            "--operations", nargs="*", help="names of the operations, default all"
+        )
+        parser.add_argument("--requests", type=int, default=100)
+        parser.add_argument("--concurrency", type=int, default=4)
+        parser.add_argument(
+            "--provider-latency",
+            type=float,
+            default=50,
+            help="milliseconds of each provider call",
+        )
+        parser.add_argument("--provider-jitter", type=float, default=0)
+        parser.add_argument("--output", help="file to write the results to, as JSON")
+
+    def handle(self, *args, **options):
+        if RUN_ENV not in ["DEV", "TESTING"]:
+            raise CommandError("The load harness only runs in DEV or TESTING")
+
+        org = options["org"]
+        if options["seed"]:
+            if Owner.objects.filter(service="github", username=org).exists():
+                raise CommandError(f"{org} is already seeded")
+            self.stdout.write(f"Seeding {org}...")
+            with transaction.atomic():
+                seed_org(
+                    org,
+                    repositories=options["repositories"],
+                    commits=options["commits"],
+                    files=options["files"],
+                    lines=options["lines"],
+                    tests=options["tests"],
+                )
+
+        variables = targets(org)
+        if not variables:
+            raise CommandError(f"{org} isn't seeded, run with --seed")
+        user = Owner.objects.get(service="github", username=member_username(org))
+
+        provider = FakeProvider(
+            latency=options["provider_latency"] / 1000,
+            jitter=options["provider_jitter"] / 1000,
+        )
+        summaries = []
+        with (
+            override_settings(
+                ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"],
+                GRAPHQL_RATE_LIMIT_ENABLED=False,
+                DB_QUERY_BUDGET_RAISE=False,
+            ),
+            patch("services.repo_providers.get_provider", return_value=provider),
+        ):
+            for name, query in load_operations(options["operations"]).items():
+                self.stdout.write(f"Running {name}...")
+                stats = run_operation(
+                    name,
+                    query,
+                    user,
+                    variables,
+                    requests=options["requests"],
+                    concurrency=options["concurrency"],
+                )
+                summaries.append(stats.summary())
+
+        self.stdout.write(format_table(summaries))
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump(summaries, f, indent=2)
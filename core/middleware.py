@@ -1,5 +1,6 @@
 from typing import Optional
 
+from django.conf import settings
 from django.http import HttpRequest
 from django.urls import resolve
 from django.utils.deprecation import MiddlewareMixin
@@ -9,6 +10,9 @@ from django_prometheus.middleware import (
     PrometheusBeforeMiddleware,
 )
 
+from codecov.db.query_budget import QueryCounter, check_query_budget
+from services.io_accounting import io_accounting
+from utils.sampling_profiler import get_sampler
 from utils.services import get_long_service_name
 
 # Prometheus metrics that will be annotated with User-Agent http header as label
@@ -87,3 +91,74 @@ class AppMetricsAfterMiddlewareWithUA(PrometheusAfterMiddleware):
         #     new_labels = {"user_agent": request.headers.get("User-Agent", "none")}
         #     new_labels.update(labels)
         return super().label_metric(metric, request, response=response, **new_labels)
+
+
+def metrics_view_name(request: HttpRequest) -> str:
+    """
+    Name of the view a request is reported under by the per-request metrics,
+    `request.metrics_view_name` when the view sets one (e.g. the GraphQL view
+    uses its operation) or its URL name.
+    """
+    name = getattr(request, "metrics_view_name", None)
+    if name is None:
+        resolver_match = request.resolver_match
+        name = resolver_match.view_name if resolver_match else "unknown"
+    return name
+
+
+class QueryBudgetMiddleware:
+    """
+    Counts the database queries of each request and checks them against the
+    budget of its view (see `codecov.db.query_budget` and `metrics_view_name`).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.DB_QUERY_COUNTING_ENABLED:
+            return self.get_response(request)
+
+        counter = QueryCounter()
+        with counter.installed():
+            response = self.get_response(request)
+
+        check_query_budget(metrics_view_name(request), counter)
+        return response
+
+
+class IOAccountingMiddleware:
+    """
+    Accounts the storage, redis and provider calls of each request and reports
+    them by view (see `services.io_accounting` and `metrics_view_name`).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with io_accounting() as accounting:
+            response = self.get_response(request)
+
+        if accounting is not None:
+            accounting.finish(metrics_view_name(request), response)
+        return response
+
+
+class SamplingProfilerMiddleware:
+    """
+    Has the stack sampler of the worker, when it is running, sample the thread
+    serving each request under its view (see `utils.sampling_profiler` and
+    `metrics_view_name`).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        sampler = get_sampler()
+        if sampler is None:
+            return self.get_response(request)
+
+        with sampler.sampling(request):
+            return self.get_response(request)
@@ -5,6 +5,7 @@ from django.db.models.signals import post_save
 from django.dispatch import receiver
 from shared.django_apps.core.models import Commit
 
+from codecov_auth.authentication.token_cache import invalidate_upload_token
 from core.models import Repository
 from utils.shelter import ShelterPubsub
 
@@ -29,6 +30,15 @@ def update_repository(
         ShelterPubsub.get_instance().publish(data)
 
 
+@receiver(post_save, sender=Repository, dispatch_uid="upload_token_cache_repo")
+def invalidate_repository_upload_token(
+    sender: Type[Repository], instance: Repository, **kwargs: Dict[str, Any]
+) -> None:
+    if kwargs["created"] or instance.tracker.has_changed("upload_token"):
+        invalidate_upload_token(instance.tracker.previous("upload_token"))
+        invalidate_upload_token(instance.upload_token)
+
+
 @receiver(post_save, sender=Commit, dispatch_uid="shelter_sync_commit")
 def update_commit(
     sender: Type[Commit], instance: Commit, **kwargs: Dict[str, Any]
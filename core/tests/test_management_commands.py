@@ -1,3 +1,4 @@
+import json
 import unittest.mock as mock
 from io import StringIO
 
@@ -5,6 +6,7 @@ import pytest
 from django.core.management import call_command
 from shared.config import ConfigHelper
 from shared.django_apps.core.tests.factories import OwnerFactory, RepositoryFactory
+from shared.storage.memory import MemoryStorageService
 
 from services.redis_configuration import get_redis_connection
 
@@ -121,3 +123,39 @@ def test_delete_rate_limit_keys_ip_option():
     # Get rid of lingering keys
     redis.delete("rl-user:1")
     redis.delete("rl-ip:2")
+
+
+# the requests of the load harness are made by other threads, which only see
+# committed data
+@pytest.mark.django_db(transaction=True)
+def test_graphql_load(mock_redis, tmp_path):
+    storage = MemoryStorageService({})
+    output = tmp_path / "results.json"
+
+    with (
+        mock.patch("core.management.commands.graphql_load.RUN_ENV", "TESTING"),
+        mock.patch("shared.api_archive.archive.StorageService", return_value=storage),
+    ):
+        call_command(
+            "graphql_load",
+            stdout=StringIO(),
+            seed=True,
+            repositories=1,
+            commits=2,
+            files=5,
+            tests=10,
+            requests=2,
+            provider_latency=0,
+            output=str(output),
+        )
+
+    summaries = json.loads(output.read_text())
+    assert [summary["operation"] for summary in summaries] == [
+        "CommitPage",
+        "PullImpactedFiles",
+        "RepoList",
+        "TestAnalytics",
+    ]
+    for summary in summaries:
+        assert summary["requests"] == 2, summary
+        assert summary["errors"] == 0, summary
@@ -1,4 +1,21 @@
+from unittest.mock import patch
+
+import fakeredis
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
 from prometheus_client import REGISTRY
+from shared.django_apps.core.tests.factories import OwnerFactory
+
+from codecov.db.query_budget import QueryBudgetExceeded
+from codecov_auth.models import Owner
+from core.middleware import (
+    IOAccountingMiddleware,
+    QueryBudgetMiddleware,
+    SamplingProfilerMiddleware,
+)
+from services.io_accounting import REDIS, accounted_proxy
+from utils.sampling_profiler import StackSampler
 
 
 # TODO: consolidate with worker/helpers/tests/unit/test_checkpoint_logger.py into shared repo
@@ -130,3 +147,114 @@ class PrometheusUserAgentLabelTest(TestCase):
                             or sample.labels["user_agent"] == user_agent
                         )
 """
+
+
+def query_owners(request):
+    for owner in Owner.objects.all():
+        Owner.objects.filter(ownerid=owner.ownerid).first()
+    return HttpResponse()
+
+
+class QueryBudgetMiddlewareTest(TestCase):
+    def setUp(self):
+        OwnerFactory.create_batch(3)
+        self.middleware = QueryBudgetMiddleware(query_owners)
+
+    def _request(self):
+        request = RequestFactory().get("/")
+        request.metrics_view_name = "test-view"
+        return request
+
+    @override_settings(DB_QUERY_REPEAT_THRESHOLD=2)
+    def test_queries_counted(self):
+        counter_assertions = [
+            CounterAssertion(
+                "api_db_queries_per_request_sum", {"view": "test-view"}, 4
+            ),
+            CounterAssertion("api_db_query_repeats_total", {"view": "test-view"}, 1),
+            CounterAssertion(
+                "api_db_query_budget_exceeded_total", {"view": "test-view"}, 0
+            ),
+        ]
+        with CounterAssertionSet(counter_assertions):
+            response = self.middleware(self._request())
+        assert response.status_code == 200
+
+    @override_settings(DB_QUERY_BUDGETS={"test-view": 2})
+    def test_budget_exceeded_raises_in_tests(self):
+        with pytest.raises(QueryBudgetExceeded):
+            self.middleware(self._request())
+
+    @override_settings(DB_QUERY_BUDGETS={"test-view": 2}, DB_QUERY_BUDGET_RAISE=False)
+    @patch("codecov.db.query_budget.log.warning")
+    def test_budget_exceeded_logs(self, log_warning):
+        response = self.middleware(self._request())
+        assert response.status_code == 200
+        assert log_warning.call_args.args == ("Database query budget exceeded",)
+        assert log_warning.call_args.kwargs["extra"]["count"] == 4
+
+    @override_settings(
+        DB_QUERY_COUNTING_ENABLED=False, DB_QUERY_BUDGETS={"test-view": 2}
+    )
+    def test_counting_disabled(self):
+        response = self.middleware(self._request())
+        assert response.status_code == 200
+
+
+def read_redis(request):
+    redis = accounted_proxy(fakeredis.FakeStrictRedis(), REDIS)
+    redis.set("key", "value")
+    redis.get("key")
+    return HttpResponse()
+
+
+class IOAccountingMiddlewareTest(TestCase):
+    def _request(self):
+        request = RequestFactory().get("/")
+        request.metrics_view_name = "test-view"
+        return request
+
+    def test_io_accounted(self):
+        counter_assertions = [
+            CounterAssertion(
+                "api_request_io_calls_sum", {"backend": "redis", "view": "test-view"}, 2
+            ),
+            CounterAssertion(
+                "api_request_io_bytes_sum",
+                {"backend": "redis", "view": "test-view"},
+                16,
+            ),
+        ]
+        with CounterAssertionSet(counter_assertions):
+            response = IOAccountingMiddleware(read_redis)(self._request())
+        assert response["Server-Timing"].startswith("redis;dur=")
+        assert response["Server-Timing"].endswith('desc="2 calls, 16 bytes"')
+
+    @override_settings(IO_ACCOUNTING_ENABLED=False)
+    def test_io_accounting_disabled(self):
+        response = IOAccountingMiddleware(read_redis)(self._request())
+        assert not response.has_header("Server-Timing")
+
+
+class SamplingProfilerMiddlewareTest(TestCase):
+    @patch("core.middleware.get_sampler")
+    def test_request_sampled(self, get_sampler):
+        sampler = StackSampler("/tmp", label=lambda request: "test-view")
+        get_sampler.return_value = sampler
+
+        def sample(request):
+            sampler.sample()
+            return HttpResponse()
+
+        response = SamplingProfilerMiddleware(sample)(RequestFactory().get("/"))
+        assert response.status_code == 200
+        (stack,) = sampler.stacks
+        assert stack.startswith("test-view;")
+        assert stack.endswith(";utils/sampling_profiler.py:StackSampler.sample")
+
+    @patch("core.middleware.get_sampler", return_value=None)
+    def test_sampler_not_running(self, get_sampler):
+        response = SamplingProfilerMiddleware(lambda request: HttpResponse())(
+            RequestFactory().get("/")
+        )
+        assert response.status_code == 200
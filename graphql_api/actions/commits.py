@@ -1,11 +1,18 @@
-from typing import Optional
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional, Tuple
 
-from django.db.models import Prefetch, Q, QuerySet
+from django.db.models import Count, Exists, OuterRef, Prefetch, Q, QuerySet
 from django.db.models.functions import Lower, Substr
 
 from core.models import Commit, Pull, Repository
-from graphql_api.types.enums import CommitStatus
-from reports.models import CommitReport, ReportSession
+from graphql_api.types.enums import CommitStatus, UploadState
+from reports.models import (
+    CommitReport,
+    ReportSession,
+    UploadError,
+    UploadFlagMembership,
+)
 
 
 def pull_commits(pull: Pull) -> QuerySet[Commit]:
@@ -23,11 +30,16 @@ def pull_commits(pull: Pull) -> QuerySet[Commit]:
     return Commit.objects.filter(id__in=subquery).defer("_report")
 
 
-def commit_uploads(commit: Commit) -> QuerySet[ReportSession]:
+def commit_uploads(
+    commit: Commit, filters: Optional[dict] = None
+) -> QuerySet[ReportSession]:
     if not commit.commitreport:
         return ReportSession.objects.none()
 
-    sessions = commit.commitreport.sessions.prefetch_related("flags")
+    # flags and errors are only prefetched for the page of uploads returned
+    sessions = commit.commitreport.sessions.prefetch_related(
+        "flags", Prefetch("errors", queryset=UploadError.objects.order_by("updated_at"))
+    )
 
     # # sessions w/ flags and type 'uploaded'
     # uploaded = sessions.filter(upload_type="uploaded")
@@ -43,38 +55,97 @@ def commit_uploads(commit: Commit) -> QuerySet[ReportSession]:
     #     carried_forward.prefetch_related("flags")
     # )
 
+    filters = filters or {}
+
+    states = filters.get("states")
+    if states:
+        state_filter = Q(state__in=[state.value for state in states])
+        # uploads without a state are errored uploads
+        if UploadState.ERROR in states:
+            state_filter |= Q(state__isnull=True) | Q(state="")
+        sessions = sessions.filter(state_filter)
+
+    upload_types = filters.get("upload_types")
+    if upload_types:
+        sessions = sessions.filter(
+            upload_type__in=[upload_type.value for upload_type in upload_types]
+        )
+
+    flags = filters.get("flags")
+    if flags:
+        sessions = sessions.filter(
+            Exists(
+                UploadFlagMembership.objects.filter(
+                    report_session_id=OuterRef("id"), flag__flag_name__in=flags
+                )
+            )
+        )
+
     return sessions
 
 
-def commit_status(
-    commit: Commit, report_type: CommitReport.ReportType
-) -> Optional[CommitStatus]:
-    report = CommitReport.objects.filter(report_type=report_type, commit=commit).first()
-    if not report:
-        return None
+@dataclass
+class CommitUploadStats:
+    """
+    Upload counts of a commit: the counts by state of the uploads of the (first)
+    report of each report type, and the number of uploads of its coverage report
+    (`commit.commitreport`).
+    """
+
+    states: Dict[Optional[str], Counter] = field(default_factory=dict)
+    total_uploads: int = 0
+
+    def status(self, report_type: CommitReport.ReportType) -> Optional[CommitStatus]:
+        states = self.states.get(report_type)
+        if not states:
+            return None
+
+        # Only care about these 3 states, ignoring fully and partially overwritten
+        # Prioritize returning error over pending
+        if states["error"]:
+            return CommitStatus.ERROR.value
+        if states["uploaded"]:
+            return CommitStatus.PENDING.value
+        return CommitStatus.COMPLETED.value
+
+
+def commit_upload_stats(commit_ids: Iterable[int]) -> Dict[int, CommitUploadStats]:
+    """
+    Upload stats of the given commits, with a single query grouping the uploads
+    of their reports by state.
+    """
+    rows = (
+        CommitReport.objects.filter(commit_id__in=commit_ids)
+        .values("id", "commit_id", "report_type", "code", "sessions__state")
+        .annotate(count=Count("sessions__id"))
+        # any default ordering would be added to the `GROUP BY`
+        .order_by()
+    )
 
-    sessions = report.sessions.all()
-    if not sessions:
-        return None
+    # uploads by state of each report of the commits
+    reports: Dict[int, Tuple[int, Optional[str], Optional[str], Counter]] = {}
+    for row in rows:
+        *_, states = reports.setdefault(
+            row["id"], (row["commit_id"], row["report_type"], row["code"], Counter())
+        )
+        # reports without uploads have a single row, of no state and 0 uploads
+        if row["count"]:
+            states[row["sessions__state"]] += row["count"]
 
-    # Only care about these 3 states, ignoring fully and partially overwritten
-    upload_states = [
-        s.state for s in sessions if s.state in ["processed", "uploaded", "error"]
-    ]
+    stats: Dict[int, CommitUploadStats] = {}
+    with_commitreport = set()
+    # in order of id, like `.first()`, the first report of each type counts
+    for report_id in sorted(reports):
+        commit_id, report_type, code, states = reports[report_id]
+        commit_stats = stats.setdefault(commit_id, CommitUploadStats())
+        commit_stats.states.setdefault(report_type, states)
 
-    has_error, has_pending = False, False
-    for state in upload_states:
-        if state == "error":
-            has_error = True
-        if state == "uploaded":
-            has_pending = True
+        is_coverage = report_type in (None, CommitReport.ReportType.COVERAGE)
+        if is_coverage and code is None and commit_id not in with_commitreport:
+            with_commitreport.add(commit_id)
+            commit_stats.total_uploads = sum(states.values())
 
-    # Prioritize returning error over pending
-    if has_error:
-        return CommitStatus.ERROR.value
-    if has_pending:
-        return CommitStatus.PENDING.value
-    return CommitStatus.COMPLETED.value
+    return stats
 
 
 def repo_commits(
@@ -123,11 +194,11 @@ def repo_commits(
     coverage_status = filters.get("coverage_status")
 
     if coverage_status:
+        stats = commit_upload_stats(queryset.values_list("id", flat=True))
         to_be_included = [
-            commit.id
-            for commit in queryset
-            if commit_status(commit, CommitReport.ReportType.COVERAGE)
-            in coverage_status
+            commit_id
+            for commit_id, commit_stats in stats.items()
+            if commit_stats.status(CommitReport.ReportType.COVERAGE) in coverage_status
         ]
         queryset = queryset.filter(id__in=to_be_included)
 
@@ -6,6 +6,11 @@ from django.db.models import QuerySet
 from shared.django_apps.codecov_auth.models import Owner
 from shared.django_apps.core.models import Repository
 
+from repository_totals.helpers import (
+    with_cached_latest_commit_at,
+    with_cached_recent_coverage,
+)
+
 log = logging.getLogger(__name__)
 
 
@@ -44,8 +49,8 @@ def list_repository_for_owner(
     if exclude_okta_enforced_repos:
         queryset = queryset.exclude_accounts_enforced_okta(okta_account_auths)
 
-    queryset = (
-        queryset.with_recent_coverage().with_latest_commit_at().filter(author=owner)
+    queryset = with_cached_latest_commit_at(
+        with_cached_recent_coverage(queryset.filter(author=owner))
     )
 
     queryset = apply_filters_to_queryset(queryset, filters)
@@ -65,10 +70,8 @@ def search_repos(
     if exclude_okta_enforced_repos:
         queryset = queryset.exclude_accounts_enforced_okta(okta_account_auths)
 
-    queryset = (
-        queryset.with_recent_coverage()
-        .with_latest_commit_at()
-        .filter(author__ownerid__in=authors_from)
+    queryset = with_cached_latest_commit_at(
+        with_cached_recent_coverage(queryset.filter(author__ownerid__in=authors_from))
     )
     queryset = apply_filters_to_queryset(queryset, filters)
     return queryset
@@ -12,6 +12,7 @@ from core.models import Commit
 from graphql_api.types.comparison.comparison import MissingBaseReport, MissingHeadReport
 from reports.models import CommitReport
 from services.bundle_analysis import BundleAnalysisComparison, BundleAnalysisReport
+from services.io_accounting import STORAGE, accounted_proxy
 
 
 def load_bundle_analysis_comparison(
@@ -30,7 +31,7 @@ def load_bundle_analysis_comparison(
         return MissingBaseReport()
 
     loader = BundleAnalysisReportLoader(
-        storage_service=get_appropriate_storage_service(),
+        storage_service=accounted_proxy(get_appropriate_storage_service(), STORAGE),
         repo_key=ArchiveService.get_archive_hash(head_commit.repository),
     )
 
@@ -57,7 +58,7 @@ def load_bundle_analysis_report(
         return MissingHeadReport()
 
     loader = BundleAnalysisReportLoader(
-        storage_service=get_appropriate_storage_service(),
+        storage_service=accounted_proxy(get_appropriate_storage_service(), STORAGE),
         repo_key=ArchiveService.get_archive_hash(commit.repository),
     )
     report = loader.load(report.external_id)
@@ -1,6 +1,8 @@
 from django.db.models import Prefetch
 
+from codecov.db import sync_to_async
 from core.models import Commit
+from graphql_api.actions.commits import CommitUploadStats, commit_upload_stats
 from reports.models import CommitReport
 
 from .loader import BaseLoader
@@ -32,3 +34,15 @@ class CommitLoader(BaseLoader):
             .defer("_report")
             .prefetch_related(prefetch)
         )
+
+
+class CommitUploadStatsLoader(BaseLoader):
+    """
+    Upload stats of commits by id, of all the commits of a batch with a single
+    query.
+    """
+
+    @sync_to_async
+    def batch_load_fn(self, keys):
+        stats = commit_upload_stats(keys)
+        return [stats.get(key, CommitUploadStats()) for key in keys]
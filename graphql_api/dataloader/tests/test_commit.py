@@ -5,7 +5,10 @@ from shared.django_apps.core.tests.factories import (
     RepositoryFactory,
 )
 
-from graphql_api.dataloader.commit import CommitLoader
+from graphql_api.dataloader.commit import CommitLoader, CommitUploadStatsLoader
+from graphql_api.types.enums import CommitStatus
+from reports.models import CommitReport
+from reports.tests.factories import CommitReportFactory, UploadFactory
 
 
 class GraphQLResolveInfo:
@@ -98,3 +101,30 @@ class CommitLoaderTestCase(TransactionTestCase):
         loader = CommitLoader.loader(self.info, self.pulls[2].repository_id)
         commit_2 = await loader.load(self.pulls[2].base)
         assert commit_2 == self.base_commit
+
+
+class CommitUploadStatsLoaderTestCase(TransactionTestCase):
+    def setUp(self):
+        self.repository = RepositoryFactory()
+        self.commits = [CommitFactory(repository=self.repository) for _ in range(3)]
+        report = CommitReportFactory(
+            commit=self.commits[0], report_type=CommitReport.ReportType.COVERAGE
+        )
+        UploadFactory(report=report, state="processed")
+        UploadFactory(report=report, state="uploaded")
+        report = CommitReportFactory(
+            commit=self.commits[1], report_type=CommitReport.ReportType.COVERAGE
+        )
+        UploadFactory(report=report, state="processed")
+        self.info = GraphQLResolveInfo()
+
+    async def test_load_many(self):
+        loader = CommitUploadStatsLoader.loader(self.info)
+        stats = await loader.load_many([commit.id for commit in self.commits])
+
+        assert [s.total_uploads for s in stats] == [2, 1, 0]
+        assert [s.status(CommitReport.ReportType.COVERAGE) for s in stats] == [
+            CommitStatus.PENDING.value,
+            CommitStatus.COMPLETED.value,
+            None,
+        ]
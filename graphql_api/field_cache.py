@@ -0,0 +1,187 @@
+import enum
+import hashlib
+import inspect
+import json
+import logging
+import pickle
+import time
+import zlib
+from typing import Any, Callable, Iterable, Optional
+
+from ariadne import SchemaDirectiveVisitor
+from django.conf import settings
+from graphql import GraphQLResolveInfo, default_field_resolver
+from redis.exceptions import RedisError
+from shared.metrics import Counter, inc_counter
+
+from codecov.db import sync_to_async
+from core.models import Commit
+from services.redis_configuration import get_redis_connection
+
+log = logging.getLogger(__name__)
+
+# not imported, `graphql_api.types` loads the directive from this module
+ERRORS_MODULE = "graphql_api.types.errors.errors"
+
+GQL_FIELD_CACHE_COUNTER = Counter(
+    "api_gql_field_cache_lookups",
+    "Number of cache lookups of immutable commit fields",
+    ["field", "result"],
+)
+
+GQL_FIELD_CACHE_SAVED_SECONDS = Counter(
+    "api_gql_field_cache_saved_seconds",
+    "Time in seconds the cached results of immutable commit fields took to resolve",
+    ["field"],
+)
+
+cache_immutable_directive = """
+    directive @cacheImmutable(
+        ttl: Int
+        bypass: [String!]
+    ) on FIELD_DEFINITION
+"""
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    return str(value)
+
+
+def _bypassed(kwargs: dict, bypass: Iterable[str]) -> bool:
+    """
+    Whether any of the `bypass` arguments, e.g. `filters.components`, is set.
+    """
+    for name in bypass:
+        value = kwargs
+        for part in name.split("."):
+            value = value.get(part) if isinstance(value, dict) else None
+        if value:
+            return True
+    return False
+
+
+def field_cache_key(
+    source: Any, info: GraphQLResolveInfo, kwargs: dict
+) -> Optional[str]:
+    """
+    Cache key of a field of a processed commit, or None when the result of the
+    field may still change.  A processed commit only changes when its report is
+    updated, which bumps its `updatestamp`.
+    """
+    if not isinstance(source, Commit):
+        return None
+    if source.state != Commit.CommitStates.COMPLETE or not source.updatestamp:
+        return None
+
+    args = json.dumps(kwargs, sort_keys=True, default=_json_default)
+    args_digest = hashlib.sha256(args.encode()).hexdigest()
+    return "/".join(
+        (
+            "gql_field",
+            str(source.id),
+            source.updatestamp.isoformat(),
+            f"{info.parent_type.name}.{info.field_name}",
+            args_digest,
+        )
+    )
+
+
+@sync_to_async
+def _get_cached(key: str) -> Optional[tuple[Any, float]]:
+    try:
+        cached = get_redis_connection().get(key)
+    except (OSError, RedisError) as e:
+        log.warning(f"Error connecting to redis: {e}")
+        return None
+    if cached is None:
+        return None
+    return pickle.loads(zlib.decompress(cached))
+
+
+@sync_to_async
+def _set_cached(key: str, value: Any, seconds: float, ttl: int) -> None:
+    try:
+        compressed = zlib.compress(pickle.dumps((value, seconds)))
+    except (pickle.PicklingError, TypeError, AttributeError):
+        log.warning("Field result can't be cached", extra=dict(key=key), exc_info=True)
+        return
+    if len(compressed) > settings.GRAPHQL_FIELD_CACHE_MAX_BYTES:
+        log.info(
+            "Field result too large to be cached",
+            extra=dict(key=key, size=len(compressed)),
+        )
+        return
+    try:
+        get_redis_connection().set(key, compressed, ex=ttl)
+    except (OSError, RedisError) as e:
+        log.warning(f"Error connecting to redis: {e}")
+
+
+def _is_error(value: Any) -> bool:
+    # errors (e.g. a path unknown to the provider) are resolved again
+    return type(value).__module__ == ERRORS_MODULE
+
+
+def cache_immutable(
+    resolve: Callable, ttl: Optional[int] = None, bypass: Iterable[str] = ()
+) -> Callable:
+    """
+    Wraps the resolver of a field of `Commit` (or of a type resolved from the
+    commit, e.g. `CommitCoverageAnalytics`) so that its results are cached in
+    redis for processed commits, by commit, report update, field and arguments.
+    The field is resolved as usual when any of the `bypass` arguments is set.
+    """
+
+    async def resolve_cached(source, info: GraphQLResolveInfo, **kwargs):
+        key = None
+        if settings.GRAPHQL_FIELD_CACHE_ENABLED and not _bypassed(kwargs, bypass):
+            key = field_cache_key(source, info, kwargs)
+
+        if key is None:
+            value = resolve(source, info, **kwargs)
+            if inspect.isawaitable(value):
+                value = await value
+            return value
+
+        field = f"{info.parent_type.name}.{info.field_name}"
+        cached = await _get_cached(key)
+        if cached is not None:
+            value, seconds = cached
+            inc_counter(GQL_FIELD_CACHE_COUNTER, labels=dict(field=field, result="hit"))
+            GQL_FIELD_CACHE_SAVED_SECONDS.labels(field=field).inc(seconds)
+            return value
+
+        inc_counter(GQL_FIELD_CACHE_COUNTER, labels=dict(field=field, result="miss"))
+        start = time.perf_counter()
+        value = resolve(source, info, **kwargs)
+        if inspect.isawaitable(value):
+            value = await value
+        seconds = time.perf_counter() - start
+
+        if not _is_error(value):
+            await _set_cached(
+                key, value, seconds, ttl or settings.GRAPHQL_FIELD_CACHE_TTL_SECONDS
+            )
+        return value
+
+    return resolve_cached
+
+
+class CacheImmutableDirective(SchemaDirectiveVisitor):
+    """
+    `@cacheImmutable` caches the results of a field that only depends on the
+    report of a commit and the field's arguments (see `cache_immutable`):
+
+        totals: CoverageTotals @cacheImmutable
+        pathContents(...): PathContentsResult @cacheImmutable(bypass: ["filters.components"])
+    """
+
+    def visit_field_definition(self, field, object_type):
+        field.resolve = cache_immutable(
+            field.resolve or default_field_resolver,
+            ttl=self.args.get("ttl"),
+            bypass=self.args.get("bypass") or (),
+        )
+        return field
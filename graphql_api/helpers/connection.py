@@ -9,6 +9,7 @@ from django.db.models import QuerySet
 from codecov.commands.exceptions import ValidationError
 from codecov.db import sync_to_async
 from graphql_api.types.enums import OrderingDirection
+from utils.counts import CountMode, count_queryset
 
 
 def build_connection_graphql(connection_name, type_node):
@@ -40,6 +41,9 @@ class Connection:
     queryset: QuerySet
     paginator: CursorPaginator
     page: CursorPage
+    count_mode: CountMode = CountMode.EXACT
+    # the total count when already known, e.g. of prefetched records
+    count: Optional[int] = None
 
     @cached_property
     def edges(self):
@@ -50,7 +54,10 @@ class Connection:
 
     @sync_to_async
     def total_count(self, *args, **kwargs):
-        return self.queryset.count()
+        # only resolved when `totalCount` is selected
+        if self.count is not None:
+            return self.count
+        return count_queryset(self.queryset, self.count_mode)
 
     @cached_property
     def start_cursor(self):
@@ -232,10 +239,14 @@ def queryset_to_connection_sync(
     after=None,
     last=None,
     before=None,
+    count_mode=CountMode.EXACT,
 ):
     """
     A method to take a queryset or an array and return it in paginated order based on the cursor pattern.
     Handles both QuerySets (database queries) and arrays (in-memory data).
+
+    `count_mode` selects how `totalCount` is computed for QuerySets, large connections
+    can use an estimated or cached count instead of a `COUNT(*)` on every request.
     """
     if not first and not last:
         first = 25
@@ -250,7 +261,33 @@ def queryset_to_connection_sync(
         ordering = tuple(field_order(field, ordering_direction) for field in ordering)
         paginator = DictCursorPaginator(data, ordering=ordering)
         page = paginator.page(first=first, after=after, last=last, before=before)
-        return Connection(data, paginator, page)
+        return Connection(data, paginator, page, count_mode=count_mode)
+
+
+def prefetched_to_connection(
+    queryset: QuerySet,
+    records: List[Any],
+    *,
+    ordering=None,
+    ordering_direction=None,
+    first=None,
+    last=None,
+) -> Connection:
+    """
+    The first (or last) page of `queryset` taken from `records`, all of its records
+    in order, e.g. prefetched along with their parent.  The cursors are the ones of
+    `queryset_to_connection_sync` so following pages can be fetched from the queryset.
+    """
+    if not first and not last:
+        first = 25
+
+    ordering = tuple(field_order(field, ordering_direction) for field in ordering)
+    paginator = DictCursorPaginator(queryset, ordering=ordering)
+    if first:
+        page = CursorPage(records[:first], paginator, has_next=len(records) > first)
+    else:
+        page = CursorPage(records[-last:], paginator, has_previous=len(records) > last)
+    return Connection(queryset, paginator, page, count=len(records))
 
 
 @sync_to_async
@@ -7,7 +7,8 @@ from shared.django_apps.core.tests.factories import (
     RepositoryFactory,
 )
 
-from graphql_api.actions.commits import repo_commits
+from graphql_api.actions.commits import commit_upload_stats, repo_commits
+from graphql_api.types.enums import CommitStatus
 from reports.models import CommitReport
 from reports.tests.factories import CommitReportFactory, UploadFactory
 
@@ -135,3 +136,71 @@ class RepoCommitsTests(TransactionTestCase):
 
         commits = repo_commits(self.repo, {"coverage_status": []})
         assert list(commits) == [self.commits[0], self.commits[1], self.commits[2]]
+
+
+class CommitUploadStatsTests(TransactionTestCase):
+    def setUp(self):
+        self.repo = RepositoryFactory()
+        self.commit = CommitFactory(repository=self.repo)
+        self.other_commit = CommitFactory(repository=self.repo)
+
+    def test_no_reports(self):
+        assert commit_upload_stats([self.commit.id]) == {}
+
+    def test_no_uploads(self):
+        CommitReportFactory(
+            commit=self.commit, report_type=CommitReport.ReportType.COVERAGE
+        )
+
+        stats = commit_upload_stats([self.commit.id])[self.commit.id]
+        assert stats.total_uploads == 0
+        assert stats.status(CommitReport.ReportType.COVERAGE) is None
+
+    def test_stats(self):
+        coverage_report = CommitReportFactory(
+            commit=self.commit, report_type=CommitReport.ReportType.COVERAGE
+        )
+        UploadFactory(report=coverage_report, state="processed")
+        UploadFactory(report=coverage_report, state="processed")
+        UploadFactory(report=coverage_report, state="fully_overwritten")
+        # reports of components aren't the coverage report of the commit
+        component_report = CommitReportFactory(
+            commit=self.commit,
+            report_type=CommitReport.ReportType.COVERAGE,
+            code="component",
+        )
+        UploadFactory(report=component_report, state="error")
+        ba_report = CommitReportFactory(
+            commit=self.commit, report_type=CommitReport.ReportType.BUNDLE_ANALYSIS
+        )
+        UploadFactory(report=ba_report, state="error")
+        UploadFactory(report=ba_report, state="uploaded")
+        other_report = CommitReportFactory(commit=self.other_commit)
+        UploadFactory(report=other_report, state="uploaded")
+
+        stats = commit_upload_stats([self.commit.id, self.other_commit.id])
+
+        assert stats[self.commit.id].total_uploads == 3
+        assert (
+            stats[self.commit.id].status(CommitReport.ReportType.COVERAGE)
+            == CommitStatus.COMPLETED.value
+        )
+        assert (
+            stats[self.commit.id].status(CommitReport.ReportType.BUNDLE_ANALYSIS)
+            == CommitStatus.ERROR.value
+        )
+        # reports without a type are coverage reports of older uploads
+        assert stats[self.other_commit.id].total_uploads == 1
+        assert (
+            stats[self.other_commit.id].status(CommitReport.ReportType.COVERAGE) is None
+        )
+
+    def test_single_query(self):
+        for commit in (self.commit, self.other_commit):
+            report = CommitReportFactory(commit=commit)
+            UploadFactory(report=report)
+            UploadFactory(report=report)
+
+        with self.assertNumQueries(1):
+            stats = commit_upload_stats([self.commit.id, self.other_commit.id])
+        assert [s.total_uploads for s in stats.values()] == [2, 2]
@@ -4,6 +4,7 @@ import os
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, PropertyMock, patch
 
+import pytest
 import yaml
 from django.test import TransactionTestCase
 from shared.api_archive.archive import ArchiveService
@@ -18,8 +19,10 @@ from shared.django_apps.core.tests.factories import (
 from shared.reports.types import LineSession
 from shared.storage.memory import MemoryStorageService
 
+from codecov.db.query_budget import QueryBudgetExceeded, QueryCounter
 from compare.models import CommitComparison
 from compare.tests.factories import CommitComparisonFactory
+from graphql_api.actions.commits import commit_upload_stats
 from graphql_api.types.enums import CommitStatus, UploadErrorEnum, UploadState
 from graphql_api.types.enums.enums import UploadType
 from reports.models import CommitReport
@@ -444,6 +447,156 @@ class TestCommit(GraphQLTestHelper, TransactionTestCase):
             {"errorCode": UploadErrorEnum.FILE_NOT_IN_STORAGE.name},
         ]
 
+    def test_fetch_commit_uploads_filters(self):
+        flag_a = RepositoryFlagFactory(flag_name="flag_a")
+        flag_b = RepositoryFlagFactory(flag_name="flag_b")
+        session_a = UploadFactory(
+            report=self.report,
+            upload_type=UploadType.UPLOADED.value,
+            state=UploadState.PROCESSED.value,
+            order_number=0,
+        )
+        UploadFlagMembershipFactory(report_session=session_a, flag=flag_a)
+        UploadFlagMembershipFactory(report_session=session_a, flag=flag_b)
+        session_b = UploadFactory(
+            report=self.report,
+            upload_type=UploadType.CARRIEDFORWARD.value,
+            state=UploadState.PROCESSED.value,
+            order_number=1,
+        )
+        UploadFlagMembershipFactory(report_session=session_b, flag=flag_b)
+        UploadFactory(
+            report=self.report,
+            upload_type=UploadType.UPLOADED.value,
+            state=UploadState.ERROR.value,
+            order_number=2,
+        )
+        UploadFactory(
+            report=self.report,
+            upload_type=UploadType.UPLOADED.value,
+            state="",
+            order_number=3,
+        )
+
+        query = (
+            query_commit
+            % """
+            uploads(filters: $filters) {
+                edges {
+                    node {
+                        id
+                    }
+                }
+            }
+        """
+        ).replace("$commit: String!)", "$commit: String!, $filters: UploadsFilters)")
+
+        def upload_ids(filters):
+            variables = {
+                "org": self.org.username,
+                "repo": self.repo.name,
+                "commit": self.commit.commitid,
+                "filters": filters,
+            }
+            data = self.gql_request(query, variables=variables)
+            uploads = paginate_connection(
+                data["owner"]["repository"]["commit"]["uploads"]
+            )
+            return [upload["id"] for upload in uploads]
+
+        assert upload_ids({}) == [0, 1, 2, 3]
+        assert upload_ids({"states": ["ERROR"]}) == [2, 3]
+        assert upload_ids({"uploadTypes": ["CARRIEDFORWARD"]}) == [1]
+        assert upload_ids({"flags": ["flag_b"]}) == [0, 1]
+        assert upload_ids({"flags": ["flag_a", "flag_b"]}) == [0, 1]
+        assert upload_ids({"flags": ["flag_b"], "uploadTypes": ["UPLOADED"]}) == [0]
+
+    def test_fetch_commit_uploads_ordering(self):
+        for order_number in range(3):
+            UploadFactory(report=self.report, order_number=order_number)
+
+        query = (
+            query_commit
+            % """
+            uploads(ordering: CREATED_AT, orderingDirection: DESC, first: 2) {
+                edges {
+                    node {
+                        id
+                    }
+                }
+                pageInfo {
+                    hasNextPage
+                }
+            }
+        """
+        )
+        variables = {
+            "org": self.org.username,
+            "repo": self.repo.name,
+            "commit": self.commit.commitid,
+        }
+        data = self.gql_request(query, variables=variables)
+        uploads = data["owner"]["repository"]["commit"]["uploads"]
+        assert [edge["node"]["id"] for edge in uploads["edges"]] == [2, 1]
+        assert uploads["pageInfo"]["hasNextPage"] is True
+
+    def test_fetch_commit_uploads_page_queries(self):
+        query = (
+            query_commit
+            % """
+            uploads(first: 5) {
+                totalCount
+                edges {
+                    node {
+                        flags
+                        errors {
+                            totalCount
+                            edges {
+                                node {
+                                    errorCode
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        """
+        )
+
+        flag = RepositoryFlagFactory(repository=self.repo, flag_name="flag")
+
+        def fetch_uploads(uploads):
+            commit = CommitFactory(repository=self.repo)
+            report = CommitReportFactory(commit=commit)
+            for _ in range(uploads):
+                upload = UploadFactory(report=report, state=UploadState.ERROR.value)
+                UploadFlagMembershipFactory(report_session=upload, flag=flag)
+                UploadErrorFactory(report_session=upload)
+
+            counter = QueryCounter()
+            with counter.installed():
+                data = self.gql_request(
+                    query,
+                    variables={
+                        "org": self.org.username,
+                        "repo": self.repo.name,
+                        "commit": commit.commitid,
+                    },
+                )
+            return counter.count, data["owner"]["repository"]["commit"]["uploads"]
+
+        queries, uploads = fetch_uploads(5)
+        assert uploads["totalCount"] == 5
+
+        # flags and errors are fetched for the whole page at once
+        queries_200, uploads = fetch_uploads(200)
+        assert queries_200 == queries
+        assert uploads["totalCount"] == 200
+        assert len(uploads["edges"]) == 5
+        node = uploads["edges"][0]["node"]
+        assert node["flags"] == ["flag"]
+        assert node["errors"]["totalCount"] == 1
+
     def test_yaml_return_default_state_if_default(self):
         org = OwnerFactory(username="default_yaml_owner")
         repo = RepositoryFactory(author=org, private=False)
@@ -2531,6 +2684,64 @@ class TestCommit(GraphQLTestHelper, TransactionTestCase):
         assert commit["coverageStatus"] == CommitStatus.PENDING.value
         assert commit["bundleStatus"] == CommitStatus.PENDING.value
 
+    def test_fetch_commits_upload_stats_constant_queries(self):
+        query = query_commits % "totalUploads coverageStatus bundleStatus"
+
+        def fetch_commits(commits):
+            repo = RepositoryFactory(author=self.org, private=False)
+            for _ in range(commits):
+                report = CommitReportFactory(
+                    commit=CommitFactory(repository=repo),
+                    report_type=CommitReport.ReportType.COVERAGE,
+                )
+                UploadFactory(report=report, state="processed")
+                UploadFactory(report=report, state="error")
+
+            counter = QueryCounter()
+            with counter.installed():
+                data = self.gql_request(
+                    query, variables={"org": self.org.username, "repo": repo.name}
+                )
+            return counter.count, paginate_connection(
+                data["owner"]["repository"]["commits"]
+            )
+
+        queries, commits = fetch_commits(1)
+        assert len(commits) == 1
+
+        queries_100, commits = fetch_commits(100)
+        assert len(commits) == 100
+        assert queries_100 == queries
+        assert commits[0] == {
+            "totalUploads": 2,
+            "coverageStatus": CommitStatus.ERROR.value,
+            "bundleStatus": None,
+        }
+
+    def test_fetch_commits_query_budget(self):
+        def upload_stats_per_commit(keys):
+            stats = {}
+            for key in keys:
+                stats.update(commit_upload_stats([key]))
+            return stats
+
+        repo = RepositoryFactory(author=self.org, private=False)
+        for _ in range(60):
+            CommitFactory(repository=repo)
+
+        # e.g. the upload stats queried for each commit instead of the whole page
+        with (
+            patch(
+                "graphql_api.dataloader.commit.commit_upload_stats",
+                upload_stats_per_commit,
+            ),
+            pytest.raises(QueryBudgetExceeded),
+        ):
+            self.gql_request(
+                query_commits % "totalUploads",
+                variables={"org": self.org.username, "repo": repo.name},
+            )
+
     @patch("graphql_api.dataloader.bundle_analysis.get_appropriate_storage_service")
     def test_bundle_analysis_report_gzip_size_total(self, get_storage_service):
         storage = MemoryStorageService({})
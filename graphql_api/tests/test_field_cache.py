@@ -0,0 +1,144 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import fakeredis
+from asgiref.sync import async_to_sync
+from django.test import TransactionTestCase, override_settings
+from redis.exceptions import ConnectionError
+from shared.django_apps.core.tests.factories import CommitFactory
+
+from core.models import Commit
+from graphql_api.field_cache import cache_immutable, field_cache_key
+from graphql_api.schema import schema
+from graphql_api.types.errors import UnknownPath
+
+TOTALS = {"coverage": 85.0, "files": 3}
+
+
+def info(field_name="totals"):
+    return SimpleNamespace(
+        parent_type=SimpleNamespace(name="CommitCoverageAnalytics"),
+        field_name=field_name,
+    )
+
+
+@override_settings(GRAPHQL_FIELD_CACHE_ENABLED=True)
+class CacheImmutableTestCase(TransactionTestCase):
+    def setUp(self):
+        self.commit = CommitFactory(
+            state=Commit.CommitStates.COMPLETE, updatestamp=datetime(2024, 1, 1)
+        )
+        self.redis = fakeredis.FakeStrictRedis()
+        patcher = patch(
+            "graphql_api.field_cache.get_redis_connection", return_value=self.redis
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def resolve(self, resolver, source=None, field_name="totals", **kwargs):
+        return async_to_sync(resolver)(
+            source or self.commit, info(field_name), **kwargs
+        )
+
+    def test_cached(self):
+        resolve = MagicMock(return_value=TOTALS)
+        resolver = cache_immutable(resolve)
+
+        assert self.resolve(resolver) == TOTALS
+        assert self.resolve(resolver) == TOTALS
+        assert resolve.call_count == 1
+
+        (key,) = self.redis.keys()
+        assert key.decode().startswith(
+            f"gql_field/{self.commit.id}/2024-01-01T00:00:00/CommitCoverageAnalytics.totals/"
+        )
+        assert 0 < self.redis.ttl(key) <= 86400
+
+    def test_cached_by_arguments(self):
+        resolve = MagicMock(return_value=TOTALS)
+        resolver = cache_immutable(resolve, ttl=60)
+
+        self.resolve(resolver, path="a")
+        self.resolve(resolver, path="b")
+        self.resolve(resolver, path="a")
+
+        assert resolve.call_count == 2
+        assert all(0 < self.redis.ttl(key) <= 60 for key in self.redis.keys())
+
+    def test_report_updated(self):
+        resolve = MagicMock(return_value=TOTALS)
+        resolver = cache_immutable(resolve)
+
+        self.resolve(resolver)
+        self.commit.updatestamp += timedelta(minutes=1)
+        self.resolve(resolver)
+
+        assert resolve.call_count == 2
+
+    def test_commit_not_processed(self):
+        commit = CommitFactory(state=Commit.CommitStates.PENDING)
+        resolve = MagicMock(return_value=TOTALS)
+        resolver = cache_immutable(resolve)
+
+        assert field_cache_key(commit, info(), {}) is None
+        self.resolve(resolver, source=commit)
+        self.resolve(resolver, source=commit)
+
+        assert resolve.call_count == 2
+        assert self.redis.keys() == []
+
+    def test_bypass(self):
+        resolve = MagicMock(return_value=TOTALS)
+        resolver = cache_immutable(resolve, bypass=["filters.components"])
+
+        self.resolve(resolver, filters={"components": ["api"]})
+        self.resolve(resolver, filters={"components": ["api"]})
+        assert resolve.call_count == 2
+        assert self.redis.keys() == []
+
+        self.resolve(resolver, filters={"components": [], "flags": ["unit"]})
+        self.resolve(resolver, filters={"components": [], "flags": ["unit"]})
+        assert resolve.call_count == 3
+
+    def test_error_not_cached(self):
+        resolve = MagicMock(return_value=UnknownPath("path does not exist: a"))
+        resolver = cache_immutable(resolve)
+
+        self.resolve(resolver)
+        self.resolve(resolver)
+
+        assert resolve.call_count == 2
+        assert self.redis.keys() == []
+
+    def test_async_resolver(self):
+        async def resolve(commit, info):
+            return TOTALS
+
+        assert self.resolve(cache_immutable(resolve)) == TOTALS
+        assert self.resolve(cache_immutable(resolve)) == TOTALS
+        assert len(self.redis.keys()) == 1
+
+    @override_settings(GRAPHQL_FIELD_CACHE_ENABLED=False)
+    def test_disabled(self):
+        resolve = MagicMock(return_value=TOTALS)
+        resolver = cache_immutable(resolve)
+
+        self.resolve(resolver)
+        self.resolve(resolver)
+
+        assert resolve.call_count == 2
+        assert self.redis.keys() == []
+
+    def test_redis_unavailable(self):
+        self.redis.get = MagicMock(side_effect=ConnectionError())
+        self.redis.set = MagicMock(side_effect=ConnectionError())
+        resolve = MagicMock(return_value=TOTALS)
+
+        assert self.resolve(cache_immutable(resolve)) == TOTALS
+
+    def test_schema_fields(self):
+        analytics = schema.type_map["CommitCoverageAnalytics"]
+        assert analytics.fields["totals"].resolve.__name__ == "resolve_cached"
+        assert analytics.fields["flagNames"].resolve.__name__ == "resolve_cached"
+        assert analytics.fields["components"].resolve.__name__ != "resolve_cached"
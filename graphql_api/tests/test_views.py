@@ -1,13 +1,16 @@
 import json
 from unittest.mock import Mock, patch
 
+import pytest
 from ariadne import ObjectType, gql, make_executable_schema
 from ariadne.validation import cost_directive
 from django.test import RequestFactory, TestCase, override_settings
 from django.urls import ResolverMatch
 from prometheus_client import REGISTRY
+from shared.django_apps.core.tests.factories import OwnerFactory, RepositoryFactory
 
 from codecov.commands.exceptions import Unauthorized
+from codecov.db.query_budget import QueryBudgetExceeded
 
 from ..views import AsyncGraphqlView, QueryMetricsExtension
 from .helper import GraphQLTestHelper
@@ -309,3 +312,63 @@ class AriadneViewTestCase(GraphQLTestHelper, TestCase):
         data = await self.do_query(schema, query=query, variables={})
 
         assert data == {"detail": "Missing required variables: name", "status": 400}
+
+
+query_repository_default_branch = """
+query {
+    me {
+        owner {
+            repo: repository(name: "a") {
+                ... on Repository {
+                    defaultBranch
+                }
+            }
+        }
+    }
+}
+"""
+
+
+class ResolverTimingExtensionTestCase(GraphQLTestHelper, TestCase):
+    paths = [
+        "Query.me",
+        "Query.me.owner",
+        "Query.me.owner.repository",
+        "Me.owner.repository.defaultBranch",
+    ]
+
+    def setUp(self):
+        self.owner = OwnerFactory(username="codecov-user")
+        self.repo = RepositoryFactory(author=self.owner, name="a", branch="main")
+
+    def _timer_counts(self):
+        return [
+            REGISTRY.get_sample_value(
+                "api_gql_timers_resolver_seconds_count", labels={"path": path}
+            )
+            or 0
+            for path in self.paths
+        ]
+
+    @override_settings(GRAPHQL_RESOLVER_TIMING_SAMPLE_RATE=1)
+    def test_resolvers_timed_by_field_path(self):
+        before = self._timer_counts()
+
+        data = self.gql_request(query_repository_default_branch, owner=self.owner)
+        assert data == {"me": {"owner": {"repo": {"defaultBranch": "main"}}}}
+
+        after = self._timer_counts()
+        assert [a - b for a, b in zip(after, before)] == [1, 1, 1, 1]
+
+    @override_settings(GRAPHQL_RESOLVER_TIMING_SAMPLE_RATE=0)
+    def test_resolvers_not_sampled(self):
+        before = self._timer_counts()
+
+        self.gql_request(query_repository_default_branch, owner=self.owner)
+
+        assert self._timer_counts() == before
+
+    @override_settings(DB_QUERY_BUDGETS={"graphql.me": 0})
+    def test_query_budget_of_operation(self):
+        with pytest.raises(QueryBudgetExceeded):
+            self.gql_request(query_repository_default_branch, owner=self.owner)
@@ -1,6 +1,7 @@
 from ariadne.validation import cost_directive
 from ariadne_django.scalars import datetime_scalar
 
+from ..field_cache import cache_immutable_directive
 from ..helpers.ariadne import ariadne_load_local_graphql
 from .account import account, account_bindable
 from .branch import branch, branch_bindable
@@ -94,6 +95,7 @@ types = [
     bundle_analysis_comparison,
     bundle_analysis_report,
     bundle_analysis,
+    cache_immutable_directive,
     commit_file,
     commit,
     comparison,
@@ -15,14 +15,14 @@ import services.components as components_service
 import services.path as path_service
 from codecov.db import sync_to_async
 from core.models import Commit
-from graphql_api.actions.commits import commit_status, commit_uploads
+from graphql_api.actions.commits import commit_uploads
 from graphql_api.actions.comparison import validate_commit_comparison
 from graphql_api.actions.path_contents import sort_path_contents
 from graphql_api.dataloader.bundle_analysis import (
     load_bundle_analysis_comparison,
     load_bundle_analysis_report,
 )
-from graphql_api.dataloader.commit import CommitLoader
+from graphql_api.dataloader.commit import CommitLoader, CommitUploadStatsLoader
 from graphql_api.dataloader.comparison import ComparisonLoader
 from graphql_api.dataloader.owner import OwnerLoader
 from graphql_api.helpers.connection import (
@@ -37,6 +37,7 @@ from graphql_api.types.enums import (
     CommitStatus,
     OrderingDirection,
     PathContentDisplayType,
+    UploadOrdering,
 )
 from graphql_api.types.errors import MissingCoverage, UnknownPath
 from graphql_api.types.errors.errors import UnknownFlags
@@ -91,15 +92,37 @@ async def resolve_yaml_state(commit: Commit, info) -> YamlStates:
 
 
 @commit_bindable.field("uploads")
+async def resolve_list_uploads(
+    commit: Commit,
+    info,
+    filters=None,
+    ordering=UploadOrdering.ID,
+    ordering_direction=OrderingDirection.ASC,
+    **kwargs,
+):
+    if not kwargs and not filters:
+        # temp to override kwargs -> return all current uploads
+        stats = await CommitUploadStatsLoader.loader(info).load(commit.id)
+        kwargs["first"] = stats.total_uploads
+
+    return await _list_uploads(commit, filters, ordering, ordering_direction, **kwargs)
+
+
 @sync_to_async
-def resolve_list_uploads(commit: Commit, info, **kwargs):
-    queryset = commit_uploads(commit)
+def _list_uploads(commit: Commit, filters, ordering, ordering_direction, **kwargs):
+    queryset = commit_uploads(commit, filters)
 
     if not kwargs:  # temp to override kwargs -> return all current uploads
         kwargs["first"] = queryset.count()
 
     return queryset_to_connection_sync(
-        queryset, ordering=("id",), ordering_direction=OrderingDirection.ASC, **kwargs
+        queryset,
+        # `id` breaks the ties of uploads created or updated at the same time
+        ordering=(ordering,)
+        if ordering == UploadOrdering.ID
+        else (ordering, UploadOrdering.ID),
+        ordering_direction=ordering_direction,
+        **kwargs,
     )
 
 
@@ -338,22 +361,22 @@ async def resolve_errors(commit, info, error_type):
 
 @commit_bindable.field("totalUploads")
 async def resolve_total_uploads(commit, info):
-    command = info.context["executor"].get_command("commit")
-    return await command.get_uploads_number(commit)
+    stats = await CommitUploadStatsLoader.loader(info).load(commit.id)
+    return stats.total_uploads
 
 
 @sentry_sdk.trace
 @commit_bindable.field("bundleStatus")
-@sync_to_async
-def resolve_bundle_status(commit: Commit, info) -> Optional[CommitStatus]:
-    return commit_status(commit, CommitReport.ReportType.BUNDLE_ANALYSIS)
+async def resolve_bundle_status(commit: Commit, info) -> Optional[CommitStatus]:
+    stats = await CommitUploadStatsLoader.loader(info).load(commit.id)
+    return stats.status(CommitReport.ReportType.BUNDLE_ANALYSIS)
 
 
 @sentry_sdk.trace
 @commit_bindable.field("coverageStatus")
-@sync_to_async
-def resolve_coverage_status(commit: Commit, info) -> Optional[CommitStatus]:
-    return commit_status(commit, CommitReport.ReportType.COVERAGE)
+async def resolve_coverage_status(commit: Commit, info) -> Optional[CommitStatus]:
+    stats = await CommitUploadStatsLoader.loader(info).load(commit.id)
+    return stats.status(CommitReport.ReportType.COVERAGE)
 
 
 @commit_bindable.field("coverageAnalytics")
@@ -382,7 +405,7 @@ def resolve_coverage_totals(
 @commit_coverage_analytics_bindable.field("flagNames")
 @sync_to_async
 def resolve_coverage_flags(commit: Commit, info: GraphQLResolveInfo) -> List[str]:
-    return commit.full_report.flags.keys()
+    return list(commit.full_report.flags.keys())
 
 
 @sentry_sdk.trace
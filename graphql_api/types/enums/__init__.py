@@ -17,6 +17,7 @@ from .enums import (
     TestResultsOrderingParameter,
     TypeProjectOnboarding,
     UploadErrorEnum,
+    UploadOrdering,
     UploadState,
     UploadType,
 )
@@ -40,6 +41,7 @@ __all__ = [
     "TestResultsOrderingParameter",
     "TypeProjectOnboarding",
     "UploadErrorEnum",
+    "UploadOrdering",
     "UploadState",
     "UploadType",
 ]
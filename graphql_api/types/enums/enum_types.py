@@ -26,6 +26,7 @@ from .enums import (
     TestResultsOrderingParameter,
     TypeProjectOnboarding,
     UploadErrorEnum,
+    UploadOrdering,
     UploadState,
     UploadType,
 )
@@ -41,6 +42,7 @@ enum_types = [
     EnumType("PullRequestState", PullRequestState),
     EnumType("UploadState", UploadState),
     EnumType("UploadType", UploadType),
+    EnumType("UploadOrdering", UploadOrdering),
     EnumType("UploadErrorEnum", UploadErrorEnum),
     EnumType("MeasurementInterval", MeasurementInterval),
     EnumType("LoginProvider", LoginProvider),
@@ -86,6 +86,12 @@ class UploadType(enum.Enum):
     CARRIEDFORWARD = "carriedforward"
 
 
+class UploadOrdering(enum.Enum):
+    ID = "id"
+    CREATED_AT = "created_at"
+    UPDATED_AT = "updated_at"
+
+
 UploadErrorEnum = SharedUploadErrorCode
 
 
@@ -24,6 +24,7 @@ from graphql_api.types.enums import OrderingDirection
 from graphql_api.types.errors.errors import NotFoundError, OwnerNotActivatedError
 from services.profiling import CriticalFile, ProfilingSummary
 from services.redis_configuration import get_redis_connection
+from utils.counts import CountMode
 
 TOKEN_UNAVAILABLE = "Token Unavailable. Please contact your admin."
 
@@ -104,6 +105,7 @@ async def resolve_pulls(
     return await queryset_to_connection(
         queryset,
         ordering=("pullid",),
+        count_mode=CountMode.CACHED,
         ordering_direction=ordering_direction,
         **kwargs,
     )
@@ -117,6 +119,7 @@ async def resolve_commits(
     connection = await queryset_to_connection(
         queryset,
         ordering=("timestamp",),
+        count_mode=CountMode.CACHED,
         ordering_direction=OrderingDirection.DESC,
         **kwargs,
     )
@@ -139,6 +142,7 @@ async def resolve_branches(
     return await queryset_to_connection(
         queryset,
         ordering=("updatestamp",),
+        count_mode=CountMode.CACHED,
         ordering_direction=OrderingDirection.DESC,
         **kwargs,
     )
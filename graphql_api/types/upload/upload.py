@@ -5,7 +5,10 @@ from django.urls import reverse
 from shared.django_apps.utils.services import get_short_service_name
 
 from codecov.db import sync_to_async
-from graphql_api.helpers.connection import queryset_to_connection
+from graphql_api.helpers.connection import (
+    prefetched_to_connection,
+    queryset_to_connection,
+)
 from graphql_api.types.enums import (
     OrderingDirection,
     UploadErrorEnum,
@@ -46,6 +49,21 @@ def resolve_upload_type(upload, info) -> UploadType:
 async def resolve_errors(report_session, info, **kwargs):
     command = info.context["executor"].get_command("upload")
     queryset = await command.get_upload_errors(report_session)
+
+    # errors prefetched along with the page of uploads (see `commit_uploads`)
+    prefetched = getattr(report_session, "_prefetched_objects_cache", {}).get("errors")
+    if prefetched is not None:
+        errors = (
+            list(prefetched) if report_session.state == UploadState.ERROR.value else []
+        )
+        return prefetched_to_connection(
+            queryset,
+            errors,
+            ordering=("updated_at",),
+            ordering_direction=OrderingDirection.ASC,
+            **kwargs,
+        )
+
     result = await queryset_to_connection(
         queryset,
         ordering=("updated_at",),
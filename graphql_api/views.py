@@ -1,13 +1,17 @@
 import json
 import logging
 import os
+import random
 import socket
 import time
 from asyncio import iscoroutine
-from typing import Any, Collection, Optional
+from contextlib import nullcontext
+from inspect import isawaitable
+from typing import Any, Collection, Dict, Optional, Tuple
 
 import regex
 from ariadne import format_error
+from ariadne.contrib.tracing.utils import should_trace
 from ariadne.types import Extension
 from ariadne.validation import cost_validator
 from ariadne_django.views import GraphQLAsyncView
@@ -17,15 +21,18 @@ from django.http import (
     HttpResponseNotAllowed,
     JsonResponse,
 )
-from graphql import DocumentNode
+from graphql import DocumentNode, GraphQLResolveInfo
 from sentry_sdk import capture_exception
 from shared.metrics import Counter, Histogram, inc_counter
 
 from codecov.commands.exceptions import BaseException
 from codecov.commands.executor import get_executor_from_request
 from codecov.db import sync_to_async
+from core.middleware import metrics_view_name
 from services import ServiceException
+from services.io_accounting import io_accounting
 from services.redis_configuration import get_redis_connection
+from utils.sampling_profiler import get_sampler
 
 from .schema import schema
 from .validation import (
@@ -56,6 +63,13 @@ GQL_REQUEST_LATENCIES = Histogram(
     buckets=[0.05, 0.1, 0.25, 0.5, 0.75, 1, 2, 5, 10, 30],
 )
 
+GQL_RESOLVER_LATENCIES = Histogram(
+    "api_gql_timers_resolver_seconds",
+    "Runtime in seconds of a resolver, including the time awaiting its dataloaders",
+    ["path"],
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10],
+)
+
 GQL_REQUEST_MADE_COUNTER = Counter(
     "api_gql_requests_made",
     "Total API GQL requests made",
@@ -152,6 +166,84 @@ class QueryMetricsExtension(Extension):
         ).inc(len(errors))
 
 
+class ResolverTimingExtension(Extension):
+    """
+    Times the resolvers of a sample of the requests (see
+    `GRAPHQL_RESOLVER_TIMING_SAMPLE_RATE`), by normalized field path.
+
+    The path of a field is made of its last `PATH_DEPTH` field names, without
+    aliases nor list indices, following the type they belong to:
+        ex: the `impactedFiles` resolver of
+            "{ owner { repository { pull { compareWithBase { impactedFiles"
+            is timed as `Repository.pull.compareWithBase.impactedFiles`
+    Default resolvers (plain attributes) and introspection fields aren't timed.
+    """
+
+    PATH_DEPTH = 3
+
+    def __init__(self):
+        self.sampled = False
+        # (type name, field name) segments of the fields resolved so far, by
+        # response path without list indices
+        self.segments: Dict[Tuple[str, ...], Tuple[Tuple[str, str], ...]] = {}
+
+    def request_started(self, context):
+        self.sampled = random.random() < settings.GRAPHQL_RESOLVER_TIMING_SAMPLE_RATE
+
+    def field_path(self, info: GraphQLResolveInfo) -> str:
+        key = tuple(k for k in info.path.as_list() if isinstance(k, str))
+        segments = self.segments.get(key[:-1], ()) + (
+            (info.parent_type.name, info.field_name),
+        )
+        segments = segments[-self.PATH_DEPTH :]
+        self.segments[key] = segments
+        return ".".join([segments[0][0]] + [field for _, field in segments])
+
+    def resolve(self, next_, obj, info: GraphQLResolveInfo, **kwargs):
+        if not self.sampled:
+            return next_(obj, info, **kwargs)
+
+        path = self.field_path(info)
+        if not should_trace(info):
+            return next_(obj, info, **kwargs)
+
+        start = time.perf_counter()
+        result = next_(obj, info, **kwargs)
+        if isawaitable(result):
+            return self.resolve_async(result, path, start)
+        GQL_RESOLVER_LATENCIES.labels(path=path).observe(time.perf_counter() - start)
+        return result
+
+    async def resolve_async(self, result, path: str, start: float):
+        try:
+            return await result
+        finally:
+            GQL_RESOLVER_LATENCIES.labels(path=path).observe(
+                time.perf_counter() - start
+            )
+
+
+class MetricsViewNameExtension(Extension):
+    """
+    Has the per-request metrics of a GraphQL request, e.g. its database queries
+    counted against a budget, reported under its operation, `graphql.<operation
+    name>`, instead of the GraphQL view (see `core.middleware.metrics_view_name`).
+    Unnamed operations are named after their top-level field, like
+    `QueryMetricsExtension` does.
+    """
+
+    def __init__(self):
+        self.named = False
+
+    def resolve(self, next_, obj, info: GraphQLResolveInfo, **kwargs):
+        if not self.named:
+            self.named = True
+            operation = info.operation
+            name = operation.name.value if operation.name else info.field_name
+            info.context["request"].metrics_view_name = f"graphql.{name}"
+        return next_(obj, info, **kwargs)
+
+
 class RequestFinalizer:
     """
     A context manager class used as a teardown step after the GraphQL request is fully handled.
@@ -193,7 +285,11 @@ class RequestFinalizer:
 
 class AsyncGraphqlView(GraphQLAsyncView):
     schema = schema
-    extensions = [QueryMetricsExtension]
+    extensions = [
+        QueryMetricsExtension,
+        ResolverTimingExtension,
+        MetricsViewNameExtension,
+    ]
     introspection = settings.GRAPHQL_INTROSPECTION_ENABLED
 
     def get_validation_rules(
@@ -229,6 +325,18 @@ class AsyncGraphqlView(GraphQLAsyncView):
         return HttpResponseNotAllowed(["POST"])
 
     async def post(self, request, *args, **kwargs):
+        # the resolvers run in the thread of the event loop, which is sampled
+        # instead of the one of `SamplingProfilerMiddleware` waiting for it
+        sampler = get_sampler()
+        sampling = sampler.sampling(request) if sampler else nullcontext()
+        # already accounted by `IOAccountingMiddleware` unless served without it
+        with io_accounting() as accounting, sampling:
+            response = await self._post(request, *args, **kwargs)
+        if accounting is not None:
+            accounting.finish(metrics_view_name(request), response)
+        return response
+
+    async def _post(self, request, *args, **kwargs):
         await self._get_user(request)
         # get request body information for logging
         req_body = json.loads(request.body.decode("utf-8")) if request.body else {}
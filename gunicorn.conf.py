@@ -10,6 +10,29 @@ def child_exit(server, worker):
         multiprocess.mark_process_dead(worker.pid)
 
 
+def post_worker_init(worker):
+    from django.conf import settings
+
+    if settings.SAMPLING_PROFILER_ENABLED:
+        from core.middleware import metrics_view_name
+        from utils.sampling_profiler import StackSampler, start_sampler
+
+        start_sampler(
+            StackSampler(
+                settings.SAMPLING_PROFILER_DIR,
+                label=metrics_view_name,
+                interval=settings.SAMPLING_PROFILER_INTERVAL,
+                flush_interval=settings.SAMPLING_PROFILER_FLUSH_INTERVAL,
+            )
+        )
+
+
+def worker_exit(server, worker):
+    from utils.sampling_profiler import stop_sampler
+
+    stop_sampler()
+
+
 class CustomGunicornLogger(Logger):
     """
     A custom class for logging gunicorn startup logs, these are for the logging that takes
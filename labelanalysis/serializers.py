@@ -18,7 +18,7 @@ class CommitFromShaSerializerField(serializers.Field):
 
     def to_internal_value(self, commit_sha):
         commit = Commit.objects.filter(
-            repository__in=self.context["request"].auth.get_repositories(),
+            repository__in=self.context["request"].auth.get_repositories_queryset(),
             commitid=commit_sha,
         ).first()
         if commit is None:
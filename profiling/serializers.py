@@ -10,7 +10,7 @@ class CreatableProfilingCommitRelatedField(serializers.SlugRelatedField):
         # of sending data to multiple repos, because of
         # the uniqueness of (repoid, code) pair
         return ProfilingCommit.objects.filter(
-            repository__in=self.context["request"].auth.get_repositories()
+            repository__in=self.context["request"].auth.get_repositories_queryset()
         )
 
 
@@ -25,7 +25,7 @@ class ProfilingUploadCreateView(CreateAPIView):
 
     def perform_create(self, serializer):
         location = "{}.txt".format(uuid4())
-        repository = self.request.auth.get_repositories()[0]
+        repository = self.request.auth.get_repository()
         archive_service = ArchiveService(repository)
         path = MinioEndpoints.profiling_upload.get_path(
             version="v4",
@@ -48,7 +48,7 @@ class ProfilingCommitCreateView(CreateAPIView):
 
     def perform_create(self, serializer):
         code = serializer.validated_data["code"]
-        repository = self.request.auth.get_repositories()[0]
+        repository = self.request.auth.get_repository()
         instance, was_created = ProfilingCommit.objects.get_or_create(
             code=code, repository=repository
         )
@@ -0,0 +1,5 @@
+from django.apps import AppConfig
+
+
+class RepositoryTotalsConfig(AppConfig):
+    name = "repository_totals"
@@ -0,0 +1,80 @@
+from datetime import datetime
+
+from django.db.models import F, FilteredRelation, FloatField, Q, QuerySet, Value
+from django.db.models.functions import Coalesce
+
+from core.models import DateTimeWithoutTZField
+
+
+def _with_current_branch_totals(queryset: QuerySet) -> QuerySet:
+    """
+    Joins the denormalized totals of each repository's default branch.  Totals
+    recorded for a previous default branch are ignored.
+    """
+    if "current_branch_totals" in queryset.query._filtered_relations:
+        return queryset
+    return queryset.annotate(
+        current_branch_totals=FilteredRelation(
+            "branch_totals", condition=Q(branch_totals__branch=F("branch"))
+        )
+    )
+
+
+def with_cached_recent_coverage(queryset: QuerySet) -> QuerySet:
+    """
+    Same annotations as `RepositoryQuerySet.with_recent_coverage` but read from
+    `RepositoryBranchTotals` instead of a subquery over each repo's commits.
+    """
+    queryset = _with_current_branch_totals(queryset)
+    return queryset.annotate(
+        recent_commit_totals=F("current_branch_totals__totals"),
+        coverage_sha=F("current_branch_totals__commitid"),
+        recent_coverage=F("current_branch_totals__coverage"),
+        # NULL coverage is defaulted to -1 so repos without coverage are ordered last
+        coverage=Coalesce(
+            F("current_branch_totals__coverage"),
+            Value(-1),
+            output_field=FloatField(),
+        ),
+        hits=F("current_branch_totals__hits"),
+        misses=F("current_branch_totals__misses"),
+        lines=F("current_branch_totals__lines"),
+    )
+
+
+def with_cached_latest_commit_at(queryset: QuerySet) -> QuerySet:
+    """
+    Same annotations as `RepositoryQuerySet.with_latest_commit_at` but read from
+    `RepositoryBranchTotals`, i.e. the timestamp of the latest complete commit
+    on the default branch.
+    """
+    queryset = _with_current_branch_totals(queryset)
+    return queryset.annotate(
+        true_latest_commit_at=F("current_branch_totals__latest_commit_at"),
+        # NULL dates are defaulted to an old date so repos without commits are ordered last
+        latest_commit_at=Coalesce(
+            F("current_branch_totals__latest_commit_at"),
+            Value(datetime(1900, 1, 1)),
+            output_field=DateTimeWithoutTZField(),
+        ),
+    )
+
+
+def with_cached_latest_commit_totals(queryset: QuerySet) -> QuerySet:
+    """
+    Same annotations as `RepositoryQuerySet.with_latest_commit_totals_before` (for
+    the default branch, as of now) and `with_latest_coverage_change` but read from
+    `RepositoryBranchTotals`.  The numeric columns are annotated as well so they
+    can be used for sorting.
+    """
+    queryset = _with_current_branch_totals(queryset)
+    return queryset.annotate(
+        latest_commit_totals=F("current_branch_totals__totals"),
+        latest_coverage_change=F("current_branch_totals__coverage")
+        - F("current_branch_totals__previous_coverage"),
+        latest_commit_coverage=F("current_branch_totals__coverage"),
+        latest_commit_lines=F("current_branch_totals__lines"),
+        latest_commit_hits=F("current_branch_totals__hits"),
+        latest_commit_misses=F("current_branch_totals__misses"),
+        latest_commit_partials=F("current_branch_totals__partials"),
+    )
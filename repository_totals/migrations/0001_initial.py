@@ -0,0 +1,171 @@
+# Generated by Django 4.2.16 on 2026-10-19 12:00
+
+import django.db.models.deletion
+import django_prometheus.models
+from django.db import migrations, models
+from shared.django_apps.migration_utils import RiskyRunSQL
+
+import core.models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("core", "0046_repository_coverage_enabled"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RepositoryBranchTotals",
+            fields=[
+                (
+                    "repository",
+                    models.OneToOneField(
+                        db_column="repoid",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="branch_totals",
+                        serialize=False,
+                        to="core.repository",
+                    ),
+                ),
+                ("branch", models.TextField()),
+                ("commitid", models.TextField()),
+                ("totals", models.JSONField(null=True)),
+                ("coverage", models.FloatField(null=True)),
+                ("lines", models.IntegerField(null=True)),
+                ("hits", models.IntegerField(null=True)),
+                ("misses", models.IntegerField(null=True)),
+                ("partials", models.IntegerField(null=True)),
+                ("latest_commit_at", core.models.DateTimeWithoutTZField(null=True)),
+                ("previous_coverage", models.FloatField(null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "repository_branch_totals",
+                "indexes": [
+                    models.Index(
+                        fields=["coverage"], name="repo_branch_totals_coverage"
+                    ),
+                    models.Index(fields=["lines"], name="repo_branch_totals_lines"),
+                    models.Index(fields=["hits"], name="repo_branch_totals_hits"),
+                    models.Index(fields=["misses"], name="repo_branch_totals_misses"),
+                    models.Index(
+                        fields=["partials"], name="repo_branch_totals_partials"
+                    ),
+                    models.Index(
+                        fields=["latest_commit_at"],
+                        name="repo_branch_totals_commit_at",
+                    ),
+                ],
+            },
+            bases=(
+                django_prometheus.models.ExportModelOperationsMixin(
+                    "repository_totals.repository_branch_totals"
+                ),
+                models.Model,
+            ),
+        ),
+        # keeps `repository_branch_totals` in sync with the latest complete commit
+        # of each repository's default branch, commits are completed by the worker
+        # so this can't be done from Django signals
+        migrations.RunSQL(
+            """
+            create or replace function repository_branch_totals_update()
+            returns trigger as $$
+            begin
+                if new.state = 'complete'
+                    and new.totals is not null
+                    and new.branch = (select branch from repos where repoid = new.repoid)
+                then
+                    insert into repository_branch_totals as t (
+                        repoid, branch, commitid, totals, coverage, lines, hits,
+                        misses, partials, latest_commit_at, previous_coverage, updated_at
+                    )
+                    values (
+                        new.repoid,
+                        new.branch,
+                        new.commitid,
+                        new.totals,
+                        (new.totals->>'c')::float,
+                        (new.totals->>'n')::numeric::integer,
+                        (new.totals->>'h')::numeric::integer,
+                        (new.totals->>'m')::numeric::integer,
+                        (new.totals->>'p')::numeric::integer,
+                        new.timestamp,
+                        null,
+                        now()
+                    )
+                    on conflict (repoid) do update set
+                        previous_coverage = case
+                            when t.branch <> excluded.branch then null
+                            when t.commitid = excluded.commitid then t.previous_coverage
+                            else t.coverage
+                        end,
+                        branch = excluded.branch,
+                        commitid = excluded.commitid,
+                        totals = excluded.totals,
+                        coverage = excluded.coverage,
+                        lines = excluded.lines,
+                        hits = excluded.hits,
+                        misses = excluded.misses,
+                        partials = excluded.partials,
+                        latest_commit_at = excluded.latest_commit_at,
+                        updated_at = excluded.updated_at
+                    where t.branch <> excluded.branch
+                        or t.latest_commit_at is null
+                        or t.latest_commit_at <= excluded.latest_commit_at;
+                end if;
+                return null;
+            end;
+            $$ language plpgsql;
+
+            create trigger commits_update_repository_branch_totals
+            after insert or update of state, totals, branch on commits
+            for each row execute function repository_branch_totals_update();
+            """,
+            reverse_sql="""
+            drop trigger if exists commits_update_repository_branch_totals on commits;
+            drop function if exists repository_branch_totals_update();
+            """,
+        ),
+        RiskyRunSQL(
+            """
+            insert into repository_branch_totals (
+                repoid, branch, commitid, totals, coverage, lines, hits,
+                misses, partials, latest_commit_at, previous_coverage, updated_at
+            )
+            select
+                repoid,
+                branch,
+                commitid,
+                totals,
+                (totals->>'c')::float,
+                (totals->>'n')::numeric::integer,
+                (totals->>'h')::numeric::integer,
+                (totals->>'m')::numeric::integer,
+                (totals->>'p')::numeric::integer,
+                timestamp,
+                previous_coverage,
+                now()
+            from (
+                select
+                    c.repoid,
+                    c.branch,
+                    c.commitid,
+                    c.totals,
+                    c.timestamp,
+                    row_number() over w as commit_rank,
+                    lead((c.totals->>'c')::float) over w as previous_coverage
+                from commits c
+                inner join repos r on r.repoid = c.repoid and r.branch = c.branch
+                where c.state = 'complete' and c.totals is not null
+                window w as (partition by c.repoid order by c.timestamp desc)
+            ) ranked_commits
+            where commit_rank = 1
+            on conflict (repoid) do nothing;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 4.2.16 on 2026-10-19 12:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("repository_totals", "0001_initial"),
+    ]
+
+    operations = [
+        # rebuilds the totals of a repository from the latest complete commit of
+        # its new default branch when it changes (e.g. master -> main), like the
+        # backfill of the initial migration
+        migrations.RunSQL(
+            """
+            create or replace function repository_branch_totals_rebuild()
+            returns trigger as $$
+            begin
+                delete from repository_branch_totals where repoid = new.repoid;
+
+                insert into repository_branch_totals (
+                    repoid, branch, commitid, totals, coverage, lines, hits,
+                    misses, partials, latest_commit_at, previous_coverage, updated_at
+                )
+                select
+                    repoid,
+                    branch,
+                    commitid,
+                    totals,
+                    (totals->>'c')::float,
+                    (totals->>'n')::numeric::integer,
+                    (totals->>'h')::numeric::integer,
+                    (totals->>'m')::numeric::integer,
+                    (totals->>'p')::numeric::integer,
+                    timestamp,
+                    previous_coverage,
+                    now()
+                from (
+                    select
+                        c.repoid,
+                        c.branch,
+                        c.commitid,
+                        c.totals,
+                        c.timestamp,
+                        lead((c.totals->>'c')::float) over (
+                            order by c.timestamp desc
+                        ) as previous_coverage
+                    from commits c
+                    where c.repoid = new.repoid
+                        and c.branch = new.branch
+                        and c.state = 'complete'
+                        and c.totals is not null
+                    order by c.timestamp desc
+                    limit 1
+                ) latest_commit;
+
+                return null;
+            end;
+            $$ language plpgsql;
+
+            create trigger repos_update_repository_branch_totals
+            after update of branch on repos
+            for each row when (old.branch is distinct from new.branch)
+            execute function repository_branch_totals_rebuild();
+            """,
+            reverse_sql="""
+            drop trigger if exists repos_update_repository_branch_totals on repos;
+            drop function if exists repository_branch_totals_rebuild();
+            """,
+        ),
+    ]
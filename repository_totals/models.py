@@ -0,0 +1,57 @@
+from django.db import models
+from django_prometheus.models import ExportModelOperationsMixin
+
+from core.models import DateTimeWithoutTZField, Repository
+
+
+class RepositoryBranchTotals(
+    ExportModelOperationsMixin("repository_totals.repository_branch_totals"),
+    models.Model,
+):
+    """
+    Totals of the latest complete commit on a repository's default branch.
+    This is a denormalization of the `commits` table so that listing and sorting
+    repositories by coverage doesn't need a subquery over each repo's commits.
+    Rows are maintained by a trigger on `commits` whenever a commit on the
+    default branch completes (see the initial migration), and rebuilt by a
+    trigger on `repos` when the default branch changes.
+    """
+
+    repository = models.OneToOneField(
+        Repository,
+        db_column="repoid",
+        primary_key=True,
+        on_delete=models.CASCADE,
+        related_name="branch_totals",
+    )
+
+    # default branch at the time the totals were recorded, rows whose branch
+    # doesn't match the repository's current default branch are stale
+    branch = models.TextField()
+    commitid = models.TextField()
+    totals = models.JSONField(null=True)
+
+    coverage = models.FloatField(null=True)
+    lines = models.IntegerField(null=True)
+    hits = models.IntegerField(null=True)
+    misses = models.IntegerField(null=True)
+    partials = models.IntegerField(null=True)
+    latest_commit_at = DateTimeWithoutTZField(null=True)
+
+    # coverage of the commit preceding `commitid` on the same branch
+    previous_coverage = models.FloatField(null=True)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "repository_branch_totals"
+        indexes = [
+            models.Index(fields=["coverage"], name="repo_branch_totals_coverage"),
+            models.Index(fields=["lines"], name="repo_branch_totals_lines"),
+            models.Index(fields=["hits"], name="repo_branch_totals_hits"),
+            models.Index(fields=["misses"], name="repo_branch_totals_misses"),
+            models.Index(fields=["partials"], name="repo_branch_totals_partials"),
+            models.Index(
+                fields=["latest_commit_at"], name="repo_branch_totals_commit_at"
+            ),
+        ]
@@ -0,0 +1,207 @@
+from datetime import datetime, timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from shared.django_apps.core.tests.factories import (
+    CommitFactory,
+    OwnerFactory,
+    RepositoryFactory,
+)
+
+from core.models import Repository
+from repository_totals.helpers import (
+    with_cached_latest_commit_at,
+    with_cached_latest_commit_totals,
+    with_cached_recent_coverage,
+)
+from repository_totals.models import RepositoryBranchTotals
+
+totals = {
+    "f": 1,
+    "n": 4,
+    "h": 3,
+    "m": 1,
+    "p": 0,
+    "c": "75.00000",
+    "b": 0,
+    "d": 0,
+    "s": 1,
+    "C": 0.0,
+    "N": 0.0,
+    "diff": "",
+}
+
+
+class RepositoryBranchTotalsTriggerTest(TestCase):
+    def setUp(self):
+        self.repo = RepositoryFactory(branch="main")
+
+    def test_complete_commit_on_default_branch(self):
+        commit = CommitFactory(
+            repository=self.repo, branch="main", state="complete", totals=totals
+        )
+
+        branch_totals = RepositoryBranchTotals.objects.get(repository=self.repo)
+        assert branch_totals.branch == "main"
+        assert branch_totals.commitid == commit.commitid
+        assert branch_totals.totals == totals
+        assert branch_totals.coverage == 75.0
+        assert branch_totals.lines == 4
+        assert branch_totals.hits == 3
+        assert branch_totals.misses == 1
+        assert branch_totals.partials == 0
+        assert branch_totals.latest_commit_at == commit.timestamp.replace(tzinfo=None)
+        assert branch_totals.previous_coverage is None
+
+    def test_ignores_other_branches_and_pending_commits(self):
+        CommitFactory(
+            repository=self.repo, branch="other", state="complete", totals=totals
+        )
+        CommitFactory(
+            repository=self.repo, branch="main", state="pending", totals=totals
+        )
+
+        assert not RepositoryBranchTotals.objects.filter(repository=self.repo).exists()
+
+    def test_commit_completion(self):
+        commit = CommitFactory(
+            repository=self.repo, branch="main", state="pending", totals=None
+        )
+        commit.state = "complete"
+        commit.totals = totals
+        commit.save()
+
+        assert (
+            RepositoryBranchTotals.objects.get(repository=self.repo).commitid
+            == commit.commitid
+        )
+
+    def test_previous_coverage(self):
+        now = timezone.now()
+        CommitFactory(
+            repository=self.repo,
+            branch="main",
+            state="complete",
+            totals={**totals, "c": "60.00000"},
+            timestamp=now - timedelta(hours=1),
+        )
+        latest_commit = CommitFactory(
+            repository=self.repo,
+            branch="main",
+            state="complete",
+            totals=totals,
+            timestamp=now,
+        )
+        # older commit completing late doesn't overwrite the latest totals
+        CommitFactory(
+            repository=self.repo,
+            branch="main",
+            state="complete",
+            totals={**totals, "c": "10.00000"},
+            timestamp=now - timedelta(hours=2),
+        )
+        # re-processing the latest commit keeps its previous coverage
+        latest_commit.totals = {**totals, "c": "80.00000"}
+        latest_commit.save()
+
+        branch_totals = RepositoryBranchTotals.objects.get(repository=self.repo)
+        assert branch_totals.commitid == latest_commit.commitid
+        assert branch_totals.coverage == 80.0
+        assert branch_totals.previous_coverage == 60.0
+
+
+class RepositoryBranchTotalsHelpersTest(TestCase):
+    def setUp(self):
+        self.owner = OwnerFactory()
+        self.repo1 = RepositoryFactory(author=self.owner, branch="main")
+        self.repo2 = RepositoryFactory(author=self.owner, branch="main")
+        now = timezone.now()
+        CommitFactory(
+            repository=self.repo1,
+            branch="main",
+            state="complete",
+            totals={**totals, "c": "60.00000"},
+            timestamp=now - timedelta(hours=1),
+        )
+        self.commit = CommitFactory(
+            repository=self.repo1,
+            branch="main",
+            state="complete",
+            totals=totals,
+            timestamp=now,
+        )
+
+    def test_with_cached_recent_coverage(self):
+        repos = with_cached_recent_coverage(
+            Repository.objects.filter(author=self.owner)
+        ).order_by("-coverage")
+
+        assert [
+            (repo.repoid, repo.coverage, repo.recent_coverage, repo.coverage_sha)
+            for repo in repos
+        ] == [
+            (self.repo1.repoid, 75.0, 75.0, self.commit.commitid),
+            (self.repo2.repoid, -1, None, None),
+        ]
+        assert repos[0].hits == 3
+        assert repos[0].misses == 1
+        assert repos[0].lines == 4
+
+    def test_with_cached_latest_commit_at(self):
+        repos = with_cached_latest_commit_at(
+            with_cached_recent_coverage(Repository.objects.filter(author=self.owner))
+        ).order_by("-latest_commit_at")
+
+        assert [(repo.repoid, repo.true_latest_commit_at) for repo in repos] == [
+            (self.repo1.repoid, self.commit.timestamp.replace(tzinfo=None)),
+            (self.repo2.repoid, None),
+        ]
+        assert repos[1].latest_commit_at == datetime(1900, 1, 1)
+
+    def test_with_cached_latest_commit_totals(self):
+        repo = with_cached_latest_commit_totals(Repository.objects).get(
+            repoid=self.repo1.repoid
+        )
+
+        assert repo.latest_commit_totals == totals
+        assert repo.latest_coverage_change == 15.0
+        assert repo.latest_commit_coverage == 75.0
+
+    def test_default_branch_changed(self):
+        now = timezone.now()
+        CommitFactory(
+            repository=self.repo1,
+            branch="develop",
+            state="complete",
+            totals={**totals, "c": "50.00000"},
+            timestamp=now - timedelta(hours=2),
+        )
+        commit = CommitFactory(
+            repository=self.repo1,
+            branch="develop",
+            state="complete",
+            totals={**totals, "c": "70.00000"},
+            timestamp=now - timedelta(hours=1),
+        )
+        self.repo1.branch = "develop"
+        self.repo1.save()
+
+        repo = with_cached_latest_commit_at(
+            with_cached_latest_commit_totals(Repository.objects)
+        ).get(repoid=self.repo1.repoid)
+
+        assert repo.latest_commit_totals == {**totals, "c": "70.00000"}
+        assert repo.latest_commit_coverage == 70.0
+        assert repo.latest_coverage_change == 20.0
+        assert repo.true_latest_commit_at == commit.timestamp.replace(tzinfo=None)
+
+    def test_default_branch_changed_without_commits(self):
+        self.repo1.branch = "develop"
+        self.repo1.save()
+
+        repo = with_cached_latest_commit_totals(Repository.objects).get(
+            repoid=self.repo1.repoid
+        )
+
+        assert repo.latest_commit_totals is None
+        assert not RepositoryBranchTotals.objects.filter(repository=self.repo1).exists()
@@ -26,6 +26,7 @@ from graphql_api.actions.measurements import (
     measurements_last_uploaded_before_start_date,
 )
 from reports.models import CommitReport
+from services.io_accounting import STORAGE, accounted_proxy
 from timeseries.helpers import fill_sparse_measurements
 from timeseries.models import Interval, MeasurementName
 
@@ -34,7 +35,7 @@ from timeseries.models import Interval, MeasurementName
 def load_report(
     commit: Commit, report_code: Optional[str] = None
 ) -> Optional[SharedBundleAnalysisReport]:
-    storage = get_appropriate_storage_service()
+    storage = accounted_proxy(get_appropriate_storage_service(), STORAGE)
 
     commit_report = commit.reports.filter(
         report_type=CommitReport.ReportType.BUNDLE_ANALYSIS,
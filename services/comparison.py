@@ -3,15 +3,17 @@ import copy
 import functools
 import json
 import logging
-from collections import Counter
+import threading
+from collections import Counter, OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import minio
 import pytz
 import shared.reports.api_report_service as report_service
 from asgiref.sync import async_to_sync
+from django.conf import settings
 from django.db.models import Prefetch, QuerySet
 from django.utils.functional import cached_property
 from shared.api_archive.archive import ArchiveService
@@ -23,8 +25,11 @@ from compare.models import CommitComparison
 from core.models import Commit
 from reports.models import CommitReport
 from services import ServiceException
+from services.provider_cache import cached_provider_payload
 from services.redis_configuration import get_redis_connection
 from services.repo_providers import RepoProviderService
+from services.report_filters import ReportFilters
+from services.source_cache import get_source_content
 from utils.config import get_config
 
 log = logging.getLogger(__name__)
@@ -667,16 +672,19 @@ class Comparison(object):
             base_file = None
 
         if with_src:
-            adapter = RepoProviderService().get_adapter(
-                owner=self.user, repo=self.base_commit.repository
-            )
-            file_content = async_to_sync(adapter.get_source)(
-                file_name, self.head_commit.commitid
-            )["content"]
-            # make sure the file is str utf-8
-            if not isinstance(file_content, str):
-                file_content = str(file_content, "utf-8")
-            src = file_content.splitlines()
+            repository = self.base_commit.repository
+
+            def fetch_source():
+                adapter = RepoProviderService().get_adapter(
+                    owner=self.user, repo=repository
+                )
+                return async_to_sync(adapter.get_source)(
+                    file_name, self.head_commit.commitid
+                )
+
+            src = get_source_content(
+                repository.repoid, self.head_commit.commitid, file_name, fetch_source
+            ).splitlines()
         else:
             src = []
 
@@ -773,19 +781,43 @@ class Comparison(object):
     @cached_property
     def _fetch_comparison(self):
         """
-        Fetches comparison, and caches the result.
+        Fetches comparison, and caches the result.  The compare of two shas never
+        changes so it is cached across requests too.
         """
-        adapter = RepoProviderService().get_adapter(
-            self.user, self.base_commit.repository
-        )
-        comparison_coro = adapter.get_compare(
-            self.base_commit.commitid, self.head_commit.commitid
+        repository = self.base_commit.repository
+
+        def fetch():
+            adapter = RepoProviderService().get_adapter(self.user, repository)
+            comparison_coro = adapter.get_compare(
+                self.base_commit.commitid, self.head_commit.commitid
+            )
+
+            async def runnable():
+                return await asyncio.gather(comparison_coro)
+
+            return async_to_sync(runnable)()
+
+        return cached_provider_payload(
+            "compare",
+            f"{repository.repoid}/{self.base_commit.commitid}/{self.head_commit.commitid}",
+            fetch,
+            ttl=settings.PROVIDER_COMPARE_CACHE_TTL_SECONDS,
+            max_bytes=settings.PROVIDER_COMPARE_CACHE_MAX_BYTES,
         )
 
-        async def runnable():
-            return await asyncio.gather(comparison_coro)
+    @cached_property
+    def head_filters(self):
+        """
+        Totals of the head report filtered by flags and paths, shared by the flag
+        and component comparisons.
+        """
+        return ReportFilters(self.head_report)
 
-        return async_to_sync(runnable)()
+    @cached_property
+    def base_filters(self):
+        if self.base_report is None:
+            return None
+        return ReportFilters(self.base_report)
 
     def flag_comparison(self, flag_name):
         return FlagComparison(self, flag_name)
@@ -809,12 +841,26 @@ class FlagComparison(object):
     def base_report(self):
         return self.comparison.base_report.flags.get(self.flag_name)
 
+    @cached_property
+    def head_totals(self):
+        if self.head_report is None:
+            return None
+        return self.comparison.head_filters.totals(flags=[self.flag_name])
+
+    @cached_property
+    def base_totals(self):
+        if self.base_report is None:
+            return None
+        return self.comparison.base_filters.totals(flags=[self.flag_name])
+
     @cached_property
     def diff_totals(self):
         if self.head_report is None:
             return None
         git_comparison = self.comparison.git_comparison
-        return self.head_report.apply_diff(git_comparison["diff"])
+        return self.comparison.head_filters.patch_totals(
+            git_comparison["diff"], flags=[self.flag_name]
+        )
 
 
 @dataclass
@@ -957,6 +1003,32 @@ class ImpactedFile:
             return parts[-1]
 
 
+# impacted files of the most recently read comparisons, by storage path
+_comparison_files_lock = threading.Lock()
+_comparison_files: OrderedDict[tuple, List[ImpactedFile]] = OrderedDict()
+
+
+def _get_comparison_files(key: tuple) -> Optional[List[ImpactedFile]]:
+    if not settings.COMPARISON_REPORT_CACHE_SIZE:
+        return None
+    with _comparison_files_lock:
+        files = _comparison_files.get(key)
+        if files is not None:
+            _comparison_files.move_to_end(key)
+        return files
+
+
+def _set_comparison_files(key: tuple, files: List[ImpactedFile]) -> None:
+    max_size = settings.COMPARISON_REPORT_CACHE_SIZE
+    if not max_size:
+        return
+    with _comparison_files_lock:
+        _comparison_files[key] = files
+        _comparison_files.move_to_end(key)
+        while len(_comparison_files) > max_size:
+            _comparison_files.popitem(last=False)
+
+
 @dataclass
 class ComparisonReport(object):
     """
@@ -967,20 +1039,44 @@ class ComparisonReport(object):
 
     commit_comparison: CommitComparison = None
 
+    @cached_property
+    def _cache_key(self) -> tuple:
+        # the worker rewrites the data of a comparison when it's recomputed
+        return (
+            self.commit_comparison.report_storage_path,
+            self.commit_comparison.updated_at,
+        )
+
     @cached_property
     def files(self) -> List[ImpactedFile]:
         if not self.commit_comparison.report_storage_path:
             return []
 
+        files = _get_comparison_files(self._cache_key)
+        if files is not None:
+            return files
+
         comparison_data = self._fetch_raw_comparison_data()
-        return [
+        files = [
             ImpactedFile.create(**data) for data in comparison_data.get("files", [])
         ]
+        # failed reads aren't cached
+        if comparison_data:
+            _set_comparison_files(self._cache_key, files)
+        return files
 
-    def impacted_file(self, path: str) -> Optional[ImpactedFile]:
+    @cached_property
+    def files_by_path(self) -> Dict[str, ImpactedFile]:
+        files_by_path = {}
         for file in self.files:
-            if file.head_name == path:
-                return file
+            # the first file of a path, like a scan of `files` would find
+            files_by_path.setdefault(file.head_name, file)
+        return files_by_path
+
+    def impacted_file(self, path: str) -> Optional[ImpactedFile]:
+        # all the files are parsed and cached, for the lookups of the following
+        # requests too
+        return self.files_by_path.get(path)
 
     @cached_property
     def impacted_files(self) -> List[ImpactedFile]:
@@ -994,19 +1090,34 @@ class ComparisonReport(object):
     def impacted_files_with_direct_changes(self) -> List[ImpactedFile]:
         return [file for file in self.files if file.has_diff or not file.has_changes]
 
-    def _fetch_raw_comparison_data(self) -> dict:
+    @cached_property
+    def _raw_comparison_data(self) -> Optional[str | bytes]:
         """
-        Fetches the raw comparison data from storage
+        Reads the raw comparison data from storage, once
         """
         repository = self.commit_comparison.compare_commit.repository
         archive_service = ArchiveService(repository)
         try:
-            data = archive_service.read_file(self.commit_comparison.report_storage_path)
-            return json.loads(data)
+            return archive_service.read_file(self.commit_comparison.report_storage_path)
         except Exception:
             log.error(
                 "ComparisonReport - couldn't fetch data from storage", exc_info=True
             )
+            return None
+
+    def _fetch_raw_comparison_data(self) -> dict:
+        """
+        Fetches the raw comparison data from storage
+        """
+        data = self._raw_comparison_data
+        if data is None:
+            return {}
+        try:
+            return json.loads(data)
+        except ValueError:
+            log.error(
+                "ComparisonReport - couldn't parse data from storage", exc_info=True
+            )
             return {}
 
 
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from django.utils.functional import cached_property
 from shared.components import Component
@@ -68,18 +68,30 @@ class ComponentComparison:
     def head_report(self) -> FilteredReport:
         return component_filtered_report(self.comparison.head_report, [self.component])
 
+    def _filters(self, report: Report) -> Tuple[List[str], List[str]]:
+        # same filters as `component_filtered_report`
+        return (
+            self.component.get_matching_flags(report.flags.keys()),
+            self.component.paths,
+        )
+
     @cached_property
     def base_totals(self) -> ReportTotals:
-        return self.base_report.totals
+        flags, paths = self._filters(self.comparison.base_report)
+        return self.comparison.base_filters.totals(flags=flags, paths=paths)
 
     @cached_property
     def head_totals(self) -> ReportTotals:
-        return self.head_report.totals
+        flags, paths = self._filters(self.comparison.head_report)
+        return self.comparison.head_filters.totals(flags=flags, paths=paths)
 
     @cached_property
     def patch_totals(self) -> ReportTotals:
         git_comparison = self.comparison.git_comparison
-        return self.head_report.apply_diff(git_comparison["diff"])
+        flags, paths = self._filters(self.comparison.head_report)
+        return self.comparison.head_filters.patch_totals(
+            git_comparison["diff"], flags=flags, paths=paths
+        )
 
 
 class ComponentMeasurements:
@@ -0,0 +1,261 @@
+import functools
+import inspect
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+from django.conf import settings
+from django.http import HttpResponseBase
+from shared.metrics import Histogram
+
+from services.provider_clients import REQUEST_METHODS
+
+IO_CALLS_PER_REQUEST = Histogram(
+    "api_request_io_calls",
+    "Number of calls made to an I/O backend (storage, redis, provider) by a request",
+    ["backend", "view"],
+    buckets=[1, 2, 5, 10, 20, 50, 100, 200, 500],
+)
+
+IO_BYTES_PER_REQUEST = Histogram(
+    "api_request_io_bytes",
+    "Number of bytes sent to and received from an I/O backend by a request",
+    ["backend", "view"],
+    buckets=[1024, 10240, 102400, 1048576, 10485760, 104857600],
+)
+
+IO_SECONDS_PER_REQUEST = Histogram(
+    "api_request_io_seconds",
+    "Total time in seconds spent waiting on an I/O backend by a request",
+    ["backend", "view"],
+    buckets=[0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10],
+)
+
+STORAGE = "storage"
+REDIS = "redis"
+PROVIDER = "provider"
+
+
+@dataclass
+class BackendTotals:
+    calls: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+
+
+class IOAccounting:
+    """
+    Calls, bytes and wall time of the I/O of a request, by backend.
+    """
+
+    def __init__(self):
+        self.backends: Dict[str, BackendTotals] = {}
+
+    def record(self, backend: str, seconds: float, nbytes: int = 0) -> None:
+        totals = self.backends.get(backend)
+        if totals is None:
+            totals = self.backends[backend] = BackendTotals()
+        totals.calls += 1
+        totals.bytes += nbytes
+        totals.seconds += seconds
+
+    def server_timing(self) -> str:
+        return ", ".join(
+            f'{backend};dur={totals.seconds * 1000:.1f};desc="{totals.calls} calls, {totals.bytes} bytes"'
+            for backend, totals in sorted(self.backends.items())
+        )
+
+    def finish(self, view: str, response: Optional[HttpResponseBase]) -> None:
+        """
+        Exports the totals of the request of `view` (or GraphQL operation) as
+        metrics and as the `Server-Timing` header of its `response`.
+        """
+        for backend, totals in self.backends.items():
+            labels = dict(backend=backend, view=view)
+            IO_CALLS_PER_REQUEST.labels(**labels).observe(totals.calls)
+            IO_BYTES_PER_REQUEST.labels(**labels).observe(totals.bytes)
+            IO_SECONDS_PER_REQUEST.labels(**labels).observe(totals.seconds)
+
+        if response is not None and self.backends:
+            server_timing = self.server_timing()
+            if response.has_header("Server-Timing"):
+                server_timing = f"{response['Server-Timing']}, {server_timing}"
+            response["Server-Timing"] = server_timing
+
+
+_current: ContextVar[Optional[IOAccounting]] = ContextVar("io_accounting", default=None)
+
+
+@contextmanager
+def io_accounting() -> Iterator[Optional[IOAccounting]]:
+    """
+    Accounts the I/O made within the block, and the threads and coroutines it
+    runs, e.g. for a request.  Yields None when accounting is disabled or already
+    done by an outer block, which is the one to `finish` it.
+    """
+    if not settings.IO_ACCOUNTING_ENABLED or _current.get() is not None:
+        yield None
+        return
+
+    accounting = IOAccounting()
+    token = _current.set(accounting)
+    try:
+        yield accounting
+    finally:
+        _current.reset(token)
+
+
+def _size(value: Any) -> int:
+    if isinstance(value, (bytes, bytearray, memoryview, str)):
+        return len(value)
+    if isinstance(value, (list, tuple)):
+        return sum(_size(v) for v in value)
+    if isinstance(value, dict):
+        return sum(_size(v) for v in value.values())
+    # e.g. an `httpx.Response`
+    content = getattr(value, "content", None)
+    if isinstance(content, (bytes, bytearray)):
+        return len(content)
+    return 0
+
+
+def _record(backend: str, start: float, args: Iterable, kwargs: Dict, result: Any):
+    accounting = _current.get()
+    if accounting is not None:
+        nbytes = _size(tuple(args)) + _size(kwargs) + _size(result)
+        accounting.record(backend, time.perf_counter() - start, nbytes)
+
+
+def accounted(backend: str, func: Callable) -> Callable:
+    """
+    Wraps `func`, sync or async, so its calls are accounted to `backend`.  The
+    bytes of a call are those of its string and bytes arguments and result.
+    """
+    if getattr(func, "_io_backend", None):
+        return func
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            result = None
+            try:
+                result = await func(*args, **kwargs)
+                return result
+            finally:
+                _record(backend, start, args, kwargs, result)
+
+        async_wrapper._io_backend = backend
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        result = None
+        try:
+            result = func(*args, **kwargs)
+            return result
+        finally:
+            _record(backend, start, args, kwargs, result)
+
+    wrapper._io_backend = backend
+    return wrapper
+
+
+class AccountedProxy:
+    """
+    Stands in for a client of an I/O `backend` (e.g. a storage service or a redis
+    client), accounting the calls of its public methods.
+    """
+
+    def __init__(self, target: Any, backend: str):
+        self._target = target
+        self._backend = backend
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+        return accounted(self._backend, attr)
+
+
+class AccountedRedis(AccountedProxy):
+    """
+    Stands in for a redis client, accounting its commands including those sent
+    by its pipelines.
+    """
+
+    def pipeline(self, *args, **kwargs) -> Any:
+        # the commands are buffered by the pipeline until `execute` sends them
+        pipeline = self._target.pipeline(*args, **kwargs)
+        pipeline.execute = accounted(self._backend, pipeline.execute)
+        return pipeline
+
+
+def accounted_proxy(
+    target: Any, backend: str, proxy_class: type = AccountedProxy
+) -> Any:
+    if not settings.IO_ACCOUNTING_ENABLED or isinstance(target, AccountedProxy):
+        return target
+    return proxy_class(target, backend)
+
+
+def instrument_class(cls: type, method_names: Iterable[str], backend: str) -> None:
+    """
+    Accounts the calls of the `method_names` of `cls` to `backend`, for classes
+    this service doesn't instantiate itself (e.g. the archive service used by
+    `shared` to read reports).
+    """
+    for name in method_names:
+        method = cls.__dict__.get(name)
+        if method is None or isinstance(method, (staticmethod, classmethod)):
+            continue
+        setattr(cls, name, accounted(backend, method))
+
+
+class AccountedHTTPClient:
+    """
+    Stands in for the `httpx.AsyncClient` of a torngit adapter, accounting its
+    requests to the provider.  Wraps the pooled client too (see
+    `services.provider_clients`), the requests are accounted to the caller.
+    """
+
+    def __init__(self, client: Any):
+        self._client = client
+
+    async def __aenter__(self) -> "AccountedHTTPClient":
+        await self._client.__aenter__()
+        return self
+
+    async def __aexit__(self, *args) -> Any:
+        return await self._client.__aexit__(*args)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if name not in REQUEST_METHODS:
+            return attr
+        return accounted(PROVIDER, attr)
+
+
+def account_adapter_client(adapter: Any) -> Any:
+    """
+    Makes a torngit `adapter` account the requests of its HTTP clients.
+    """
+    if not settings.IO_ACCOUNTING_ENABLED:
+        return adapter
+
+    create_client = getattr(adapter, "get_client", None)
+    if create_client is None or not (
+        inspect.ismethod(create_client) or inspect.isfunction(create_client)
+    ):
+        # not a torngit adapter, e.g. a mock
+        return adapter
+
+    def get_client(*args, **kwargs) -> AccountedHTTPClient:
+        return AccountedHTTPClient(create_client(*args, **kwargs))
+
+    adapter.get_client = get_client
+    return adapter
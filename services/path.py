@@ -9,12 +9,12 @@ from django.conf import settings
 from shared.reports.resources import Report
 from shared.reports.types import ReportTotals
 from shared.torngit.exceptions import TorngitClientError
-from shared.utils.match import match
 
 import services.report as report_service
 from codecov_auth.models import Owner
 from core.models import Commit
 from services.repo_providers import RepoProviderService
+from utils.match import path_matcher
 
 
 class PathNode:
@@ -131,8 +131,8 @@ def dashboard_commit_file_url(
 ) -> str:
     if path is None:
         path = ""
-    report = commit.full_report
-    is_file = report and path in report.files
+    manifest = report_service.commit_file_manifest(commit)
+    is_file = manifest is not None and path in manifest
     commit_path = f"blob/{path}" if is_file else f"tree/{path}"
     return f"{settings.CODECOV_DASHBOARD_URL}/{service}/{owner}/{repo}/commit/{commit.commitid}/{commit_path}"
 
@@ -195,7 +195,7 @@ class ReportPaths:
             )
         # Do path filtering if needed
         if self.filter_paths:
-            files = [file for file in files if match(self.filter_paths, file)]
+            files = path_matcher(self.filter_paths).filter(files)
 
         return files
 
@@ -0,0 +1,139 @@
+import json
+import logging
+import time
+from typing import Any, Callable, Iterable, List, Sequence
+
+from django.conf import settings
+from redis.exceptions import RedisError
+from shared.metrics import Counter, inc_counter
+
+from services.redis_configuration import get_redis_connection
+
+log = logging.getLogger(__name__)
+
+PROVIDER_PERMISSION_CALLS_COUNTER = Counter(
+    "api_provider_permission_calls",
+    "Number of git provider calls made to check permissions",
+    ["check"],
+)
+
+PROVIDER_PERMISSION_CACHE_COUNTER = Counter(
+    "api_provider_permission_cache_lookups",
+    "Number of provider permission cache lookups",
+    ["check", "result"],
+)
+
+
+def _cache_key(check: str, ids: Sequence[int]) -> str:
+    return f"provider_permissions/{check}/" + "/".join(str(i) for i in ids)
+
+
+def _get_cached(keys: List[str]) -> List[Any | None]:
+    try:
+        values = get_redis_connection().mget(keys)
+    except (OSError, RedisError) as e:
+        log.warning(f"Error connecting to redis: {e}")
+        return [None] * len(keys)
+    return [json.loads(value) if value is not None else None for value in values]
+
+
+def _set_cached(key: str, value: Any) -> None:
+    try:
+        redis = get_redis_connection()
+        redis.set(
+            key,
+            json.dumps({"value": value, "fetched_at": time.time()}),
+            ex=settings.PROVIDER_PERMISSIONS_CACHE_TTL_SECONDS,
+        )
+        redis.delete(f"{key}/refresh")
+    except (OSError, RedisError) as e:
+        log.warning(f"Error connecting to redis: {e}")
+
+
+def _should_refresh(key: str, fetched_at: float) -> bool:
+    """
+    Entries are refreshed ahead of their expiry so hot permissions never fall out of
+    the cache.  A single request refreshes an entry, the others keep using it.
+    """
+    ttl = settings.PROVIDER_PERMISSIONS_CACHE_TTL_SECONDS
+    if time.time() - fetched_at < ttl * settings.PROVIDER_PERMISSIONS_REFRESH_AHEAD:
+        return False
+    try:
+        return bool(get_redis_connection().set(f"{key}/refresh", 1, nx=True, ex=ttl))
+    except (OSError, RedisError) as e:
+        log.warning(f"Error connecting to redis: {e}")
+        return False
+
+
+def cached_provider_checks(
+    check: str,
+    ids: Iterable[Sequence[int]],
+    fetch: Callable[[List[int]], List[Any]],
+) -> List[Any]:
+    """
+    Results of a provider permission `check` for each of `ids`, e.g. (ownerid, repoid).
+    `fetch` receives the indexes of the ids missing from the cache and returns their
+    results in the same order, so they can be fetched from the provider at once.
+    """
+    ids = list(ids)
+    if not settings.PROVIDER_PERMISSIONS_CACHE_TTL_SECONDS:
+        for _ in ids:
+            inc_counter(PROVIDER_PERMISSION_CALLS_COUNTER, labels=dict(check=check))
+        return fetch(list(range(len(ids))))
+
+    keys = [_cache_key(check, item_ids) for item_ids in ids]
+    cached = _get_cached(keys)
+
+    results = [None] * len(ids)
+    to_fetch, to_refresh = [], []
+    for index, (key, entry) in enumerate(zip(keys, cached)):
+        if entry is None:
+            inc_counter(
+                PROVIDER_PERMISSION_CACHE_COUNTER,
+                labels=dict(check=check, result="miss"),
+            )
+            to_fetch.append(index)
+            continue
+        results[index] = entry["value"]
+        if _should_refresh(key, entry["fetched_at"]):
+            inc_counter(
+                PROVIDER_PERMISSION_CACHE_COUNTER,
+                labels=dict(check=check, result="refresh"),
+            )
+            to_refresh.append(index)
+        else:
+            inc_counter(
+                PROVIDER_PERMISSION_CACHE_COUNTER,
+                labels=dict(check=check, result="hit"),
+            )
+
+    if to_fetch or to_refresh:
+        indexes = to_fetch + to_refresh
+        for _ in indexes:
+            inc_counter(PROVIDER_PERMISSION_CALLS_COUNTER, labels=dict(check=check))
+        try:
+            fetched = fetch(indexes)
+        except Exception:
+            if to_fetch:
+                raise
+            # refreshing is best effort, the cached results are still valid
+            log.warning(
+                "Failed to refresh provider permissions",
+                extra=dict(check=check),
+                exc_info=True,
+            )
+            return results
+        for index, value in zip(indexes, fetched):
+            results[index] = value
+            _set_cached(keys[index], value)
+
+    return results
+
+
+def cached_provider_check(
+    check: str, ids: Sequence[int], fetch: Callable[[], Any]
+) -> Any:
+    """
+    Result of a single provider permission `check`, see `cached_provider_checks`.
+    """
+    return cached_provider_checks(check, [ids], lambda indexes: [fetch()])[0]
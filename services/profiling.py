@@ -2,8 +2,6 @@ import json
 import logging
 from typing import List, Optional
 
-import regex
-import shared.reports.api_report_service as report_service
 from django.utils.functional import cached_property
 from shared.api_archive.archive import ArchiveService
 from shared.profiling import ProfilingSummaryDataAnalyzer
@@ -11,6 +9,8 @@ from shared.yaml import UserYaml
 
 from core.models import Commit, Repository
 from profiling.models import ProfilingCommit
+from services.report import commit_file_manifest
+from utils.match import any_path_matcher
 
 log = logging.getLogger(__name__)
 
@@ -81,22 +81,11 @@ class ProfilingSummary:
             return []
         commit_sha = self.commit_sha or profiling_commit.commit_sha
         commit = Commit.objects.get(commitid=commit_sha)
-        report = report_service.build_report_from_commit(commit)
-        if report is None:
+        manifest = commit_file_manifest(commit)
+        if manifest is None:
             return []
         critical_files_paths = repo_yaml["profiling"]["critical_files_paths"]
-        compiled_files_paths = [regex.compile(path) for path in critical_files_paths]
-        user_defined_critical_files = [
-            file
-            for file in report.files
-            if any(
-                map(
-                    lambda regex_patt: regex.match(regex_patt, file, timeout=2),
-                    compiled_files_paths,
-                )
-            )
-        ]
-        return user_defined_critical_files
+        return any_path_matcher(critical_files_paths, timeout=2).filter(manifest.files)
 
     @cached_property
     def critical_files(self) -> List[CriticalFile]:
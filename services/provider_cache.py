@@ -0,0 +1,188 @@
+import json
+import logging
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict
+
+from redis.exceptions import RedisError
+from shared.metrics import Counter, inc_counter
+
+from services.redis_configuration import get_redis_connection
+
+log = logging.getLogger(__name__)
+
+PROVIDER_PAYLOAD_CACHE_COUNTER = Counter(
+    "api_provider_payload_cache_lookups",
+    "Number of cache lookups of immutable git provider payloads",
+    ["kind", "result"],
+)
+
+# how long to wait for another process fetching the same payload before fetching
+# it ourselves
+LOCK_TIMEOUT_SECONDS = 30
+WAIT_TIMEOUT_SECONDS = 10
+WAIT_INTERVAL_SECONDS = 0.1
+
+# in-process fetches by key, set once done, so concurrent threads wait for each
+# other's fetch of the same key only
+_fetches: Dict[str, threading.Event] = {}
+_fetches_lock = threading.Lock()
+
+
+def _get_cached(key: str) -> Any | None:
+    try:
+        cached = get_redis_connection().get(key)
+    except (OSError, RedisError) as e:
+        log.warning(f"Error connecting to redis: {e}")
+        return None
+    if cached is None:
+        return None
+    return json.loads(zlib.decompress(cached))
+
+
+def _set_cached(key: str, value: Any, ttl: int, max_bytes: int) -> None:
+    compressed = zlib.compress(json.dumps(value).encode())
+    if len(compressed) > max_bytes:
+        log.info(
+            "Provider payload too large to be cached",
+            extra=dict(key=key, size=len(compressed)),
+        )
+        return
+    try:
+        get_redis_connection().set(key, compressed, ex=ttl)
+    except (OSError, RedisError) as e:
+        log.warning(f"Error connecting to redis: {e}")
+
+
+def _acquire_fetch(key: str) -> bool:
+    try:
+        return bool(
+            get_redis_connection().set(
+                f"{key}/lock", 1, nx=True, ex=LOCK_TIMEOUT_SECONDS
+            )
+        )
+    except (OSError, RedisError) as e:
+        log.warning(f"Error connecting to redis: {e}")
+        return True
+
+
+def _release_fetch(key: str) -> None:
+    try:
+        get_redis_connection().delete(f"{key}/lock")
+    except (OSError, RedisError) as e:
+        log.warning(f"Error connecting to redis: {e}")
+
+
+def _wait_for_fetch(lookup: Callable[[], Any | None]) -> Any | None:
+    deadline = time.monotonic() + WAIT_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        time.sleep(WAIT_INTERVAL_SECONDS)
+        value = lookup()
+        if value is not None:
+            return value
+    return None
+
+
+def single_flight(
+    kind: str,
+    key: str,
+    lookup: Callable[[], Any | None],
+    fetch: Callable[[], Any],
+) -> Any:
+    """
+    Value found by `lookup`, or returned by `fetch` when there is none.  Concurrent
+    callers missing the same `key` share a single `fetch` call, which must store
+    its result where `lookup` finds it.
+    """
+    value = lookup()
+    if value is not None:
+        inc_counter(
+            PROVIDER_PAYLOAD_CACHE_COUNTER, labels=dict(kind=kind, result="hit")
+        )
+        return value
+
+    with _fetches_lock:
+        fetched = _fetches.get(key)
+        if fetched is None:
+            fetched = _fetches[key] = threading.Event()
+            fetching = True
+        else:
+            fetching = False
+
+    if not fetching:
+        # another thread is fetching the same key
+        fetched.wait(WAIT_TIMEOUT_SECONDS)
+        value = lookup()
+        if value is not None:
+            inc_counter(
+                PROVIDER_PAYLOAD_CACHE_COUNTER, labels=dict(kind=kind, result="shared")
+            )
+            return value
+        inc_counter(
+            PROVIDER_PAYLOAD_CACHE_COUNTER, labels=dict(kind=kind, result="miss")
+        )
+        return fetch()
+
+    try:
+        return _fetch_once(kind, key, lookup, fetch)
+    finally:
+        with _fetches_lock:
+            del _fetches[key]
+        fetched.set()
+
+
+def _fetch_once(
+    kind: str,
+    key: str,
+    lookup: Callable[[], Any | None],
+    fetch: Callable[[], Any],
+) -> Any:
+    """
+    `single_flight` of the thread fetching `key` in this process, it waits for
+    the fetch of other processes.
+    """
+    value = lookup()
+    if value is not None:
+        inc_counter(
+            PROVIDER_PAYLOAD_CACHE_COUNTER, labels=dict(kind=kind, result="hit")
+        )
+        return value
+
+    acquired = _acquire_fetch(key)
+    if not acquired:
+        value = _wait_for_fetch(lookup)
+        if value is not None:
+            inc_counter(
+                PROVIDER_PAYLOAD_CACHE_COUNTER,
+                labels=dict(kind=kind, result="shared"),
+            )
+            return value
+
+    inc_counter(PROVIDER_PAYLOAD_CACHE_COUNTER, labels=dict(kind=kind, result="miss"))
+    try:
+        return fetch()
+    finally:
+        if acquired:
+            _release_fetch(key)
+
+
+def cached_provider_payload(
+    kind: str, key: str, fetch: Callable[[], Any], ttl: int, max_bytes: int
+) -> Any:
+    """
+    Provider payload that never changes for `key`, e.g. the compare of two shas.
+    Payloads are stored compressed in redis, and concurrent callers missing the
+    cache share a single `fetch` call.
+    """
+    if not ttl:
+        return fetch()
+
+    key = f"provider_payload/{kind}/{key}"
+
+    def fetch_and_cache():
+        value = fetch()
+        _set_cached(key, value, ttl, max_bytes)
+        return value
+
+    return single_flight(kind, key, lambda: _get_cached(key), fetch_and_cache)
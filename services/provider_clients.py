@@ -0,0 +1,165 @@
+import asyncio
+import inspect
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+import httpx
+from django.conf import settings
+from shared.metrics import Counter, inc_counter
+
+log = logging.getLogger(__name__)
+
+PROVIDER_HTTP_CLIENTS_COUNTER = Counter(
+    "api_provider_http_clients_created",
+    "Number of pooled HTTP clients created for git providers",
+    ["service"],
+)
+
+PROVIDER_HTTP_REQUESTS_COUNTER = Counter(
+    "api_provider_http_requests",
+    "Number of HTTP requests made to git providers through pooled clients",
+    ["service", "connection"],
+)
+
+# request methods of `httpx.AsyncClient` that are run on the pooled client
+REQUEST_METHODS = {
+    "request",
+    "get",
+    "options",
+    "head",
+    "post",
+    "put",
+    "patch",
+    "delete",
+}
+
+
+class ProviderLoop:
+    """
+    Event loop running in a background thread of the process.  Requests are run
+    on the pooled clients there: provider coroutines are usually run through
+    `async_to_sync` which creates a new event loop each time, and the connections
+    of a client can't be shared between loops.
+    """
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.pid = os.getpid()
+        self.thread = threading.Thread(
+            target=self.loop.run_forever, name="provider-http", daemon=True
+        )
+        self.thread.start()
+
+    def run(self, coroutine) -> asyncio.Future:
+        return asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+        )
+
+
+class PooledClient:
+    """
+    Stands in for the `httpx.AsyncClient` of a torngit adapter.  Leaving the
+    `async with` block doesn't close the client so the connections are kept alive
+    for the next requests to the same provider.
+    """
+
+    def __init__(self, service: str, client: httpx.AsyncClient, loop: ProviderLoop):
+        self._service = service
+        self._client = client
+        self._loop = loop
+
+    async def __aenter__(self) -> "PooledClient":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if name not in REQUEST_METHODS:
+            return attr
+
+        async def run_on_pool(*args, **kwargs):
+            new_connection = False
+
+            async def trace(event_name: str, info: Dict) -> None:
+                nonlocal new_connection
+                if event_name == "connection.connect_tcp.started":
+                    new_connection = True
+
+            extensions = kwargs.pop("extensions", None) or {}
+            response = await self._loop.run(
+                attr(*args, extensions={**extensions, "trace": trace}, **kwargs)
+            )
+            inc_counter(
+                PROVIDER_HTTP_REQUESTS_COUNTER,
+                labels=dict(
+                    service=self._service,
+                    connection="new" if new_connection else "reused",
+                ),
+            )
+            return response
+
+        return run_on_pool
+
+
+_lock = threading.Lock()
+_loop: ProviderLoop | None = None
+_clients: Dict[Hashable, PooledClient] = {}
+
+
+def _get_loop() -> ProviderLoop:
+    global _loop
+    # threads don't survive a fork, each (gunicorn) worker needs its own loop
+    if _loop is None or _loop.pid != os.getpid():
+        _loop = ProviderLoop()
+        _clients.clear()
+    return _loop
+
+
+def get_pooled_client(
+    service: str, key: Hashable, create_client: Callable[[], httpx.AsyncClient]
+) -> PooledClient:
+    """
+    Process wide client for `service` and `key`, e.g. the provider host and client
+    options.  `create_client` is only called when there is no client yet.
+    """
+    with _lock:
+        loop = _get_loop()
+        client = _clients.get((service, key))
+        if client is None:
+            client = PooledClient(service, create_client(), loop)
+            _clients[(service, key)] = client
+            inc_counter(PROVIDER_HTTP_CLIENTS_COUNTER, labels=dict(service=service))
+        return client
+
+
+def pool_adapter_client(adapter: Any, service: str, verify_ssl: Any = None) -> Any:
+    """
+    Makes a torngit `adapter` use pooled clients instead of creating (and closing)
+    a client, with its connections, for each group of requests.
+    """
+    if not settings.PROVIDER_HTTP_POOLING_ENABLED:
+        return adapter
+
+    create_client = adapter.get_client
+    if not inspect.ismethod(create_client):
+        # not a torngit adapter, e.g. a mock
+        return adapter
+
+    def get_client(*args, **kwargs) -> PooledClient:
+        key = (
+            adapter.get_service_url(),
+            repr(verify_ssl),
+            repr(args),
+            repr(sorted(kwargs.items())),
+        )
+        return get_pooled_client(service, key, lambda: create_client(*args, **kwargs))
+
+    adapter.get_client = get_client
+    return adapter
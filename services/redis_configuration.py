@@ -1,5 +1,8 @@
+from typing import Union
+
 from redis import Redis
 
+from services.io_accounting import REDIS, AccountedRedis, accounted_proxy
 from utils.config import get_config
 
 
@@ -12,9 +15,9 @@ def get_redis_url() -> str:
     return f"redis://{hostname}:{port}"
 
 
-def get_redis_connection() -> Redis:
+def get_redis_connection() -> Union[Redis, AccountedRedis]:
     url = get_redis_url()
-    return _get_redis_instance_from_url(url)
+    return accounted_proxy(_get_redis_instance_from_url(url), REDIS, AccountedRedis)
 
 
 def _get_redis_instance_from_url(url):
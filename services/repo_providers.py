@@ -1,6 +1,7 @@
 import logging
+import time
 from os import getenv
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, Optional, Tuple
 
 from django.conf import settings
 from shared.encryption.token import encode_token
@@ -14,11 +15,21 @@ from codecov_auth.models import (
     Service,
 )
 from core.models import Repository
+from services.io_accounting import account_adapter_client
+from services.provider_clients import pool_adapter_client
+from utils.cache import cache
 from utils.config import get_config
 from utils.encryption import encryptor
 
 log = logging.getLogger(__name__)
 
+DECRYPTED_TOKENS_MAX_SIZE = 1000
+
+GHAPP_INSTALLATION_CACHE_TTL_SECONDS = 60
+
+# encrypted oauth token -> (expiry, decrypted token)
+_decrypted_tokens: Dict[str, Tuple[float, Dict]] = {}
+
 
 class TorngitInitializationFailed(Exception):
     """
@@ -67,7 +78,7 @@ def get_generic_adapter_params(
 
     if token is None:
         if owner is not None and owner.oauth_token is not None:
-            token = encryptor.decrypt_token(owner.oauth_token)
+            token = decrypt_oauth_token(owner.oauth_token)
             token["username"] = owner.username
         else:
             token = {"key": getattr(settings, f"{service.upper()}_BOT_KEY")}
@@ -87,14 +98,44 @@ def get_generic_adapter_params(
     )
 
 
+def decrypt_oauth_token(oauth_token: str) -> Dict:
+    """
+    Decrypted `oauth_token`, cached for a short while as every adapter we build
+    needs it.  The cache is keyed on the encrypted token so a refreshed token is
+    never served stale.
+    """
+    now = time.monotonic()
+    cached = _decrypted_tokens.get(oauth_token)
+    if cached is not None and cached[0] > now:
+        return dict(cached[1])
+
+    token = encryptor.decrypt_token(oauth_token)
+    ttl = settings.PROVIDER_TOKEN_CACHE_TTL_SECONDS
+    if ttl:
+        if len(_decrypted_tokens) >= DECRYPTED_TOKENS_MAX_SIZE:
+            _decrypted_tokens.clear()
+        _decrypted_tokens[oauth_token] = (now + ttl, dict(token))
+    return token
+
+
 def get_provider(service, adapter_params):
     provider = get(service, **adapter_params)
     if provider:
-        return provider
+        provider = pool_adapter_client(
+            provider, service, verify_ssl=adapter_params.get("verify_ssl")
+        )
+        return account_adapter_client(provider)
     else:
         raise TorngitInitializationFailed()
 
 
+@cache.cache_function(ttl=GHAPP_INSTALLATION_CACHE_TTL_SECONDS)
+def _get_ghapp_default_installation(ownerid: int) -> Optional[GithubAppInstallation]:
+    return GithubAppInstallation.objects.filter(
+        owner_id=ownerid, name=GITHUB_APP_INSTALLATION_DEFAULT_NAME
+    ).first()
+
+
 def get_ghapp_default_installation(
     owner: Optional[Owner],
 ) -> Optional[GithubAppInstallation]:
@@ -103,9 +144,7 @@ def get_ghapp_default_installation(
         Service.GITHUB_ENTERPRISE.value,
     ]:
         return None
-    return owner.github_app_installations.filter(
-        name=GITHUB_APP_INSTALLATION_DEFAULT_NAME
-    ).first()
+    return _get_ghapp_default_installation(owner.ownerid)
 
 
 async def async_get_ghapp_default_installation(
@@ -116,9 +155,7 @@ async def async_get_ghapp_default_installation(
         Service.GITHUB_ENTERPRISE.value,
     ]:
         return None
-    return await owner.github_app_installations.filter(
-        name=GITHUB_APP_INSTALLATION_DEFAULT_NAME
-    ).afirst()
+    return await sync_to_async(_get_ghapp_default_installation)(owner.ownerid)
 
 
 class RepoProviderService(object):
@@ -1,8 +1,13 @@
+import bisect
 import logging
+from typing import Any, Dict, Iterator, List, Optional
 
 from shared.reports.resources import Report
+from shared.reports.types import TOTALS_MAP, ReportTotals
 from shared.utils.sessions import Session
 
+from core.models import Commit
+
 log = logging.getLogger(__name__)
 
 
@@ -43,3 +48,46 @@ def files_in_sessions(commit_report: Report, session_ids: list[int]) -> list[str
         if found:
             files.append(file.name)
     return files
+
+
+class FileManifest:
+    """
+    Sorted names, and totals, of the files in a commit's report.  It is read from
+    the report's files index so none of the coverage chunks are loaded, for when
+    only the files are needed.
+    """
+
+    def __init__(self, files: Dict[str, Any]):
+        self._files = files
+        self.files: List[str] = sorted(files)
+
+    def __contains__(self, path: str) -> bool:
+        index = bisect.bisect_left(self.files, path)
+        return index < len(self.files) and self.files[index] == path
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.files)
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def totals(self, path: str) -> Optional[ReportTotals]:
+        summary = self._files.get(path)
+        # [file index, file totals, ...]
+        if not summary or len(summary) < 2 or summary[1] is None:
+            return None
+        totals = summary[1]
+        if isinstance(totals, dict):
+            totals = [totals.get(key) for key in TOTALS_MAP]
+        return ReportTotals(*totals)
+
+
+def commit_file_manifest(commit: Commit) -> Optional[FileManifest]:
+    """
+    Files of the report of `commit`, or None when it has no report, like
+    `commit.full_report`.
+    """
+    report = commit.report
+    if not report:
+        return None
+    return FileManifest(report.get("files") or {})
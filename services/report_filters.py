@@ -0,0 +1,174 @@
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from shared.helpers.numeric import ratio
+from shared.reports.filtered import FilteredReportFile
+from shared.reports.resources import Report, ReportFile
+from shared.reports.types import ReportTotals
+from shared.utils.merge import LineType, line_type
+
+from utils.match import path_matcher
+
+SessionIds = Optional[FrozenSet[int]]
+
+
+def _coverage(hits: int, lines: int) -> Optional[str]:
+    # same as the totals computed by `shared`
+    return ratio(hits, lines) if lines else None
+
+
+def _added_lines(diff_file: Dict) -> List[int]:
+    """
+    Line numbers of the head file added by the diff of a file.
+    """
+    added = []
+    for segment in diff_file.get("segments") or []:
+        ln = int(segment["header"][2] or 1)
+        for line in segment["lines"]:
+            if line.startswith("-"):
+                continue
+            if line.startswith("+"):
+                added.append(ln)
+            ln += 1
+    return added
+
+
+class ReportFilters:
+    """
+    Totals of many (flags, paths) filters of a report, e.g. all the components
+    and flags of a compare page, computed together instead of filtering the whole
+    report once per filter:
+
+    - each file of the report is loaded once
+    - the lines of a file are filtered once per distinct set of sessions, and not
+      at all when there is no flag filter
+    - which files match each set of path patterns is computed once
+
+    and the totals of a filter are the sum of the totals of its matching files.
+    """
+
+    def __init__(self, report: Report):
+        self.report = report
+        self._files: Dict[str, Optional[ReportFile]] = {}
+        self._filtered_files: Dict[Tuple[str, SessionIds], ReportFile] = {}
+        self._session_ids: Dict[Tuple[str, ...], FrozenSet[int]] = {}
+        self._matches: Dict[Tuple[str, ...], List[str]] = {}
+
+    def session_ids(self, flags: Optional[Iterable[str]]) -> SessionIds:
+        """
+        Ids of the sessions uploaded with any of `flags`, or None when every
+        session is included.
+        """
+        if not flags:
+            return None
+        key = tuple(sorted(flags))
+        if key not in self._session_ids:
+            self._session_ids[key] = frozenset(
+                sid
+                for sid, session in self.report.sessions.items()
+                if session.flags and set(session.flags) & set(key)
+            )
+        return self._session_ids[key]
+
+    def matching_files(self, paths: Optional[Iterable[str]]) -> List[str]:
+        key = tuple(paths or ())
+        if key not in self._matches:
+            self._matches[key] = path_matcher(key or None).filter(self.report.files)
+        return self._matches[key]
+
+    def _get_file(self, filename: str, session_ids: SessionIds) -> Optional[ReportFile]:
+        if filename not in self._files:
+            self._files[filename] = self.report.get(filename)
+        report_file = self._files[filename]
+        if report_file is None or session_ids is None:
+            return report_file
+
+        key = (filename, session_ids)
+        if key not in self._filtered_files:
+            self._filtered_files[key] = FilteredReportFile(report_file, session_ids)
+        return self._filtered_files[key]
+
+    def _sessions_count(self, session_ids: SessionIds) -> int:
+        if session_ids is None:
+            return len(self.report.sessions)
+        return len(session_ids)
+
+    def totals(
+        self,
+        flags: Optional[Iterable[str]] = None,
+        paths: Optional[Iterable[str]] = None,
+    ) -> ReportTotals:
+        session_ids = self.session_ids(flags)
+        totals = ReportTotals.default_totals()
+        totals.complexity, totals.complexity_total = 0, 0
+        for filename in self.matching_files(paths):
+            report_file = self._get_file(filename, session_ids)
+            if report_file is None:
+                continue
+            file_totals = report_file.totals
+            if not file_totals.lines:
+                continue
+            totals.files += 1
+            totals.lines += file_totals.lines
+            totals.hits += file_totals.hits
+            totals.misses += file_totals.misses
+            totals.partials += file_totals.partials
+            totals.branches += file_totals.branches or 0
+            totals.methods += file_totals.methods or 0
+            totals.messages += file_totals.messages or 0
+            totals.complexity += file_totals.complexity or 0
+            totals.complexity_total += file_totals.complexity_total or 0
+        totals.coverage = _coverage(totals.hits, totals.lines)
+        totals.sessions = self._sessions_count(session_ids)
+        return totals
+
+    def patch_totals(
+        self,
+        diff: Optional[Dict],
+        flags: Optional[Iterable[str]] = None,
+        paths: Optional[Iterable[str]] = None,
+    ) -> Optional[ReportTotals]:
+        """
+        Totals of the lines added by `diff`, like `Report.apply_diff` (see
+        `test_patch_totals_match_apply_diff`).
+        """
+        if not diff or not diff.get("files"):
+            return None
+
+        session_ids = self.session_ids(flags)
+        matching = set(self.matching_files(paths))
+        totals = ReportTotals.default_totals()
+        # complexity isn't computed for the patch
+        totals.complexity, totals.complexity_total = None, None
+        for filename, diff_file in diff["files"].items():
+            if diff_file.get("type") not in ("new", "modified"):
+                continue
+            if filename not in matching:
+                continue
+            report_file = self._get_file(filename, session_ids)
+            if report_file is None:
+                continue
+
+            file_lines = 0
+            for ln in _added_lines(diff_file):
+                line = report_file.get(ln)
+                if line is None:
+                    continue
+                coverage_type = line_type(line.coverage)
+                if coverage_type == LineType.hit:
+                    totals.hits += 1
+                elif coverage_type == LineType.partial:
+                    totals.partials += 1
+                elif coverage_type == LineType.miss:
+                    totals.misses += 1
+                else:
+                    continue
+                file_lines += 1
+                if line.type == "b":
+                    totals.branches += 1
+                elif line.type == "m":
+                    totals.methods += 1
+            if file_lines:
+                totals.files += 1
+                totals.lines += file_lines
+        totals.coverage = _coverage(totals.hits, totals.lines)
+        return totals
@@ -0,0 +1,202 @@
+import hashlib
+import logging
+import os
+import threading
+import zlib
+from typing import Callable, Dict
+
+from django.conf import settings
+from redis.exceptions import RedisError
+from shared.torngit.exceptions import TorngitObjectNotFoundError
+
+from services.provider_cache import single_flight
+from services.redis_configuration import get_redis_connection
+
+log = logging.getLogger(__name__)
+
+# cached instead of a digest for files the provider doesn't have
+NOT_FOUND = "not_found"
+_not_found = object()
+
+# disk usage of the cache directories, estimated by this process
+_disk_lock = threading.Lock()
+_disk_sizes: Dict[str, int] = {}
+
+
+def _index_key(repoid: int, commitid: str, path: str) -> str:
+    path_digest = hashlib.sha256(path.encode()).hexdigest()
+    return f"provider_source/{repoid}/{commitid}/{path_digest}"
+
+
+def _blob_key(digest: str) -> str:
+    return f"provider_source/blob/{digest}"
+
+
+def _disk_path(directory: str, digest: str) -> str:
+    return os.path.join(directory, digest[:2], digest)
+
+
+def _disk_usage(directory: str) -> list[tuple[float, int, str]]:
+    files = []
+    for root, _, names in os.walk(directory):
+        for name in names:
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+    return files
+
+
+def _evict(directory: str, max_bytes: int) -> int:
+    """
+    Removes the least recently used files until the directory is under 90% of
+    `max_bytes`, and returns its size.
+    """
+    files = sorted(_disk_usage(directory))
+    size = sum(file_size for _, file_size, _ in files)
+    for _, file_size, path in files:
+        if size <= max_bytes * 0.9:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        size -= file_size
+    return size
+
+
+def _read_disk(digest: str) -> bytes | None:
+    directory = settings.PROVIDER_SOURCE_DISK_CACHE_DIR
+    if not directory:
+        return None
+    path = _disk_path(directory, digest)
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        # the modification time orders files for eviction
+        os.utime(path)
+        return data
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        log.warning(f"Error reading source cache: {e}")
+        return None
+
+
+def _write_disk(digest: str, data: bytes) -> None:
+    directory = settings.PROVIDER_SOURCE_DISK_CACHE_DIR
+    if not directory:
+        return
+    path = _disk_path(directory, digest)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        max_bytes = settings.PROVIDER_SOURCE_DISK_CACHE_MAX_BYTES
+        with _disk_lock:
+            size = _disk_sizes.get(directory)
+            if size is None:
+                size = sum(file_size for _, file_size, _ in _disk_usage(directory))
+            else:
+                size += len(data)
+            if size > max_bytes:
+                size = _evict(directory, max_bytes)
+            _disk_sizes[directory] = size
+    except OSError as e:
+        log.warning(f"Error writing source cache: {e}")
+
+
+def _lookup(index_key: str) -> str | object | None:
+    try:
+        redis = get_redis_connection()
+        digest = redis.get(index_key)
+        if digest is None:
+            return None
+        digest = digest.decode()
+        if digest == NOT_FOUND:
+            return _not_found
+
+        data = _read_disk(digest)
+        if data is None:
+            data = redis.get(_blob_key(digest))
+            if data is None:
+                return None
+            _write_disk(digest, data)
+    except (OSError, RedisError) as e:
+        log.warning(f"Error connecting to redis: {e}")
+        return None
+    return zlib.decompress(data).decode("utf-8")
+
+
+def _store(index_key: str, content: str) -> None:
+    content = content.encode("utf-8")
+    digest = hashlib.sha256(content).hexdigest()
+    data = zlib.compress(content)
+    if len(data) > settings.PROVIDER_SOURCE_CACHE_MAX_FILE_BYTES:
+        return
+
+    _write_disk(digest, data)
+    ttl = settings.PROVIDER_SOURCE_CACHE_TTL_SECONDS
+    try:
+        redis = get_redis_connection()
+        redis.set(_blob_key(digest), data, ex=ttl)
+        redis.set(index_key, digest, ex=ttl)
+    except (OSError, RedisError) as e:
+        log.warning(f"Error connecting to redis: {e}")
+
+
+def _store_not_found(index_key: str) -> None:
+    try:
+        get_redis_connection().set(
+            index_key, NOT_FOUND, ex=settings.PROVIDER_SOURCE_NOT_FOUND_TTL_SECONDS
+        )
+    except (OSError, RedisError) as e:
+        log.warning(f"Error connecting to redis: {e}")
+
+
+def _decode(source: Dict) -> str:
+    content = source["content"]
+    # When a file received from GH that is larger than 1MB the result will be
+    # pre-decoded and of string type; no need to decode again in that case
+    if isinstance(content, str):
+        return content
+    return content.decode("utf-8")
+
+
+def get_source_content(
+    repoid: int, commitid: str, path: str, fetch: Callable[[], Dict]
+) -> str:
+    """
+    Content of the file at `path` in `commitid`, where `fetch` gets the source
+    from the provider.  Contents are cached by their digest on disk and in redis,
+    and files missing from the provider are remembered for a short while.
+
+    Raises `TorngitObjectNotFoundError` when the file doesn't exist.
+    """
+    if not settings.PROVIDER_SOURCE_CACHE_TTL_SECONDS:
+        return _decode(fetch())
+
+    index_key = _index_key(repoid, commitid, path)
+
+    def fetch_and_store():
+        try:
+            content = _decode(fetch())
+        except TorngitObjectNotFoundError:
+            _store_not_found(index_key)
+            raise
+        _store(index_key, content)
+        return content
+
+    content = single_flight(
+        "source", index_key, lambda: _lookup(index_key), fetch_and_store
+    )
+    if content is _not_found:
+        raise TorngitObjectNotFoundError(
+            response_data=None, message=f"Path {path} not found at {commitid}"
+        )
+    return content
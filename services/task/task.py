@@ -12,7 +12,7 @@ from shared import celery_config
 
 from core.models import Repository
 from services.task.task_router import route_task
-from timeseries.models import Dataset, MeasurementName
+from timeseries.models import Dataset, DatasetBackfillChunk, MeasurementName
 
 celery_app = Celery("tasks")
 celery_app.config_from_object("shared.celery_config:BaseCeleryConfig")
@@ -326,6 +326,50 @@ class TaskService(object):
             ),
         ).apply_async()
 
+    def backfill_dataset_chunks(
+        self,
+        chunks: List[DatasetBackfillChunk],
+        max_concurrency: int,
+    ):
+        """
+        Enqueue a backfill task per chunk.  Chunks are spread round-robin over
+        at most `max_concurrency` chains that run in parallel as a Celery group,
+        so that no more than `max_concurrency` chunks are being backfilled at once.
+        Chunks are expected to be ordered by priority (i.e. most recent first).
+        """
+        if len(chunks) == 0:
+            return
+
+        log.info(
+            "Triggering chunked dataset backfill",
+            extra=dict(
+                dataset_ids=sorted(set(chunk.dataset_id for chunk in chunks)),
+                chunk_count=len(chunks),
+                max_concurrency=max_concurrency,
+            ),
+        )
+
+        lane_count = max(1, min(max_concurrency, len(chunks)))
+        lanes = [
+            chain(
+                [
+                    self._create_signature(
+                        "app.tasks.timeseries.backfill_dataset",
+                        kwargs=dict(
+                            dataset_id=chunk.dataset_id,
+                            chunk_id=chunk.id,
+                            start_date=chunk.start_date.isoformat(),
+                            end_date=chunk.end_date.isoformat(),
+                        ),
+                        immutable=True,
+                    )
+                    for chunk in chunks[lane::lane_count]
+                ]
+            )
+            for lane in range(lane_count)
+        ]
+        group(lanes).apply_async()
+
     def delete_timeseries(self, repository_id: int):
         log.info(
             "Delete repository timeseries data",
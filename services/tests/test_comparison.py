@@ -8,7 +8,7 @@ from unittest.mock import PropertyMock, patch
 import minio
 import pytest
 import pytz
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from shared.django_apps.core.tests.factories import (
     CommitFactory,
     OwnerFactory,
@@ -1616,6 +1616,11 @@ mocked_files_with_direct_and_indirect_changes = """
 
 class ComparisonReportTest(TestCase):
     def setUp(self):
+        # the parsed files of the comparisons are cached by the process
+        patcher = patch.dict("services.comparison._comparison_files", clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
         self.user = OwnerFactory(username="codecov-user")
         self.parent_commit = CommitFactory()
         self.commit = CommitFactory(
@@ -1651,6 +1656,52 @@ class ComparisonReportTest(TestCase):
         impacted_file = self.comparison_report.impacted_file("fileB")
         assert impacted_file.head_name == "fileB"
 
+    @patch("shared.api_archive.archive.ArchiveService.read_file")
+    def test_impacted_file_lookups_read_storage_once(self, read_file):
+        read_file.return_value = mock_data_from_archive
+
+        assert self.comparison_report.impacted_file("fileA").head_name == "fileA"
+        assert self.comparison_report.impacted_file("fileB").head_name == "fileB"
+        assert self.comparison_report.impacted_file("fileC") is None
+        assert set(self.comparison_report.files_by_path) == {"fileA", "fileB"}
+
+        assert read_file.call_count == 1
+
+    @patch("shared.api_archive.archive.ArchiveService.read_file")
+    def test_impacted_file_invalid_data(self, read_file):
+        read_file.return_value = "{"
+        assert self.comparison_report.impacted_file("fileA") is None
+        assert self.comparison_report.impacted_file("fileA") is None
+
+    @override_settings(COMPARISON_REPORT_CACHE_SIZE=1)
+    @patch("shared.api_archive.archive.ArchiveService.read_file")
+    def test_files_cached_by_storage_path(self, read_file):
+        read_file.return_value = mock_data_from_archive
+        files = self.comparison_report.files
+
+        # e.g. the comparison of a following request
+        comparison_report = ComparisonReport(self.comparison)
+        assert comparison_report.files is files
+        assert comparison_report.impacted_file("fileB") is files[1]
+        assert read_file.call_count == 1
+
+        # the comparison was recomputed
+        self.comparison.save()
+        assert ComparisonReport(self.comparison).files is not files
+        assert read_file.call_count == 2
+
+    @override_settings(COMPARISON_REPORT_CACHE_SIZE=1)
+    @patch("shared.api_archive.archive.ArchiveService.read_file")
+    def test_impacted_file_cached_across_requests(self, read_file):
+        read_file.return_value = mock_data_from_archive
+
+        # e.g. the impacted files of a pull request looked up by following requests
+        assert self.comparison_report.impacted_file("fileA").head_name == "fileA"
+        comparison_report = ComparisonReport(self.comparison)
+        assert comparison_report.impacted_file("fileB").head_name == "fileB"
+        assert comparison_report.impacted_file("fileC") is None
+        assert read_file.call_count == 1
+
     @patch("shared.api_archive.archive.ArchiveService.read_file")
     def test_impacted_files_filtered_by_indirect_changes(self, read_file):
         read_file.return_value = mock_data_from_archive
@@ -1785,6 +1836,13 @@ class ComparisonReportTest(TestCase):
         assert file.has_changes is True
 
 
+@override_settings(COMPARISON_REPORT_CACHE_SIZE=32)
+class CachedComparisonReportTest(ComparisonReportTest):
+    """
+    Tests of `ComparisonReport` with the cache enabled, as in production.
+    """
+
+
 class CommitComparisonTests(TestCase):
     def setUp(self):
         self.base_commit = CommitFactory(updatestamp=datetime(2023, 1, 1))
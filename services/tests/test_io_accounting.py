@@ -0,0 +1,132 @@
+import fakeredis
+from asgiref.sync import async_to_sync
+from django.http import HttpResponse
+from django.test import override_settings
+from shared.storage.memory import MemoryStorageService
+
+from services.io_accounting import (
+    PROVIDER,
+    REDIS,
+    STORAGE,
+    AccountedRedis,
+    IOAccounting,
+    account_adapter_client,
+    accounted_proxy,
+    instrument_class,
+    io_accounting,
+)
+from services.provider_clients import pool_adapter_client
+from services.tests.test_provider_clients import FakeAdapter
+
+
+def test_io_accounting_nested():
+    with io_accounting() as outer:
+        with io_accounting() as inner:
+            assert inner is None
+    assert isinstance(outer, IOAccounting)
+
+
+@override_settings(IO_ACCOUNTING_ENABLED=False)
+def test_io_accounting_disabled():
+    redis = fakeredis.FakeStrictRedis()
+
+    with io_accounting() as accounting:
+        assert accounting is None
+    assert accounted_proxy(redis, REDIS) is redis
+
+
+def test_redis_calls_accounted():
+    redis = accounted_proxy(fakeredis.FakeStrictRedis(), REDIS)
+
+    with io_accounting() as accounting:
+        redis.set("key", "value")
+        assert redis.get("key") == b"value"
+
+    totals = accounting.backends[REDIS]
+    assert totals.calls == 2
+    assert totals.bytes == len("keyvalue") + len("key") + len(b"value")
+    assert totals.seconds > 0
+
+    # calls made outside of a request aren't accounted
+    redis.get("key")
+    assert accounting.backends[REDIS].calls == 2
+
+
+def test_redis_pipeline_accounted():
+    redis = accounted_proxy(fakeredis.FakeStrictRedis(), REDIS, AccountedRedis)
+
+    with io_accounting() as accounting:
+        pipeline = redis.pipeline()
+        pipeline.set("key", "value")
+        pipeline.get("key")
+        assert pipeline.execute() == [True, b"value"]
+
+        with redis.pipeline() as pipeline:
+            assert pipeline.get("key").execute() == [b"value"]
+
+    # the commands are only sent by `execute`
+    assert accounting.backends[REDIS].calls == 2
+
+
+def test_storage_calls_accounted():
+    storage = accounted_proxy(MemoryStorageService({}), STORAGE)
+    storage.create_root_storage("bucket")
+
+    with io_accounting() as accounting:
+        storage.write_file("bucket", "path", b"x" * 100)
+        assert storage.read_file("bucket", "path") == b"x" * 100
+
+    assert accounting.backends[STORAGE].calls == 2
+    assert accounting.backends[STORAGE].bytes >= 200
+
+
+def test_instrument_class():
+    class Archive:
+        def read_file(self, path):
+            return b"data"
+
+    instrument_class(Archive, ["read_file", "write_file"], STORAGE)
+    instrument_class(Archive, ["read_file"], STORAGE)
+
+    with io_accounting() as accounting:
+        Archive().read_file("path")
+
+    assert accounting.backends[STORAGE].calls == 1
+    assert accounting.backends[STORAGE].bytes == len("path") + len(b"data")
+
+
+@override_settings(PROVIDER_HTTP_POOLING_ENABLED=True)
+def test_provider_requests_accounted():
+    adapter = account_adapter_client(pool_adapter_client(FakeAdapter(), "github"))
+
+    with io_accounting() as accounting:
+        assert async_to_sync(adapter.api)("/repos") == {"path": "/repos"}
+        assert async_to_sync(adapter.api)("/user") == {"path": "/user"}
+
+    assert accounting.backends[PROVIDER].calls == 2
+    assert accounting.backends[PROVIDER].bytes > 0
+
+
+def test_finish():
+    accounting = IOAccounting()
+    accounting.record(REDIS, 0.002, 10)
+    accounting.record(REDIS, 0.001, 5)
+    accounting.record(STORAGE, 0.0125, 4096)
+    response = HttpResponse()
+    response["Server-Timing"] = "app;dur=20"
+
+    accounting.finish("test-view", response)
+
+    assert response["Server-Timing"] == (
+        "app;dur=20, "
+        'redis;dur=3.0;desc="2 calls, 15 bytes", '
+        'storage;dur=12.5;desc="1 calls, 4096 bytes"'
+    )
+
+
+def test_finish_without_io():
+    response = HttpResponse()
+
+    IOAccounting().finish("test-view", response)
+
+    assert not response.has_header("Server-Timing")
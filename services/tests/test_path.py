@@ -308,7 +308,12 @@ class TestPathMisc(TestCase):
         self.repo = "yios"
         self.commit_sha = "540feb1e8c5d39b714c43874d0aa9da02ad257b7"
         self.commit = MagicMock(
-            commitid=self.commit_sha, full_report=self.sample_report
+            commitid=self.commit_sha,
+            report={
+                "files": {
+                    name: [i, None] for i, name in enumerate(self.sample_report.files)
+                }
+            },
         )
 
     def test_dashboard_commit_file_url_path_none(self):
@@ -0,0 +1,115 @@
+from unittest.mock import MagicMock, patch
+
+import fakeredis
+import pytest
+from django.test import override_settings
+from redis.exceptions import ConnectionError
+
+from services.permissions_cache import cached_provider_check, cached_provider_checks
+
+
+@pytest.fixture
+def redis():
+    redis = fakeredis.FakeStrictRedis()
+    with patch("services.permissions_cache.get_redis_connection", return_value=redis):
+        yield redis
+
+
+@override_settings(PROVIDER_PERMISSIONS_CACHE_TTL_SECONDS=0)
+def test_cache_disabled(redis):
+    fetch = MagicMock(return_value=True)
+
+    assert cached_provider_check("is_admin", (1, 2), fetch) is True
+    assert cached_provider_check("is_admin", (1, 2), fetch) is True
+
+    assert fetch.call_count == 2
+    assert redis.keys() == []
+
+
+@override_settings(PROVIDER_PERMISSIONS_CACHE_TTL_SECONDS=300)
+def test_cached(redis):
+    fetch = MagicMock(return_value=[True, False])
+
+    assert cached_provider_check("repo_permissions", (1, 2), fetch) == [True, False]
+    assert cached_provider_check("repo_permissions", (1, 2), fetch) == [True, False]
+    # other checks and ids are cached separately
+    assert cached_provider_check("repo_permissions", (1, 3), fetch) == [True, False]
+    assert cached_provider_check("is_admin", (1, 2), fetch) == [True, False]
+
+    assert fetch.call_count == 3
+    assert 0 < redis.ttl("provider_permissions/repo_permissions/1/2") <= 300
+
+
+@override_settings(PROVIDER_PERMISSIONS_CACHE_TTL_SECONDS=300)
+def test_bulk_fetches_missing_only(redis):
+    cached_provider_check("is_admin", (1, 2), lambda: True)
+    fetch = MagicMock(return_value=[False, True])
+
+    assert cached_provider_checks("is_admin", [(1, 1), (1, 2), (1, 3)], fetch) == [
+        False,
+        True,
+        True,
+    ]
+
+    fetch.assert_called_once_with([0, 2])
+
+
+@override_settings(
+    PROVIDER_PERMISSIONS_CACHE_TTL_SECONDS=300, PROVIDER_PERMISSIONS_REFRESH_AHEAD=0.8
+)
+def test_refresh_ahead(redis):
+    with patch("services.permissions_cache.time.time", return_value=1000):
+        cached_provider_check("is_admin", (1, 2), lambda: False)
+
+    fetch = MagicMock(return_value=True)
+    with patch("services.permissions_cache.time.time", return_value=1100):
+        # still fresh
+        assert cached_provider_check("is_admin", (1, 2), fetch) is False
+    assert fetch.call_count == 0
+
+    with patch("services.permissions_cache.time.time", return_value=1250):
+        # refreshed ahead of the expiry
+        assert cached_provider_check("is_admin", (1, 2), fetch) is True
+        assert cached_provider_check("is_admin", (1, 2), fetch) is True
+    assert fetch.call_count == 1
+
+
+@override_settings(
+    PROVIDER_PERMISSIONS_CACHE_TTL_SECONDS=300, PROVIDER_PERMISSIONS_REFRESH_AHEAD=0.8
+)
+def test_refresh_ahead_single_refresher(redis):
+    with patch("services.permissions_cache.time.time", return_value=1000):
+        cached_provider_check("is_admin", (1, 2), lambda: False)
+
+    # another request is already refreshing the entry
+    redis.set("provider_permissions/is_admin/1/2/refresh", 1)
+    fetch = MagicMock(return_value=True)
+    with patch("services.permissions_cache.time.time", return_value=1250):
+        assert cached_provider_check("is_admin", (1, 2), fetch) is False
+    assert fetch.call_count == 0
+
+
+@override_settings(
+    PROVIDER_PERMISSIONS_CACHE_TTL_SECONDS=300, PROVIDER_PERMISSIONS_REFRESH_AHEAD=0.8
+)
+def test_refresh_ahead_failure(redis):
+    with patch("services.permissions_cache.time.time", return_value=1000):
+        cached_provider_check("is_admin", (1, 2), lambda: True)
+
+    fetch = MagicMock(side_effect=Exception("provider unavailable"))
+    with patch("services.permissions_cache.time.time", return_value=1250):
+        assert cached_provider_check("is_admin", (1, 2), fetch) is True
+
+    with pytest.raises(Exception):
+        cached_provider_check("is_admin", (1, 3), fetch)
+
+
+@override_settings(PROVIDER_PERMISSIONS_CACHE_TTL_SECONDS=300)
+def test_redis_unavailable(redis):
+    redis.mget = MagicMock(side_effect=ConnectionError())
+    redis.set = MagicMock(side_effect=ConnectionError())
+    fetch = MagicMock(return_value=True)
+
+    assert cached_provider_check("is_admin", (1, 2), fetch) is True
+    assert cached_provider_check("is_admin", (1, 2), fetch) is True
+    assert fetch.call_count == 2
@@ -212,7 +212,7 @@ class ProfilingSummaryTests(TestCase):
             ownerid=self.repo.author.ownerid,
         )
 
-    @patch("shared.reports.api_report_service.build_report_from_commit")
+    @patch("services.profiling.commit_file_manifest")
     @patch("services.profiling.UserYaml.get_final_yaml")
     @patch("services.profiling.ProfilingSummary.summary_data")
     @patch("services.profiling.ProfilingSummary.latest_profiling_commit")
@@ -247,7 +247,7 @@ class ProfilingSummaryTests(TestCase):
         )
         mocked_reportservice.assert_called()
 
-    @patch("shared.reports.api_report_service.build_report_from_commit")
+    @patch("services.profiling.commit_file_manifest")
     @patch("services.profiling.UserYaml.get_final_yaml")
     @patch("services.profiling.ProfilingSummary.summary_data")
     @patch("services.profiling.ProfilingSummary.latest_profiling_commit")
@@ -292,7 +292,7 @@ class ProfilingSummaryTests(TestCase):
         )
         mocked_reportservice.assert_called()
 
-    @patch("shared.reports.api_report_service.build_report_from_commit")
+    @patch("services.profiling.commit_file_manifest")
     @patch("services.profiling.UserYaml.get_final_yaml")
     @patch("services.profiling.ProfilingSummary.summary_data")
     @patch("services.profiling.ProfilingSummary.latest_profiling_commit")
@@ -326,7 +326,7 @@ class ProfilingSummaryTests(TestCase):
         mocked_useryaml.assert_called()
         mocked_reportservice.assert_called()
 
-    @patch("shared.reports.api_report_service.build_report_from_commit")
+    @patch("services.profiling.commit_file_manifest")
     @patch("services.profiling.UserYaml.get_final_yaml")
     @patch("services.profiling.ProfilingSummary.summary_data")
     @patch("services.profiling.ProfilingSummary.latest_profiling_commit")
@@ -370,7 +370,7 @@ class ProfilingSummaryTests(TestCase):
             "src/critical/very_important.json",
         ]
 
-    @patch("shared.reports.api_report_service.build_report_from_commit")
+    @patch("services.profiling.commit_file_manifest")
     @patch("services.profiling.UserYaml.get_final_yaml")
     @patch("services.profiling.ProfilingSummary.summary_data")
     @patch("services.profiling.ProfilingSummary.latest_profiling_commit")
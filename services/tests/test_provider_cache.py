@@ -0,0 +1,138 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+import fakeredis
+import pytest
+from redis.exceptions import ConnectionError
+
+from services.provider_cache import _set_cached, cached_provider_payload
+
+COMPARE = {"diff": {"files": {"a.py": {"type": "modified"}}}, "commits": []}
+
+
+@pytest.fixture
+def redis():
+    redis = fakeredis.FakeStrictRedis()
+    with patch("services.provider_cache.get_redis_connection", return_value=redis):
+        yield redis
+
+
+def test_cache_disabled(redis):
+    fetch = MagicMock(return_value=COMPARE)
+
+    assert cached_provider_payload("compare", "1/a/b", fetch, 0, 1000) == COMPARE
+    assert cached_provider_payload("compare", "1/a/b", fetch, 0, 1000) == COMPARE
+
+    assert fetch.call_count == 2
+    assert redis.keys() == []
+
+
+def test_cached(redis):
+    fetch = MagicMock(return_value=COMPARE)
+
+    assert cached_provider_payload("compare", "1/a/b", fetch, 60, 1000) == COMPARE
+    assert cached_provider_payload("compare", "1/a/b", fetch, 60, 1000) == COMPARE
+    assert cached_provider_payload("compare", "1/a/c", fetch, 60, 1000) == COMPARE
+
+    assert fetch.call_count == 2
+    assert 0 < redis.ttl("provider_payload/compare/1/a/b") <= 60
+    assert redis.get("provider_payload/compare/1/a/b/lock") is None
+
+
+def test_too_large_not_cached(redis):
+    fetch = MagicMock(return_value=COMPARE)
+
+    cached_provider_payload("compare", "1/a/b", fetch, 60, 10)
+    cached_provider_payload("compare", "1/a/b", fetch, 60, 10)
+
+    assert fetch.call_count == 2
+    assert redis.get("provider_payload/compare/1/a/b") is None
+
+
+def test_fetch_error_releases_lock(redis):
+    fetch = MagicMock(side_effect=[Exception("provider down"), COMPARE])
+
+    with pytest.raises(Exception):
+        cached_provider_payload("compare", "1/a/b", fetch, 60, 1000)
+    assert cached_provider_payload("compare", "1/a/b", fetch, 60, 1000) == COMPARE
+
+
+@patch("services.provider_cache.WAIT_INTERVAL_SECONDS", 0.01)
+def test_waits_for_other_fetch(redis):
+    # another process is fetching the compare and caches it while we wait
+    redis.set("provider_payload/compare/1/a/b/lock", 1)
+    threading.Timer(
+        0.05, lambda: _set_cached("provider_payload/compare/1/a/b", COMPARE, 60, 1000)
+    ).start()
+    fetch = MagicMock()
+
+    assert cached_provider_payload("compare", "1/a/b", fetch, 60, 1000) == COMPARE
+
+    fetch.assert_not_called()
+    # the other process' lock is left alone
+    assert redis.get("provider_payload/compare/1/a/b/lock") == b"1"
+
+
+def test_redis_unavailable(redis):
+    redis.get = MagicMock(side_effect=ConnectionError())
+    redis.set = MagicMock(side_effect=ConnectionError())
+    fetch = MagicMock(return_value=COMPARE)
+
+    assert cached_provider_payload("compare", "1/a/b", fetch, 60, 1000) == COMPARE
+    fetch.assert_called_once()
+
+
+def test_threads_share_fetch(redis):
+    fetching = threading.Event()
+    done = threading.Event()
+
+    def fetch():
+        fetching.set()
+        done.wait(1)
+        return COMPARE
+
+    fetch_mock = MagicMock(side_effect=fetch)
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                cached_provider_payload("compare", "1/a/b", fetch_mock, 60, 1000)
+            )
+        )
+        for _ in range(3)
+    ]
+    threads[0].start()
+    fetching.wait(1)
+    for thread in threads[1:]:
+        thread.start()
+    done.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == [COMPARE] * 3
+    fetch_mock.assert_called_once()
+
+
+def test_threads_fetch_other_keys(redis):
+    fetching = threading.Event()
+    done = threading.Event()
+
+    def slow_fetch():
+        fetching.set()
+        done.wait(5)
+        return COMPARE
+
+    thread = threading.Thread(
+        target=cached_provider_payload,
+        args=("compare", "1/a/b", slow_fetch, 60, 1000),
+    )
+    thread.start()
+    fetching.wait(1)
+
+    # doesn't wait for the fetch of another key
+    fetch = MagicMock(return_value=COMPARE)
+    assert cached_provider_payload("compare", "1/a/c", fetch, 60, 1000) == COMPARE
+    assert not done.is_set()
+
+    done.set()
+    thread.join()
@@ -0,0 +1,85 @@
+from unittest.mock import MagicMock, patch
+
+import httpx
+from asgiref.sync import async_to_sync
+from django.test import override_settings
+
+from services.provider_clients import pool_adapter_client
+from services.repo_providers import _decrypted_tokens, decrypt_oauth_token
+
+
+class FakeAdapter:
+    def __init__(self):
+        self.clients = []
+
+    def get_service_url(self):
+        return "https://provider.test"
+
+    def get_client(self, timeout=None):
+        def handler(request):
+            return httpx.Response(200, json={"path": request.url.path})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        self.clients.append(client)
+        return client
+
+    async def api(self, path):
+        async with self.get_client() as client:
+            response = await client.get(f"{self.get_service_url()}{path}")
+            return response.json()
+
+
+@override_settings(PROVIDER_HTTP_POOLING_ENABLED=True)
+def test_pooled_client_reused_across_event_loops():
+    first, second = FakeAdapter(), FakeAdapter()
+    pool_adapter_client(first, "github")
+    pool_adapter_client(second, "github")
+
+    assert async_to_sync(first.api)("/repos") == {"path": "/repos"}
+    assert async_to_sync(second.api)("/user") == {"path": "/user"}
+    assert async_to_sync(first.api)("/repos") == {"path": "/repos"}
+
+    # a single client was created and it wasn't closed by leaving `async with`
+    assert len(first.clients) == 1
+    assert second.clients == []
+    assert not first.clients[0].is_closed
+
+
+@override_settings(PROVIDER_HTTP_POOLING_ENABLED=True)
+def test_pooled_client_per_client_options():
+    adapter = pool_adapter_client(FakeAdapter(), "gitlab")
+
+    assert adapter.get_client(timeout=5) is adapter.get_client(timeout=5)
+    assert adapter.get_client(timeout=5) is not adapter.get_client(timeout=10)
+
+
+@override_settings(PROVIDER_HTTP_POOLING_ENABLED=False)
+def test_pooling_disabled():
+    adapter = pool_adapter_client(FakeAdapter(), "github")
+
+    assert async_to_sync(adapter.api)("/repos") == {"path": "/repos"}
+    assert async_to_sync(adapter.api)("/repos") == {"path": "/repos"}
+    assert len(adapter.clients) == 2
+
+
+@override_settings(PROVIDER_HTTP_POOLING_ENABLED=True)
+def test_mocked_adapter_unchanged():
+    adapter = MagicMock()
+    get_client = adapter.get_client
+
+    assert pool_adapter_client(adapter, "github") is adapter
+    assert adapter.get_client is get_client
+
+
+@override_settings(PROVIDER_TOKEN_CACHE_TTL_SECONDS=300)
+@patch("services.repo_providers.encryptor.decrypt_token")
+def test_decrypt_oauth_token_cached(decrypt_token):
+    _decrypted_tokens.clear()
+    decrypt_token.side_effect = lambda oauth_token: {"key": f"{oauth_token}-key"}
+
+    token = decrypt_oauth_token("encrypted")
+    token["username"] = "codecov"
+
+    assert decrypt_oauth_token("encrypted") == {"key": "encrypted-key"}
+    assert decrypt_oauth_token("refreshed") == {"key": "refreshed-key"}
+    assert decrypt_token.call_count == 2
@@ -16,6 +16,8 @@ from shared.utils.sessions import Session
 
 from reports.tests.factories import UploadFactory, UploadFlagMembershipFactory
 from services.report import (
+    FileManifest,
+    commit_file_manifest,
     files_belonging_to_flags,
 )
 
@@ -398,3 +400,29 @@ class ReportServiceTest(TestCase):
         files = files_belonging_to_flags(commit_report=commit_report, flags=flags)
         assert len(files) == 0
         assert files == []
+
+    def test_commit_file_manifest(self):
+        commit = CommitWithReportFactory.create(message="aaaaa", commitid="abf6d4d")
+        manifest = commit_file_manifest(commit)
+        assert manifest.files == [
+            "awesome/__init__.py",
+            "tests/__init__.py",
+            "tests/test_sample.py",
+        ]
+        assert len(manifest) == 3
+        assert "tests/__init__.py" in manifest
+        assert "tests" not in manifest
+        assert "missing.py" not in manifest
+        totals = manifest.totals("awesome/__init__.py")
+        assert (totals.lines, totals.hits, totals.misses) == (10, 8, 2)
+        assert totals.coverage == "80.00000"
+        assert manifest.totals("missing.py") is None
+
+    def test_commit_file_manifest_no_report(self):
+        assert commit_file_manifest(CommitFactory()) is None
+
+    def test_file_manifest_without_totals(self):
+        manifest = FileManifest({"b.py": [1, None], "a.py": [0, None]})
+        assert list(manifest) == ["a.py", "b.py"]
+        assert "a.py" in manifest
+        assert manifest.totals("a.py") is None
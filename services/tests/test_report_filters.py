@@ -0,0 +1,144 @@
+from copy import deepcopy
+
+import pytest
+from shared.reports.resources import Report, ReportFile, ReportLine
+from shared.utils.sessions import Session
+
+from services.report_filters import ReportFilters
+
+
+def sample_report():
+    report = Report()
+    first_file = ReportFile("src/file_1.go")
+    first_file.append(1, ReportLine.create(coverage=1, sessions=[[0, 1]]))
+    first_file.append(2, ReportLine.create(coverage=0, sessions=[[0, 0]]))
+    first_file.append(3, ReportLine.create(coverage=1, sessions=[[0, 0], [1, 1]]))
+    first_file.append(4, ReportLine.create(coverage=0, sessions=[[1, 0]]))
+    second_file = ReportFile("tests/file_2.py")
+    second_file.append(1, ReportLine.create(coverage=1, sessions=[[1, 1]]))
+    second_file.append(
+        2, ReportLine.create(coverage="1/2", type="b", sessions=[[0, "1/2"]])
+    )
+    report.append(first_file)
+    report.append(second_file)
+    report.add_session(Session(flags=["unit"]))
+    report.add_session(Session(flags=["integration"]))
+    return report
+
+
+@pytest.mark.parametrize(
+    "flags, paths",
+    [
+        (None, None),
+        (["unit"], None),
+        (["integration"], None),
+        (["unit", "integration"], None),
+        (None, [r"^src/.*"]),
+        (["unit"], [r".*\.py"]),
+        (["missing"], None),
+    ],
+)
+def test_totals_match_filtered_report(flags, paths):
+    report = sample_report()
+    expected = report.filter(flags=flags, paths=paths).totals
+
+    totals = ReportFilters(report).totals(flags=flags, paths=paths)
+
+    assert totals.lines == expected.lines
+    assert totals.hits == expected.hits
+    assert totals.misses == expected.misses
+    assert totals.partials == expected.partials
+    assert totals.branches == expected.branches
+    assert float(totals.coverage or 0) == float(expected.coverage or 0)
+
+
+def test_coverage_format():
+    report = Report()
+    report_file = ReportFile("src/file_1.go")
+    report_file.append(1, ReportLine.create(coverage=0, sessions=[[0, 0]]))
+    report.append(report_file)
+    report.add_session(Session(flags=["unit"]))
+
+    totals = ReportFilters(report).totals()
+
+    assert totals.coverage == report.totals.coverage == "0"
+
+
+def test_files_filtered_once_per_session_set():
+    filters = ReportFilters(sample_report())
+
+    filters.totals(flags=["unit"], paths=[r"^src/.*"])
+    filters.totals(flags=["unit"], paths=[r".*\.py"])
+    filters.totals(flags=["unit"])
+    filters.totals()
+
+    assert len(filters._files) == 2
+    assert len(filters._filtered_files) == 2
+
+
+DIFF = {
+    "files": {
+        "src/file_1.go": {
+            "type": "modified",
+            "segments": [
+                {
+                    "header": ["1", "2", "1", "4"],
+                    "lines": ["-line", "+line", " line", "+line", "+line"],
+                }
+            ],
+        },
+        "tests/file_2.py": {"type": "deleted"},
+    }
+}
+
+
+def test_patch_totals():
+    diff = deepcopy(DIFF)
+    filters = ReportFilters(sample_report())
+
+    totals = filters.patch_totals(diff)
+    assert (totals.lines, totals.hits, totals.misses) == (3, 2, 1)
+    assert totals.coverage == "66.66667"
+
+    # line 3 isn't covered by the unit session, line 4 isn't in it at all
+    totals = filters.patch_totals(diff, flags=["unit"])
+    assert (totals.lines, totals.hits, totals.misses) == (2, 1, 1)
+
+    totals = filters.patch_totals(diff, paths=[r".*\.py"])
+    assert totals.lines == 0
+    assert totals.coverage is None
+
+    assert filters.patch_totals({"files": {}}) is None
+
+
+@pytest.mark.parametrize(
+    "flags, paths",
+    [
+        (None, None),
+        (["unit"], None),
+        (["integration"], None),
+        (None, [r"^src/.*"]),
+        (["unit"], [r".*\.py"]),
+    ],
+)
+def test_patch_totals_match_apply_diff(flags, paths):
+    diff = deepcopy(DIFF)
+    diff["files"]["tests/file_2.py"] = {
+        "type": "new",
+        "segments": [{"header": ["0", "0", "1", "2"], "lines": ["+line", "+line"]}],
+    }
+    report = sample_report()
+    expected = report.filter(flags=flags, paths=paths).apply_diff(deepcopy(diff))
+
+    totals = ReportFilters(report).patch_totals(diff, flags=flags, paths=paths)
+
+    if expected is None or not expected.lines:
+        assert totals is None or not totals.lines
+        return
+    assert totals.files == expected.files
+    assert totals.lines == expected.lines
+    assert totals.hits == expected.hits
+    assert totals.misses == expected.misses
+    assert totals.partials == expected.partials
+    assert totals.branches == expected.branches
+    assert totals.coverage == expected.coverage
@@ -0,0 +1,124 @@
+import os
+from unittest.mock import MagicMock, patch
+
+import fakeredis
+import pytest
+from django.test import override_settings
+from redis.exceptions import ConnectionError
+from shared.torngit.exceptions import TorngitObjectNotFoundError
+
+from services import source_cache
+from services.source_cache import get_source_content
+
+
+@pytest.fixture
+def redis():
+    redis = fakeredis.FakeStrictRedis()
+    with patch("services.source_cache.get_redis_connection", return_value=redis):
+        with patch("services.provider_cache.get_redis_connection", return_value=redis):
+            yield redis
+
+
+@pytest.fixture
+def cache_settings(tmp_path):
+    source_cache._disk_sizes.clear()
+    with override_settings(
+        PROVIDER_SOURCE_CACHE_TTL_SECONDS=60,
+        PROVIDER_SOURCE_NOT_FOUND_TTL_SECONDS=10,
+        PROVIDER_SOURCE_CACHE_MAX_FILE_BYTES=1024,
+        PROVIDER_SOURCE_DISK_CACHE_DIR=str(tmp_path),
+        PROVIDER_SOURCE_DISK_CACHE_MAX_BYTES=1024 * 1024,
+    ):
+        yield tmp_path
+
+
+@override_settings(PROVIDER_SOURCE_CACHE_TTL_SECONDS=0)
+def test_cache_disabled(redis):
+    fetch = MagicMock(return_value={"content": b"print('hello')"})
+
+    assert get_source_content(1, "abc", "a.py", fetch) == "print('hello')"
+    assert get_source_content(1, "abc", "a.py", fetch) == "print('hello')"
+
+    assert fetch.call_count == 2
+    assert redis.keys() == []
+
+
+def test_cached(redis, cache_settings):
+    fetch = MagicMock(return_value={"content": b"print('hello')"})
+
+    assert get_source_content(1, "abc", "a.py", fetch) == "print('hello')"
+    assert get_source_content(1, "abc", "a.py", fetch) == "print('hello')"
+    assert fetch.call_count == 1
+
+    # the same content at another commit is stored once
+    assert get_source_content(1, "def", "a.py", fetch) == "print('hello')"
+    assert fetch.call_count == 2
+    assert len(redis.keys("provider_source/blob/*")) == 1
+    assert len([f for _, _, files in os.walk(cache_settings) for f in files]) == 1
+
+
+def test_string_content(redis, cache_settings):
+    fetch = MagicMock(return_value={"content": "print('hello')"})
+
+    assert get_source_content(1, "abc", "a.py", fetch) == "print('hello')"
+    assert get_source_content(1, "abc", "a.py", fetch) == "print('hello')"
+    assert fetch.call_count == 1
+
+
+def test_served_from_redis_without_disk(redis, cache_settings):
+    fetch = MagicMock(return_value={"content": b"print('hello')"})
+    get_source_content(1, "abc", "a.py", fetch)
+
+    for root, _, files in os.walk(cache_settings):
+        for name in files:
+            os.remove(os.path.join(root, name))
+
+    assert get_source_content(1, "abc", "a.py", fetch) == "print('hello')"
+    assert fetch.call_count == 1
+
+
+def test_not_found_cached(redis, cache_settings):
+    fetch = MagicMock(
+        side_effect=TorngitObjectNotFoundError(response_data=None, message="missing")
+    )
+
+    with pytest.raises(TorngitObjectNotFoundError):
+        get_source_content(1, "abc", "a.py", fetch)
+    with pytest.raises(TorngitObjectNotFoundError):
+        get_source_content(1, "abc", "a.py", fetch)
+
+    assert fetch.call_count == 1
+    (key,) = redis.keys("provider_source/1/abc/*")
+    assert 0 < redis.ttl(key) <= 10
+
+
+def test_large_file_not_cached(redis, cache_settings):
+    content = os.urandom(2048).hex()
+    fetch = MagicMock(return_value={"content": content})
+
+    assert get_source_content(1, "abc", "a.py", fetch) == content
+    assert get_source_content(1, "abc", "a.py", fetch) == content
+    assert fetch.call_count == 2
+
+
+def test_disk_eviction(redis, cache_settings):
+    with override_settings(PROVIDER_SOURCE_DISK_CACHE_MAX_BYTES=150):
+        for i in range(10):
+            content = os.urandom(32).hex()
+            get_source_content(1, "abc", f"{i}.py", lambda: {"content": content})
+
+    size = sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, files in os.walk(cache_settings)
+        for name in files
+    )
+    assert 0 < size <= 150
+
+
+def test_redis_unavailable(redis, cache_settings):
+    redis.get = MagicMock(side_effect=ConnectionError())
+    redis.set = MagicMock(side_effect=ConnectionError())
+    fetch = MagicMock(return_value={"content": b"print('hello')"})
+
+    assert get_source_content(1, "abc", "a.py", fetch) == "print('hello')"
+    fetch.assert_called_once()
@@ -8,6 +8,7 @@ from shared import celery_config
 from shared.django_apps.core.tests.factories import RepositoryFactory
 
 from services.task import TaskService, celery_app
+from timeseries.models import DatasetBackfillChunk
 from timeseries.tests.factories import DatasetFactory
 
 
@@ -202,6 +203,51 @@ def test_backfill_dataset(mocker):
     signature.apply_async.assert_called_once_with()
 
 
+def test_backfill_dataset_chunks(mocker):
+    signature_mock = mocker.patch("services.task.task.signature")
+    mocker.patch("services.task.task.route_task", return_value={"queue": "celery"})
+    chain_mock = mocker.patch("services.task.task.chain")
+    group_mock = mocker.patch("services.task.task.group")
+
+    chunks = [
+        DatasetBackfillChunk(
+            id=day,
+            dataset_id=1,
+            start_date=datetime(2022, 1, day),
+            end_date=datetime(2022, 1, day + 1),
+        )
+        for day in [5, 4, 3, 2, 1]
+    ]
+    TaskService().backfill_dataset_chunks(chunks, max_concurrency=2)
+
+    assert signature_mock.call_count == 5
+    signature_mock.assert_any_call(
+        "app.tasks.timeseries.backfill_dataset",
+        args=None,
+        kwargs=dict(
+            dataset_id=1,
+            chunk_id=5,
+            start_date="2022-01-05T00:00:00",
+            end_date="2022-01-06T00:00:00",
+        ),
+        app=celery_app,
+        queue="celery",
+        soft_time_limit=None,
+        time_limit=None,
+        headers=mocker.ANY,
+        immutable=True,
+    )
+    # chunks are spread over 2 chains of 3 and 2 tasks
+    assert [len(call.args[0]) for call in chain_mock.call_args_list] == [3, 2]
+    group_mock.return_value.apply_async.assert_called_once_with()
+
+
+def test_backfill_dataset_chunks_no_chunks(mocker):
+    group_mock = mocker.patch("services.task.task.group")
+    TaskService().backfill_dataset_chunks([], max_concurrency=2)
+    group_mock.assert_not_called()
+
+
 @freeze_time("2023-06-13T10:01:01.000123")
 def test_timeseries_delete(mocker):
     signature_mock = mocker.patch("services.task.task.signature")
@@ -22,7 +22,7 @@ class CommitFromShaSerializerField(serializers.Field):
     def to_internal_value(self, commit_sha):
         # TODO: Change this query when we change how we fetch URLs
         commit = Commit.objects.filter(
-            repository__in=self.context["request"].auth.get_repositories(),
+            repository__in=self.context["request"].auth.get_repositories_queryset(),
             commitid=commit_sha,
         ).first()
         if commit is None:
@@ -126,7 +126,7 @@ class StaticAnalysisSuiteSerializer(serializers.ModelSerializer):
         # `validated_data` only contains `commit` after pop
         obj = StaticAnalysisSuite.objects.create(**validated_data)
         request = self.context["request"]
-        repository = request.auth.get_repositories()[0]
+        repository = request.auth.get_repository()
         archive_service = ArchiveService(repository)
         # allow 1s per 10 uploads
         ttl = max(math.ceil(len(file_metadata_array) / 10) + 5, 10)
@@ -4,8 +4,17 @@ from uuid import UUID, uuid4
 import pytest
 from rest_framework.exceptions import NotFound, ValidationError
 from shared.api_archive.archive import ArchiveService
-from shared.django_apps.core.tests.factories import CommitFactory, RepositoryFactory
+from shared.django_apps.core.tests.factories import (
+    CommitFactory,
+    OwnerFactory,
+    RepositoryFactory,
+)
 
+from codecov_auth.authentication.repo_auth import (
+    LegacyTokenRepositoryAuth,
+    OrgLevelTokenRepositoryAuth,
+)
+from codecov_auth.models import OrganizationLevelToken
 from staticanalysis.models import (
     StaticAnalysisSingleFileSnapshotState,
     StaticAnalysisSuite,
@@ -33,9 +42,7 @@ def test_commit_from_sha_serializer_field_to_internal_value(mocker, db):
     commit.save()
     second_commit.save()
     fake_request = mocker.MagicMock(
-        auth=mocker.MagicMock(
-            get_repositories=mocker.MagicMock(return_value=[commit.repository])
-        )
+        auth=LegacyTokenRepositoryAuth(commit.repository, {})
     )
     # silly workaround to not have to manually bind serializers
     mocker.patch.object(
@@ -49,6 +56,31 @@ def test_commit_from_sha_serializer_field_to_internal_value(mocker, db):
     assert serializer_field.to_internal_value(commit.commitid) == commit
 
 
+def test_commit_from_sha_serializer_field_org_token_scope(
+    mocker, db, django_assert_num_queries
+):
+    owner = OwnerFactory(plan="users-enterprisey")
+    repositories = [RepositoryFactory.create(author=owner) for _ in range(20)]
+    commit = CommitFactory.create(repository=repositories[-1])
+    other_commit = CommitFactory.create()
+    org_token = OrganizationLevelToken.objects.create(owner=owner)
+    fake_request = mocker.MagicMock(auth=OrgLevelTokenRepositoryAuth(org_token))
+    mocker.patch.object(
+        CommitFromShaSerializerField, "context", {"request": fake_request}
+    )
+    serializer_field = CommitFromShaSerializerField()
+
+    with django_assert_num_queries(1) as captured:
+        assert serializer_field.to_internal_value(commit.commitid) == commit
+    # the org's repositories are a subquery, not loaded by the scope check
+    sql = captured.captured_queries[0]["sql"]
+    assert "IN (SELECT" in sql
+    assert str(repositories[0].repoid) not in sql
+
+    with pytest.raises(NotFound):
+        serializer_field.to_internal_value(other_commit.commitid)
+
+
 def test_filepath_field(db, mocker):
     sasfs = StaticAnalysisSingleFileSnapshotFactory.create(
         state_id=StaticAnalysisSingleFileSnapshotState.VALID.db_id
@@ -81,9 +113,7 @@ class TestStaticAnalysisSuiteSerializer(object):
         commit.save()
         input_data = {"commit": commit.commitid}
         fake_request = mocker.MagicMock(
-            auth=mocker.MagicMock(
-                get_repositories=mocker.MagicMock(return_value=[commit.repository])
-            )
+            auth=LegacyTokenRepositoryAuth(commit.repository, {})
         )
         serializer = StaticAnalysisSuiteSerializer(context={"request": fake_request})
         with pytest.raises(ValidationError) as exc:
@@ -107,9 +137,7 @@ class TestStaticAnalysisSuiteSerializer(object):
             ],
         }
         fake_request = mocker.MagicMock(
-            auth=mocker.MagicMock(
-                get_repositories=mocker.MagicMock(return_value=[commit.repository])
-            )
+            auth=LegacyTokenRepositoryAuth(commit.repository, {})
         )
         serializer = StaticAnalysisSuiteSerializer(context={"request": fake_request})
         res = serializer.to_internal_value(input_data)
@@ -145,9 +173,7 @@ class TestStaticAnalysisSuiteSerializer(object):
             ],
         }
         fake_request = mocker.MagicMock(
-            auth=mocker.MagicMock(
-                get_repositories=mocker.MagicMock(return_value=[commit.repository])
-            )
+            auth=LegacyTokenRepositoryAuth(commit.repository, {})
         )
         serializer = StaticAnalysisSuiteSerializer(context={"request": fake_request})
         res = serializer.create(validated_data)
@@ -246,9 +272,7 @@ class TestStaticAnalysisSuiteSerializer(object):
             ],
         }
         fake_request = mocker.MagicMock(
-            auth=mocker.MagicMock(
-                get_repositories=mocker.MagicMock(return_value=[commit.repository])
-            )
+            auth=LegacyTokenRepositoryAuth(commit.repository, {})
         )
         serializer = StaticAnalysisSuiteSerializer(context={"request": fake_request})
         res = serializer.create(validated_data)
@@ -22,8 +22,9 @@ class StaticAnalysisSuiteViewSet(mixins.CreateModelMixin, viewsets.GenericViewSe
     lookup_field = "external_id"
 
     def get_queryset(self):
-        repository = self.request.auth.get_repositories()[0]
-        return StaticAnalysisSuite.objects.filter(commit__repository=repository)
+        return StaticAnalysisSuite.objects.filter(
+            commit__repository__in=self.request.auth.get_repositories_queryset()
+        )
 
     def perform_create(self, serializer):
         instance = serializer.save()
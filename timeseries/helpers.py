@@ -1,6 +1,8 @@
 import math
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import sentry_sdk
 from django.conf import settings
@@ -14,6 +16,7 @@ from django.db.models import (
     Func,
     Max,
     Min,
+    Q,
     QuerySet,
     Sum,
     Value,
@@ -21,13 +24,16 @@ from django.db.models import (
 from django.db.models.fields.json import KeyTextTransform
 from django.db.models.functions import Cast
 from django.utils import timezone
+from shared.metrics import Histogram
 
 from codecov_auth.models import Owner
 from core.models import Commit, Repository
 from services.task import TaskService
 from timeseries.models import (
     Dataset,
+    DatasetBackfillChunk,
     Interval,
+    MeasurementDirtyBin,
     MeasurementName,
     MeasurementSummary,
 )
@@ -39,6 +45,26 @@ interval_deltas = {
 }
 
 
+continuous_aggregates = {
+    Interval.INTERVAL_1_DAY: "timeseries_measurement_summary_1day",
+    Interval.INTERVAL_7_DAY: "timeseries_measurement_summary_7day",
+    Interval.INTERVAL_30_DAY: "timeseries_measurement_summary_30day",
+}
+
+TIMESERIES_REFRESH_LAG = Histogram(
+    "api_timeseries_refresh_lag_seconds",
+    "Time in seconds between a measurement bin being marked dirty and its continuous aggregates being refreshed",
+    buckets=[1, 10, 30, 60, 300, 600, 1800, 3600, 3 * 3600, 12 * 3600, 24 * 3600],
+)
+
+TIMESERIES_REFRESH_RUNTIME = Histogram(
+    "api_timeseries_refresh_runtime_seconds",
+    "Runtime in seconds of a continuous aggregate refresh",
+    ["continuous_aggregate"],
+    buckets=[0.1, 0.5, 1, 5, 10, 30, 60, 120, 300, 600],
+)
+
+
 @sentry_sdk.trace
 def refresh_measurement_summaries(start_date: datetime, end_date: datetime) -> None:
     """
@@ -46,15 +72,108 @@ def refresh_measurement_summaries(start_date: datetime, end_date: datetime) -> N
     This calls a TimescaleDB provided SQL function for each of the continuous aggregates
     to refresh the aggregate data in the provided time range.
     """
-    continuous_aggregates = [
-        "timeseries_measurement_summary_1day",
-        "timeseries_measurement_summary_7day",
-        "timeseries_measurement_summary_30day",
-    ]
+    _refresh_continuous_aggregates(
+        {interval: [(start_date, end_date)] for interval in continuous_aggregates}
+    )
+
+
+@sentry_sdk.trace
+def refresh_dirty_measurement_summaries() -> None:
+    """
+    Refresh the measurement summaries only for the time bins whose measurements
+    changed since the last refresh (as recorded in `MeasurementDirtyBin` by a
+    trigger on the measurements table).  The dirty bins are claimed atomically
+    so concurrent runs won't refresh the same bins twice, and are put back if
+    the refresh fails.
+    """
     with connections["timeseries"].cursor() as cursor:
-        for cagg in continuous_aggregates:
-            sql = f"CALL refresh_continuous_aggregate('{cagg}', '{start_date.isoformat()}', '{end_date.isoformat()}')"
-            cursor.execute(sql)
+        cursor.execute(
+            f"DELETE FROM {MeasurementDirtyBin._meta.db_table} RETURNING timestamp_bin, marked_at"
+        )
+        dirty_bins = [
+            MeasurementDirtyBin(timestamp_bin=timestamp_bin, marked_at=marked_at)
+            for timestamp_bin, marked_at in cursor.fetchall()
+        ]
+
+    if len(dirty_bins) == 0:
+        return
+
+    timestamp_bins = [dirty_bin.timestamp_bin for dirty_bin in dirty_bins]
+    try:
+        _refresh_continuous_aggregates(
+            {
+                interval: dirty_ranges(timestamp_bins, interval)
+                for interval in continuous_aggregates
+            }
+        )
+    except Exception:
+        MeasurementDirtyBin.objects.bulk_create(dirty_bins, ignore_conflicts=True)
+        raise
+
+    oldest_marked_at = min(dirty_bin.marked_at for dirty_bin in dirty_bins)
+    TIMESERIES_REFRESH_LAG.observe((timezone.now() - oldest_marked_at).total_seconds())
+
+
+def dirty_ranges(
+    timestamp_bins: Iterable[datetime], interval: Interval
+) -> List[Tuple[datetime, datetime]]:
+    """
+    Converts a set of dirty 1-day bins into the minimal list of `(start, end)`
+    ranges covering the bins of the given interval's continuous aggregate
+    that contain them.
+    """
+    delta = interval_deltas[interval]
+
+    ranges = []
+    for start_date in sorted(
+        set(
+            aligned_start_date(interval, timestamp_bin)
+            for timestamp_bin in timestamp_bins
+        )
+    ):
+        end_date = start_date + delta
+        if ranges and ranges[-1][1] >= start_date:
+            ranges[-1] = (ranges[-1][0], end_date)
+        else:
+            ranges.append((start_date, end_date))
+    return ranges
+
+
+def _refresh_continuous_aggregates(
+    ranges: Dict[Interval, List[Tuple[datetime, datetime]]],
+) -> None:
+    """
+    Refreshes each continuous aggregate over the given time ranges.  The aggregates
+    are refreshed concurrently, each on its own database connection.
+    """
+    with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+        futures = [
+            executor.submit(
+                _refresh_continuous_aggregate,
+                continuous_aggregates[interval],
+                interval_ranges,
+            )
+            for interval, interval_ranges in ranges.items()
+        ]
+        for future in futures:
+            future.result()
+
+
+def _refresh_continuous_aggregate(
+    cagg: str, ranges: List[Tuple[datetime, datetime]]
+) -> None:
+    start = time.perf_counter()
+    try:
+        with connections["timeseries"].cursor() as cursor:
+            for start_date, end_date in ranges:
+                sql = f"CALL refresh_continuous_aggregate('{cagg}', '{start_date.isoformat()}', '{end_date.isoformat()}')"
+                cursor.execute(sql)
+    finally:
+        # connections are thread local, this one was opened for this thread only
+        connections["timeseries"].close()
+    TIMESERIES_REFRESH_RUNTIME.labels(continuous_aggregate=cagg).observe(
+        time.perf_counter() - start
+    )
 
 
 @sentry_sdk.trace
@@ -149,30 +268,114 @@ def trigger_backfill(dataset: Dataset):
     """
     Triggers a backfill for the full timespan of the dataset's repo's commits.
     """
-    oldest_commit = (
-        Commit.objects.filter(repository_id=dataset.repository_id)
-        .order_by("timestamp")
-        .first()
-    )
+    trigger_backfills([dataset])
 
-    newest_commit = (
-        Commit.objects.filter(repository_id=dataset.repository_id)
-        .order_by("-timestamp")
-        .first()
-    )
 
-    if oldest_commit and newest_commit:
+def trigger_backfills(datasets: Iterable[Dataset]):
+    """
+    Triggers a chunked backfill for the full timespan of each dataset's repo's commits.
+    The commit timespan of every repo is fetched with a single grouped query and the
+    backfill is split into `TIMESERIES_BACKFILL_CHUNK_DAYS` chunks (most recent first)
+    whose progress is recorded on the dataset.  All the chunks are enqueued together
+    so that concurrency is bounded across the datasets passed in (usually all the
+    datasets of a single owner).
+    """
+    datasets = list(datasets)
+    if len(datasets) == 0:
+        return
+
+    commit_timespans = {
+        timespan["repository_id"]: timespan
+        for timespan in Commit.objects.filter(
+            repository_id__in=[dataset.repository_id for dataset in datasets]
+        )
+        .values("repository_id")
+        .annotate(oldest=Min("timestamp"), newest=Max("timestamp"))
+    }
+
+    chunks = []
+    for dataset in datasets:
+        timespan = commit_timespans.get(dataset.repository_id)
+        if timespan is None:
+            continue
+
         # dates to span the entire range of commits
-        start_date = oldest_commit.timestamp.date()
+        start_date = timespan["oldest"].date()
         start_date = datetime.fromordinal(start_date.toordinal())
-        end_date = newest_commit.timestamp.date() + timedelta(days=1)
+        end_date = timespan["newest"].date() + timedelta(days=1)
         end_date = datetime.fromordinal(end_date.toordinal())
 
-        TaskService().backfill_dataset(
-            dataset,
-            start_date=start_date,
-            end_date=end_date,
+        chunks += backfill_chunks(dataset, start_date, end_date)
+
+    DatasetBackfillChunk.objects.bulk_create(chunks, ignore_conflicts=True)
+
+    # chunks recorded by a previous backfill are returned by `bulk_create` too
+    # (without ids), only the ones that weren't completed are backfilled
+    chunks = DatasetBackfillChunk.objects.filter(
+        dataset_id__in=[dataset.pk for dataset in datasets],
+        completed_at__isnull=True,
+    ).order_by(
+        # most recent data first since that's what charts show by default
+        "-end_date",
+        "id",
+    )
+
+    TaskService().backfill_dataset_chunks(
+        list(chunks), max_concurrency=settings.TIMESERIES_BACKFILL_MAX_CONCURRENCY
+    )
+
+
+def backfill_chunks(
+    dataset: Dataset, start_date: datetime, end_date: datetime
+) -> List[DatasetBackfillChunk]:
+    """
+    Splits the `start_date` through `end_date` range into contiguous chunks of
+    `TIMESERIES_BACKFILL_CHUNK_DAYS` days, most recent first.
+    """
+    delta = timedelta(days=settings.TIMESERIES_BACKFILL_CHUNK_DAYS)
+
+    chunks = []
+    chunk_end_date = end_date
+    while chunk_end_date > start_date:
+        chunk_start_date = max(chunk_end_date - delta, start_date)
+        chunks.append(
+            DatasetBackfillChunk(
+                dataset=dataset,
+                start_date=chunk_start_date,
+                end_date=chunk_end_date,
+            )
+        )
+        chunk_end_date = chunk_start_date
+    return chunks
+
+
+def backfilled_since(datasets: Iterable[Dataset]) -> Optional[datetime]:
+    """
+    Returns the date since which measurements are available for all the given
+    datasets, based on their completed backfill chunks.  Any chunk still pending
+    means measurements are only complete after its end date.  Returns `None`
+    if there is at least one dataset without any backfill chunk.
+    """
+    datasets = list(datasets)
+    if len(datasets) == 0:
+        return None
+
+    progress = (
+        DatasetBackfillChunk.objects.filter(dataset__in=datasets)
+        .values("dataset_id")
+        .annotate(
+            first_start_date=Min("start_date"),
+            pending_end_date=Max("end_date", filter=Q(completed_at__isnull=True)),
         )
+    )
+    if len(progress) < len(datasets):
+        return None
+
+    since = max(
+        dataset_progress["pending_end_date"] or dataset_progress["first_start_date"]
+        for dataset_progress in progress
+    )
+    return since.replace(tzinfo=timezone.utc)
 
 
 def aligned_start_date(interval: Interval, date: datetime) -> datetime:
@@ -416,18 +619,51 @@ def owner_coverage_measurements_with_fallback(
             repos=repos,
         )
     else:
+        split_date = None
         if settings.TIMESERIES_ENABLED:
             # we need to backfill some datasets
             dataset_repo_ids = set(dataset.repository_id for dataset in datasets)
             missing_dataset_repo_ids = set(repo_ids) - dataset_repo_ids
-            created_datasets = Dataset.objects.bulk_create(
-                [
-                    Dataset(name=MeasurementName.COVERAGE.value, repository_id=repo_id)
-                    for repo_id in missing_dataset_repo_ids
-                ]
+            if missing_dataset_repo_ids:
+                created_datasets = Dataset.objects.bulk_create(
+                    [
+                        Dataset(
+                            name=MeasurementName.COVERAGE.value, repository_id=repo_id
+                        )
+                        for repo_id in missing_dataset_repo_ids
+                    ]
+                )
+                trigger_backfills(created_datasets)
+            else:
+                # all datasets exist, some of their chunks may already be backfilled
+                since = backfilled_since(datasets)
+                if since is not None:
+                    split_date = aligned_start_date(interval, since)
+                    if split_date < since:
+                        split_date += interval_deltas[interval]
+
+        if split_date is not None and (end_date is None or end_date >= split_date):
+            # use the already backfilled measurements for the time bins after
+            # `split_date` and only query the primary database before that
+            fallback = coverage_fallback_query(
+                interval,
+                start_date=start_date,
+                repos=repos,
+                timestamp__lt=split_date,
+            )
+            measurements = coverage_measurements(
+                interval,
+                end_date=end_date,
+                owner_id=owner.pk,
+                repos=repos,
+                timestamp_bin__gte=max(split_date, start_date or split_date),
+            )
+            return sorted(
+                [*fallback, *measurements],
+                key=lambda measurement: measurement["timestamp_bin"].replace(
+                    tzinfo=timezone.utc
+                ),
             )
-            for dataset in created_datasets:
-                trigger_backfill(dataset)
 
         # we're still backfilling or timeseries is disabled
         return coverage_fallback_query(
@@ -0,0 +1,28 @@
+from dateutil import parser as date_parser
+from django.core.management.base import BaseCommand, CommandParser
+
+from timeseries.helpers import (
+    refresh_dirty_measurement_summaries,
+    refresh_measurement_summaries,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Refreshes the measurement summary continuous aggregates.  By default only "
+        "the time bins whose measurements changed since the last refresh are refreshed."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        # refresh the full given time range instead of the dirty time bins
+        parser.add_argument("--start-date", type=str)
+        parser.add_argument("--end-date", type=str)
+
+    def handle(self, *args, **options) -> None:
+        if options["start_date"] and options["end_date"]:
+            refresh_measurement_summaries(
+                start_date=date_parser.parse(options["start_date"]),
+                end_date=date_parser.parse(options["end_date"]),
+            )
+        else:
+            refresh_dirty_measurement_summaries()
@@ -0,0 +1,56 @@
+# Generated by Django 4.2.16 on 2026-10-19 12:00
+
+import django.db.models.deletion
+import django.utils.timezone
+import django_prometheus.models
+from django.db import migrations, models
+
+import core.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        (
+            "timeseries",
+            "0014_remove_measurement_timeseries_measurement_flag_unique_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DatasetBackfillChunk",
+            fields=[
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                ("start_date", core.models.DateTimeWithoutTZField()),
+                ("end_date", core.models.DateTimeWithoutTZField()),
+                ("completed_at", core.models.DateTimeWithoutTZField(null=True)),
+                (
+                    "created_at",
+                    core.models.DateTimeWithoutTZField(
+                        default=django.utils.timezone.now, null=True
+                    ),
+                ),
+                (
+                    "dataset",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="backfill_chunks",
+                        to="timeseries.dataset",
+                    ),
+                ),
+            ],
+            bases=(
+                django_prometheus.models.ExportModelOperationsMixin(
+                    "timeseries.dataset_backfill_chunk"
+                ),
+                models.Model,
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="datasetbackfillchunk",
+            constraint=models.UniqueConstraint(
+                fields=("dataset", "start_date", "end_date"),
+                name="dataset_backfill_chunk_unique",
+            ),
+        ),
+    ]
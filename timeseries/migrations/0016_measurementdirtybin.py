@@ -0,0 +1,61 @@
+# Generated by Django 4.2.16 on 2026-10-19 12:00
+
+import django.utils.timezone
+import django_prometheus.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("timeseries", "0015_datasetbackfillchunk"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MeasurementDirtyBin",
+            fields=[
+                (
+                    "timestamp_bin",
+                    models.DateTimeField(primary_key=True, serialize=False),
+                ),
+                (
+                    "marked_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+            ],
+            bases=(
+                django_prometheus.models.ExportModelOperationsMixin(
+                    "timeseries.measurement_dirty_bin"
+                ),
+                models.Model,
+            ),
+        ),
+        migrations.RunSQL(
+            """
+            create or replace function timeseries_mark_measurement_bin_dirty()
+            returns trigger as $$
+            begin
+                if tg_op in ('INSERT', 'UPDATE') then
+                    insert into timeseries_measurementdirtybin (timestamp_bin, marked_at)
+                    values (time_bucket(interval '1 days', new.timestamp), now())
+                    on conflict (timestamp_bin) do nothing;
+                end if;
+                if tg_op in ('UPDATE', 'DELETE') then
+                    insert into timeseries_measurementdirtybin (timestamp_bin, marked_at)
+                    values (time_bucket(interval '1 days', old.timestamp), now())
+                    on conflict (timestamp_bin) do nothing;
+                end if;
+                return null;
+            end;
+            $$ language plpgsql;
+
+            create trigger timeseries_measurement_mark_bin_dirty
+            after insert or update or delete on timeseries_measurement
+            for each row execute function timeseries_mark_measurement_bin_dirty();
+            """,
+            reverse_sql="""
+            drop trigger if exists timeseries_measurement_mark_bin_dirty on timeseries_measurement;
+            drop function if exists timeseries_mark_measurement_bin_dirty();
+            """,
+        ),
+    ]
@@ -79,6 +79,22 @@ class Measurement(ExportModelOperationsMixin("timeseries.measurement"), models.M
         ]
 
 
+class MeasurementDirtyBin(
+    ExportModelOperationsMixin("timeseries.measurement_dirty_bin"), models.Model
+):
+    """
+    1-day time bins containing measurements that were inserted, updated or deleted
+    since the continuous aggregates were last refreshed.  Rows are written by a
+    trigger on `timeseries_measurement` and consumed by
+    `timeseries.helpers.refresh_dirty_measurement_summaries`.
+    """
+
+    timestamp_bin = models.DateTimeField(primary_key=True)
+
+    # when the bin was first marked dirty, used to compute the refresh lag
+    marked_at = models.DateTimeField(null=False, default=timezone.now)
+
+
 class MeasurementSummary(
     ExportModelOperationsMixin("timeseries.measurement_summary"), models.Model
 ):
@@ -179,3 +195,38 @@ class Dataset(ExportModelOperationsMixin("timeseries.dataset"), models.Model):
         if not self.created_at:
             return False
         return datetime.now() > self.created_at + timedelta(hours=1)
+
+
+class DatasetBackfillChunk(
+    ExportModelOperationsMixin("timeseries.dataset_backfill_chunk"), models.Model
+):
+    """
+    A slice of a dataset's backfill time range.  Backfills are split into chunks
+    that are enqueued as separate tasks (given the `chunk_id`), and the worker marks
+    each chunk completed once the measurements for its time range have been written.
+    """
+
+    id = models.AutoField(primary_key=True)
+
+    dataset = models.ForeignKey(
+        Dataset, on_delete=models.CASCADE, related_name="backfill_chunks"
+    )
+    start_date = DateTimeWithoutTZField(null=False)
+    end_date = DateTimeWithoutTZField(null=False)
+
+    # set by the worker once measurements for this chunk have been written
+    completed_at = DateTimeWithoutTZField(null=True)
+
+    created_at = DateTimeWithoutTZField(default=timezone.now, null=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=[
+                    "dataset",
+                    "start_date",
+                    "end_date",
+                ],
+                name="dataset_backfill_chunk_unique",
+            ),
+        ]
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from unittest.mock import call, patch
+from unittest.mock import patch
 
 import pytest
 from django.conf import settings
@@ -15,13 +15,23 @@ from shared.reports.resources import Report, ReportFile, ReportLine
 from shared.utils.sessions import Session
 
 from timeseries.helpers import (
+    backfilled_since,
     coverage_measurements,
     fill_sparse_measurements,
     owner_coverage_measurements_with_fallback,
+    refresh_dirty_measurement_summaries,
     refresh_measurement_summaries,
     repository_coverage_measurements_with_fallback,
+    trigger_backfill,
+    trigger_backfills,
+)
+from timeseries.models import (
+    Dataset,
+    DatasetBackfillChunk,
+    Interval,
+    MeasurementDirtyBin,
+    MeasurementName,
 )
-from timeseries.models import Dataset, Interval, MeasurementName
 from timeseries.tests.factories import DatasetFactory, MeasurementFactory
 
 
@@ -63,13 +73,74 @@ class RefreshMeasurementSummariesTest(TransactionTestCase):
         )
 
         assert execute.call_count == 3
-        sql_statements = [call[0][0] for call in execute.call_args_list]
+        # aggregates are refreshed concurrently so the order is not deterministic
+        sql_statements = sorted(call[0][0] for call in execute.call_args_list)
         assert sql_statements == [
             "CALL refresh_continuous_aggregate('timeseries_measurement_summary_1day', '2022-01-01T00:00:00', '2022-01-02T00:00:00')",
-            "CALL refresh_continuous_aggregate('timeseries_measurement_summary_7day', '2022-01-01T00:00:00', '2022-01-02T00:00:00')",
             "CALL refresh_continuous_aggregate('timeseries_measurement_summary_30day', '2022-01-01T00:00:00', '2022-01-02T00:00:00')",
+            "CALL refresh_continuous_aggregate('timeseries_measurement_summary_7day', '2022-01-01T00:00:00', '2022-01-02T00:00:00')",
         ]
 
+    @patch("timeseries.helpers._refresh_continuous_aggregates")
+    def test_refresh_dirty_measurement_summaries(self, refresh_continuous_aggregates):
+        MeasurementFactory(timestamp=datetime(2022, 1, 1, 1, 0, 0, tzinfo=timezone.utc))
+        MeasurementFactory(timestamp=datetime(2022, 1, 2, 1, 0, 0, tzinfo=timezone.utc))
+        MeasurementFactory(timestamp=datetime(2022, 1, 9, 1, 0, 0, tzinfo=timezone.utc))
+
+        assert MeasurementDirtyBin.objects.count() == 3
+
+        refresh_dirty_measurement_summaries()
+
+        refresh_continuous_aggregates.assert_called_once_with(
+            {
+                Interval.INTERVAL_1_DAY: [
+                    (
+                        datetime(2022, 1, 1, tzinfo=timezone.utc),
+                        datetime(2022, 1, 3, tzinfo=timezone.utc),
+                    ),
+                    (
+                        datetime(2022, 1, 9, tzinfo=timezone.utc),
+                        datetime(2022, 1, 10, tzinfo=timezone.utc),
+                    ),
+                ],
+                Interval.INTERVAL_7_DAY: [
+                    (
+                        datetime(2021, 12, 27, tzinfo=timezone.utc),
+                        datetime(2022, 1, 10, tzinfo=timezone.utc),
+                    ),
+                ],
+                Interval.INTERVAL_30_DAY: [
+                    (
+                        datetime(2021, 12, 8, tzinfo=timezone.utc),
+                        datetime(2022, 2, 6, tzinfo=timezone.utc),
+                    ),
+                ],
+            }
+        )
+        assert MeasurementDirtyBin.objects.count() == 0
+
+    @patch("timeseries.helpers._refresh_continuous_aggregates")
+    def test_refresh_dirty_measurement_summaries_failure(
+        self, refresh_continuous_aggregates
+    ):
+        refresh_continuous_aggregates.side_effect = Exception("refresh failed")
+        MeasurementFactory(timestamp=datetime(2022, 1, 1, 1, 0, 0, tzinfo=timezone.utc))
+
+        with pytest.raises(Exception):
+            refresh_dirty_measurement_summaries()
+
+        # dirty bins are kept for the next refresh
+        assert list(
+            MeasurementDirtyBin.objects.values_list("timestamp_bin", flat=True)
+        ) == [datetime(2022, 1, 1, tzinfo=timezone.utc)]
+
+    @patch("timeseries.helpers._refresh_continuous_aggregates")
+    def test_refresh_dirty_measurement_summaries_nothing_dirty(
+        self, refresh_continuous_aggregates
+    ):
+        refresh_dirty_measurement_summaries()
+        refresh_continuous_aggregates.assert_not_called()
+
 
 @pytest.mark.skipif(
     not settings.TIMESERIES_ENABLED, reason="requires timeseries data storage"
@@ -1076,8 +1147,87 @@ class OwnerCoverageMeasurementsWithFallbackTest(TransactionTestCase):
             },
         ]
 
-    @patch("timeseries.helpers.trigger_backfill")
-    def test_no_dataset(self, trigger_backfill):
+    @patch("timeseries.models.Dataset.is_backfilled")
+    def test_partially_backfilled_datasets(self, is_backfilled):
+        is_backfilled.return_value = False
+
+        # not backfilled yet, only available in the primary database
+        CommitFactory(
+            commitid="commit1",
+            repository_id=self.repo1.pk,
+            branch="main",
+            timestamp=datetime(2022, 1, 1, 1, 0, 0, 0, tzinfo=timezone.utc),
+            totals={"c": "80.00"},
+        )
+        CommitFactory(
+            commitid="commit1",
+            repository_id=self.repo2.pk,
+            branch="main",
+            timestamp=datetime(2022, 1, 1, 1, 0, 0, 0, tzinfo=timezone.utc),
+            totals={"c": "90.00"},
+        )
+
+        # already backfilled
+        MeasurementFactory(
+            name=MeasurementName.COVERAGE.value,
+            owner_id=self.owner.pk,
+            repo_id=self.repo1.pk,
+            measurable_id=str(self.repo1.pk),
+            timestamp=datetime(2022, 1, 2, 1, 0, 0),
+            value=70.0,
+            branch="main",
+            commit_sha="commit2",
+        )
+        MeasurementFactory(
+            name=MeasurementName.COVERAGE.value,
+            owner_id=self.owner.pk,
+            repo_id=self.repo2.pk,
+            measurable_id=str(self.repo2.pk),
+            timestamp=datetime(2022, 1, 2, 1, 0, 0),
+            value=60.0,
+            branch="main",
+            commit_sha="commit2",
+        )
+
+        for repo in [self.repo1, self.repo2]:
+            dataset = DatasetFactory(
+                name=MeasurementName.COVERAGE.value,
+                repository_id=repo.pk,
+            )
+            DatasetBackfillChunk.objects.create(
+                dataset=dataset,
+                start_date=datetime(2022, 1, 2),
+                end_date=datetime(2022, 1, 3),
+                completed_at=datetime(2022, 1, 3),
+            )
+            DatasetBackfillChunk.objects.create(
+                dataset=dataset,
+                start_date=datetime(2022, 1, 1),
+                end_date=datetime(2022, 1, 2),
+            )
+
+        res = owner_coverage_measurements_with_fallback(
+            owner=self.owner,
+            repo_ids=[self.repo1.pk, self.repo2.pk],
+            interval=Interval.INTERVAL_1_DAY,
+            start_date=datetime(2021, 12, 31, 0, 0, 0, tzinfo=timezone.utc),
+            end_date=datetime(2022, 1, 3, 0, 0, 0, tzinfo=timezone.utc),
+        )
+        assert [
+            (
+                measurement["timestamp_bin"].replace(tzinfo=timezone.utc),
+                measurement["avg"],
+            )
+            for measurement in res
+        ] == [
+            # from the primary database
+            (datetime(2022, 1, 1, 0, 0, 0, tzinfo=timezone.utc), 85.0),
+            # from timeseries measurements
+            (datetime(2022, 1, 2, 0, 0, 0, tzinfo=timezone.utc), 65.0),
+        ]
+
+    @patch("timeseries.helpers.trigger_backfills")
+    def test_no_dataset(self, trigger_backfills):
         CommitFactory(
             commitid="commit1",
             repository_id=self.repo1.pk,
@@ -1173,9 +1323,10 @@ class OwnerCoverageMeasurementsWithFallbackTest(TransactionTestCase):
             repository_id__in=[self.repo1.pk, self.repo2.pk],
         )
         assert datasets.count() == 2
-        trigger_backfill.assert_has_calls(
-            [call(datasets[0]), call(datasets[1])], any_order=True
-        )
+        trigger_backfills.assert_called_once()
+        assert set(
+            dataset.repository_id for dataset in trigger_backfills.call_args.args[0]
+        ) == set([self.repo1.pk, self.repo2.pk])
 
         res = owner_coverage_measurements_with_fallback(
             owner=self.owner,
@@ -1200,3 +1351,111 @@ class OwnerCoverageMeasurementsWithFallbackTest(TransactionTestCase):
                 "max": 80.0,
             },
         ]
+
+
+@pytest.mark.skipif(
+    not settings.TIMESERIES_ENABLED, reason="requires timeseries data storage"
+)
+class TriggerBackfillTest(TransactionTestCase):
+    databases = {"default", "timeseries"}
+
+    def setUp(self):
+        self.repo1 = RepositoryFactory()
+        self.repo2 = RepositoryFactory()
+        CommitFactory(
+            repository=self.repo1,
+            timestamp=datetime(2022, 1, 1, 1, 0, 0, tzinfo=timezone.utc),
+        )
+        CommitFactory(
+            repository=self.repo1,
+            timestamp=datetime(2022, 3, 15, 1, 0, 0, tzinfo=timezone.utc),
+        )
+        CommitFactory(
+            repository=self.repo2,
+            timestamp=datetime(2022, 3, 1, 1, 0, 0, tzinfo=timezone.utc),
+        )
+
+    @patch("services.task.TaskService.backfill_dataset_chunks")
+    def test_trigger_backfill(self, backfill_dataset_chunks):
+        dataset = DatasetFactory(repository_id=self.repo1.pk)
+
+        trigger_backfill(dataset)
+
+        chunks = backfill_dataset_chunks.call_args.args[0]
+        assert [(chunk.start_date, chunk.end_date) for chunk in chunks] == [
+            (datetime(2022, 2, 14), datetime(2022, 3, 16)),
+            (datetime(2022, 1, 15), datetime(2022, 2, 14)),
+            (datetime(2022, 1, 1), datetime(2022, 1, 15)),
+        ]
+        assert backfill_dataset_chunks.call_args.kwargs == dict(
+            max_concurrency=settings.TIMESERIES_BACKFILL_MAX_CONCURRENCY
+        )
+        assert dataset.backfill_chunks.filter(completed_at__isnull=True).count() == 3
+        assert set(chunk.id for chunk in chunks) == set(
+            dataset.backfill_chunks.values_list("id", flat=True)
+        )
+
+    @patch("services.task.TaskService.backfill_dataset_chunks")
+    def test_trigger_backfill_again(self, backfill_dataset_chunks):
+        dataset = DatasetFactory(repository_id=self.repo1.pk)
+        trigger_backfill(dataset)
+        dataset.backfill_chunks.filter(end_date=datetime(2022, 3, 16)).update(
+            completed_at=datetime(2022, 6, 1)
+        )
+
+        trigger_backfill(dataset)
+
+        chunks = backfill_dataset_chunks.call_args.args[0]
+        # the completed chunk isn't backfilled again
+        assert [(chunk.start_date, chunk.end_date) for chunk in chunks] == [
+            (datetime(2022, 1, 15), datetime(2022, 2, 14)),
+            (datetime(2022, 1, 1), datetime(2022, 1, 15)),
+        ]
+        assert dataset.backfill_chunks.count() == 3
+
+    @patch("services.task.TaskService.backfill_dataset_chunks")
+    def test_trigger_backfills(self, backfill_dataset_chunks):
+        dataset1 = DatasetFactory(repository_id=self.repo1.pk)
+        dataset2 = DatasetFactory(repository_id=self.repo2.pk)
+
+        with self.assertNumQueries(1, using="default"):
+            trigger_backfills([dataset1, dataset2])
+
+        backfill_dataset_chunks.assert_called_once()
+        chunks = backfill_dataset_chunks.call_args.args[0]
+        # interleaved, most recent first
+        assert [(chunk.dataset_id, chunk.end_date) for chunk in chunks] == [
+            (dataset1.pk, datetime(2022, 3, 16)),
+            (dataset2.pk, datetime(2022, 3, 2)),
+            (dataset1.pk, datetime(2022, 2, 14)),
+            (dataset1.pk, datetime(2022, 1, 15)),
+        ]
+
+    def test_backfilled_since(self):
+        dataset1 = DatasetFactory(repository_id=self.repo1.pk)
+        dataset2 = DatasetFactory(repository_id=self.repo2.pk)
+
+        assert backfilled_since([dataset1, dataset2]) is None
+
+        DatasetBackfillChunk.objects.create(
+            dataset=dataset1,
+            start_date=datetime(2022, 1, 1),
+            end_date=datetime(2022, 2, 1),
+            completed_at=datetime(2022, 6, 1),
+        )
+        DatasetBackfillChunk.objects.create(
+            dataset=dataset2,
+            start_date=datetime(2022, 2, 1),
+            end_date=datetime(2022, 3, 1),
+            completed_at=datetime(2022, 6, 1),
+        )
+        DatasetBackfillChunk.objects.create(
+            dataset=dataset2,
+            start_date=datetime(2022, 1, 1),
+            end_date=datetime(2022, 2, 1),
+        )
+
+        assert backfilled_since([dataset1]) == datetime(2022, 1, 1, tzinfo=timezone.utc)
+        assert backfilled_since([dataset1, dataset2]) == datetime(
+            2022, 2, 1, tzinfo=timezone.utc
+        )
@@ -1,5 +1,6 @@
 import logging
 import re
+from functools import lru_cache
 from json import dumps
 from typing import Optional
 
@@ -230,6 +231,19 @@ def parse_params(data):
     return v.document
 
 
+@lru_cache
+def get_jwks_client(jwks_url: str) -> PyJWKClient:
+    """
+    Shared JWKS client per url, the client caches the fetched key set and signing
+    keys so verifying a token doesn't need a request to the provider each time.
+    """
+    return PyJWKClient(
+        jwks_url,
+        cache_keys=True,
+        lifespan=settings.OIDC_JWKS_CACHE_TTL_SECONDS,
+    )
+
+
 def get_repo_with_github_actions_oidc_token(token):
     unverified_contents = jwt.decode(token, options={"verify_signature": False})
     token_issuer = str(unverified_contents.get("iss"))
@@ -242,7 +256,7 @@ def get_repo_with_github_actions_oidc_token(token):
         # remove trailing slashes if present
         github_enterprise_url = re.sub(r"/+$", "", github_enterprise_url)
         jwks_url = f"{github_enterprise_url}/_services/token/.well-known/jwks"
-    jwks_client = PyJWKClient(jwks_url)
+    jwks_client = get_jwks_client(jwks_url)
     signing_key = jwks_client.get_signing_key_from_jwt(token)
     data = jwt.decode(
         token,
@@ -2,7 +2,6 @@ import fnmatch
 import logging
 from typing import List
 
-import regex
 from asgiref.sync import async_to_sync
 from rest_framework import serializers, status
 from rest_framework.exceptions import NotFound
@@ -30,6 +29,7 @@ from upload.helpers import (
 from upload.metrics import API_UPLOAD_COUNTER
 from upload.views.base import GetterMixin
 from upload.views.uploads import CanDoCoverageUploadsPermission
+from utils.match import any_path_matcher
 
 log = logging.getLogger(__name__)
 
@@ -138,20 +138,10 @@ class EmptyUploadView(CreateAPIView, GetterMixin):
             fnmatch.translate(path) for path in GLOB_NON_TESTABLE_FILES
         ]
 
-        compiled_files_to_ignore = [
-            regex.compile(path) for path in (regex_non_testable_files + ignored_files)
-        ]
-
-        ignored_changed_files = [
-            file
-            for file in changed_files
-            if any(
-                map(
-                    lambda regex_patt: regex.match(regex_patt, file, timeout=2),
-                    compiled_files_to_ignore,
-                )
-            )
-        ]
+        files_to_ignore = any_path_matcher(
+            regex_non_testable_files + ignored_files, timeout=2
+        )
+        ignored_changed_files = files_to_ignore.filter(changed_files)
         inc_counter(
             API_UPLOAD_COUNTER,
             labels=generate_upload_prometheus_metrics_labels(
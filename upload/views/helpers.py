@@ -1,5 +1,3 @@
-import typing
-
 from codecov_auth.models import Owner, Service
 from core.models import Repository
 
@@ -16,26 +14,19 @@ def get_repository_and_owner_from_string(
         return None, None
 
     owner_identifier, repo_name_identifier = repo_identifier.rsplit("::::", 1)
-    owner = _get_owner_from_string(service, owner_identifier)
-    if not owner:
-        return None, None
+    if ":::" in owner_identifier:
+        owner_identifier = owner_identifier.replace(":::", ":")
+    # single query for both the repository and its owner
     try:
-        repository = Repository.objects.get(author=owner, name=repo_name_identifier)
+        repository = Repository.objects.select_related("author").get(
+            author__service=service,
+            author__username=owner_identifier,
+            name=repo_name_identifier,
+        )
     except Repository.DoesNotExist:
         return None, None
 
-    return repository, owner
-
-
-def _get_owner_from_string(
-    service: Service, owner_identifier: str
-) -> typing.Optional[Owner]:
-    if ":::" in owner_identifier:
-        owner_identifier = owner_identifier.replace(":::", ":")
-    try:
-        return Owner.objects.get(service=service, username=owner_identifier)
-    except Owner.DoesNotExist:
-        return None
+    return repository, repository.author
 
 
 def get_repository_from_string(
@@ -0,0 +1,99 @@
+import enum
+import hashlib
+import json
+import logging
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import QuerySet
+from redis.exceptions import RedisError
+from shared.metrics import Counter, inc_counter
+
+from services.redis_configuration import get_redis_connection
+
+log = logging.getLogger(__name__)
+
+COUNT_LOOKUP_COUNTER = Counter(
+    "api_pagination_count_lookups",
+    "Number of total count lookups done while paginating",
+    ["mode", "result"],
+)
+
+
+class CountMode(enum.Enum):
+    """
+    How the total count of a paginated queryset is computed:
+
+    - EXACT: a `COUNT(*)` on every request
+    - ESTIMATED: the row estimate of the Postgres planner, falling back to an
+      exact count when the estimate is small enough for `COUNT(*)` to be cheap.
+      It's approximate, so it can't bound page numbers.
+    - CACHED: an exact count cached in redis for a short while
+    """
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    CACHED = "cached"
+
+
+def estimated_count(queryset: QuerySet) -> int:
+    queryset = queryset.order_by()
+    sql, params = queryset.query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    estimate = int(plan[0]["Plan"]["Plan Rows"])
+
+    if estimate < settings.PAGINATION_EXACT_COUNT_THRESHOLD:
+        inc_counter(COUNT_LOOKUP_COUNTER, labels=dict(mode="estimated", result="exact"))
+        return queryset.count()
+
+    inc_counter(COUNT_LOOKUP_COUNTER, labels=dict(mode="estimated", result="estimate"))
+    return estimate
+
+
+def _count_cache_key(queryset: QuerySet) -> str:
+    sql, params = queryset.query.sql_with_params()
+    digest = hashlib.sha256(repr((queryset.db, sql, params)).encode()).hexdigest()
+    return f"count/{digest}"
+
+
+def cached_count(queryset: QuerySet) -> int:
+    queryset = queryset.order_by()
+    if not settings.PAGINATION_COUNT_CACHE_TTL_SECONDS:
+        return queryset.count()
+
+    key = _count_cache_key(queryset)
+
+    try:
+        redis = get_redis_connection()
+        cached = redis.get(key)
+    except (OSError, RedisError) as e:
+        log.warning(f"Error connecting to redis: {e}")
+        redis, cached = None, None
+
+    if cached is not None:
+        inc_counter(COUNT_LOOKUP_COUNTER, labels=dict(mode="cached", result="hit"))
+        return int(cached)
+    inc_counter(COUNT_LOOKUP_COUNTER, labels=dict(mode="cached", result="miss"))
+
+    count = queryset.count()
+    if redis is not None:
+        try:
+            redis.set(key, count, ex=settings.PAGINATION_COUNT_CACHE_TTL_SECONDS)
+        except (OSError, RedisError) as e:
+            log.warning(f"Error connecting to redis: {e}")
+    return count
+
+
+def count_queryset(queryset: QuerySet, mode: CountMode = CountMode.EXACT) -> int:
+    """
+    Total count of `queryset` computed according to `mode`
+    """
+    if mode == CountMode.ESTIMATED:
+        return estimated_count(queryset)
+    if mode == CountMode.CACHED:
+        return cached_count(queryset)
+    return queryset.count()
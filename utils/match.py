@@ -0,0 +1,124 @@
+import functools
+import re
+from typing import Callable, Iterable, List, Optional, Tuple
+
+import regex
+
+# patterns referring to their own groups can't be joined with other patterns
+BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+def _compile_any(
+    patterns: Tuple[str, ...], timeout: Optional[float]
+) -> Callable[[str], bool]:
+    """
+    Function telling whether any of `patterns` matches the start of a path.  The
+    patterns are joined into a single regex so a path is matched in one pass.
+    """
+    if not patterns:
+        return lambda path: False
+
+    # `regex` is only needed for its timeout, user defined patterns are matched
+    # with `re` like `shared.utils.match` does otherwise
+    engine = re if timeout is None else regex
+    kwargs = {} if timeout is None else {"timeout": timeout}
+
+    if not any(BACKREFERENCE.search(pattern) for pattern in patterns):
+        try:
+            combined = engine.compile("|".join(f"(?:{p})" for p in patterns))
+        except (re.error, regex.error):
+            # e.g. patterns with global flags which must come first
+            pass
+        else:
+            return lambda path: combined.match(path, **kwargs) is not None
+
+    compiled = [engine.compile(pattern) for pattern in patterns]
+    return lambda path: any(c.match(path, **kwargs) for c in compiled)
+
+
+class PathMatcher:
+    """
+    Set of path patterns compiled once, matching like `shared.utils.match.match`:
+    a path matches if it is one of the patterns, or matches none of the negated
+    (`!`) patterns and any of the other ones when there are some.
+    """
+
+    def __init__(self, patterns: Tuple[str, ...]):
+        self.patterns = frozenset(patterns)
+        patterns = tuple(sorted(filter(None, self.patterns)))
+        negatives = tuple(
+            pattern.replace("!", "")
+            for pattern in patterns
+            if pattern.startswith(("^!", "!"))
+        )
+        positives = tuple(
+            pattern for pattern in patterns if not pattern.startswith(("^!", "!"))
+        )
+        self._negative = _compile_any(negatives, None)
+        self._positive = _compile_any(positives, None) if positives else None
+
+    def match(self, path: str) -> bool:
+        if path in self.patterns:
+            return True
+        if self._negative(path):
+            return False
+        if self._positive is None:
+            return True
+        return self._positive(path)
+
+    def filter(self, paths: Iterable[str]) -> List[str]:
+        return [path for path in paths if self.match(path)]
+
+
+class AnyPathMatcher:
+    """
+    Set of path patterns compiled once, a path matches if any of the patterns
+    matches its start.  Matching a path raises `TimeoutError` after `timeout`
+    seconds, for patterns defined by users.
+    """
+
+    def __init__(self, patterns: Tuple[str, ...], timeout: Optional[float] = None):
+        self._match = _compile_any(tuple(sorted(set(patterns))), timeout)
+
+    def match(self, path: str) -> bool:
+        return self._match(path)
+
+    def filter(self, paths: Iterable[str]) -> List[str]:
+        return [path for path in paths if self._match(path)]
+
+
+class _MatchAll:
+    def match(self, path: str) -> bool:
+        return True
+
+    def filter(self, paths: Iterable[str]) -> List[str]:
+        return list(paths)
+
+
+@functools.lru_cache(maxsize=1024)
+def _path_matcher(patterns: frozenset) -> PathMatcher:
+    return PathMatcher(tuple(patterns))
+
+
+@functools.lru_cache(maxsize=1024)
+def _any_path_matcher(patterns: frozenset, timeout: Optional[float]) -> AnyPathMatcher:
+    return AnyPathMatcher(tuple(patterns), timeout=timeout)
+
+
+def path_matcher(patterns: Optional[Iterable[str]]) -> PathMatcher | _MatchAll:
+    """
+    Matcher for `patterns`, compiled once per set of patterns.  Like
+    `shared.utils.match.match`, no patterns (None) match every path.
+    """
+    if patterns is None:
+        return _MatchAll()
+    return _path_matcher(frozenset(patterns))
+
+
+def any_path_matcher(
+    patterns: Iterable[str], timeout: Optional[float] = None
+) -> AnyPathMatcher:
+    """
+    Matcher for any of `patterns`, compiled once per set of patterns.
+    """
+    return _any_path_matcher(frozenset(patterns), timeout)
@@ -0,0 +1,192 @@
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from types import CodeType, FrameType
+from typing import Any, Callable, Dict, Iterator, Optional
+
+log = logging.getLogger(__name__)
+
+
+def _module_path(filename: str) -> str:
+    """
+    Path of `filename` relative to the entry of `sys.path` it's imported from, e.g.
+    `api/public/v2/report/views.py` or `django/db/models/query.py`.
+    """
+    root = max(
+        (
+            entry
+            for entry in (os.path.join(os.path.abspath(path), "") for path in sys.path)
+            if filename.startswith(entry)
+        ),
+        key=len,
+        default="",
+    )
+    return filename[len(root) :]
+
+
+class StackSampler:
+    """
+    In-process sampling profiler for the threads serving requests.  A background
+    thread takes their stacks (`sys._current_frames`) every `interval` seconds and
+    counts them by the label of the request, e.g. its view name or GraphQL
+    operation.  Every `flush_interval` seconds the counts are written to
+    `directory` as collapsed stacks, the input format of `flamegraph.pl` and
+    speedscope, one line per stack with the label as its root frame:
+
+        graphql.MyRepos;graphql_api/views.py:AsyncGraphqlView.post;... 42
+
+    Samples are of the wall clock: a request waiting on the database or a
+    provider shows where it waits.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        label: Callable[[Any], str],
+        interval: float = 0.01,
+        flush_interval: float = 60,
+        max_depth: int = 64,
+    ):
+        self.directory = directory
+        self.label = label
+        self.interval = interval
+        self.flush_interval = flush_interval
+        self.max_depth = max_depth
+        self.stacks: Counter = Counter()
+        # thread id -> request it is serving
+        self._requests: Dict[int, Any] = {}
+        self._frame_names: Dict[CodeType, str] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        self._thread = threading.Thread(
+            target=self._run, name="stack-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    @contextmanager
+    def sampling(self, request: Any) -> Iterator[None]:
+        """
+        Samples the current thread while it serves `request`.  The other threads
+        sampled for `request` meanwhile aren't, e.g. the one waiting in
+        `async_to_sync` for the event loop to serve it, so that a request is only
+        sampled once.
+        """
+        thread_id = threading.get_ident()
+        waiting = [
+            other_id
+            for other_id, other_request in list(self._requests.items())
+            if other_request is request and other_id != thread_id
+        ]
+        for other_id in waiting:
+            self._requests.pop(other_id, None)
+        previous = self._requests.get(thread_id)
+        self._requests[thread_id] = request
+        try:
+            yield
+        finally:
+            if previous is None:
+                self._requests.pop(thread_id, None)
+            else:
+                self._requests[thread_id] = previous
+            for other_id in waiting:
+                self._requests[other_id] = request
+
+    def _run(self) -> None:
+        next_flush = time.monotonic() + self.flush_interval
+        while not self._stopped.wait(self.interval):
+            try:
+                self.sample()
+                if time.monotonic() >= next_flush:
+                    next_flush += self.flush_interval
+                    self.flush()
+            except Exception:
+                log.exception("Failed to sample stacks")
+
+    def _frame_name(self, code: CodeType) -> str:
+        name = self._frame_names.get(code)
+        if name is None:
+            filename = _module_path(code.co_filename)
+            name = self._frame_names[code] = f"{filename}:{code.co_qualname}"
+        return name
+
+    def _stack(self, frame: Optional[FrameType]) -> str:
+        names = []
+        while frame is not None and len(names) < self.max_depth:
+            names.append(self._frame_name(frame.f_code))
+            frame = frame.f_back
+        names.reverse()
+        return ";".join(names)
+
+    def sample(self) -> None:
+        requests = dict(self._requests)
+        if not requests:
+            return
+
+        frames = sys._current_frames()
+        samples = []
+        for thread_id, request in requests.items():
+            frame = frames.get(thread_id)
+            if frame is None:
+                continue
+            samples.append(f"{self.label(request)};{self._stack(frame)}")
+        del frames
+
+        with self._lock:
+            self.stacks.update(samples)
+
+    def flush(self) -> Optional[str]:
+        """
+        Writes the stacks sampled since the last flush, returns the path of the
+        file or None when there were none.
+        """
+        with self._lock:
+            stacks, self.stacks = self.stacks, Counter()
+        if not stacks:
+            return None
+
+        path = os.path.join(self.directory, f"{os.getpid()}-{int(time.time())}.folded")
+        with open(f"{path}.tmp", "w") as f:
+            for stack, count in stacks.items():
+                f.write(f"{stack} {count}\n")
+        os.replace(f"{path}.tmp", path)
+        return path
+
+
+_sampler: Optional[StackSampler] = None
+
+
+def get_sampler() -> Optional[StackSampler]:
+    return _sampler
+
+
+def start_sampler(sampler: StackSampler) -> None:
+    """
+    Starts `sampler` as the one of the process, e.g. of a gunicorn worker.
+    """
+    global _sampler
+    if _sampler is not None:
+        _sampler.stop()
+    _sampler = sampler
+    sampler.start()
+
+
+def stop_sampler() -> None:
+    global _sampler
+    if _sampler is not None:
+        _sampler.stop()
+        _sampler = None
@@ -3,6 +3,7 @@ from django.conf import settings
 from shared.api_archive.storage import StorageService
 from shared.storage.exceptions import FileNotInStorageError
 
+from services.io_accounting import STORAGE, accounted_proxy
 from services.redis_configuration import get_redis_connection
 from services.task import TaskService
 
@@ -55,7 +56,7 @@ def get_results(
 
     if result is None:
         # try storage
-        storage_service = StorageService()
+        storage_service = accounted_proxy(StorageService(), STORAGE)
         key = storage_key(repoid, branch, interval_start, interval_end)
         try:
             result = storage_service.read_file(
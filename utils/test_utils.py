@@ -1,3 +1,5 @@
+import json
+
 from django.apps import apps
 from django.db import connection
 from django.db.migrations.executor import MigrationExecutor
@@ -34,6 +36,16 @@ class APIClient(ClientMixin, DjangoAPIClient):
     pass
 
 
+def streamed_json(response):
+    """
+    Decoded JSON body of a response, including streamed ones which the test
+    client can't decode with `response.json()`.
+    """
+    if response.streaming:
+        return json.loads(b"".join(response.streaming_content))
+    return response.json()
+
+
 class TestMigrations(TestCase):
     @property
     def app(self):
@@ -0,0 +1,68 @@
+from unittest.mock import MagicMock, patch
+
+import fakeredis
+from django.test import TestCase, override_settings
+from redis.exceptions import ConnectionError
+from shared.django_apps.core.tests.factories import OwnerFactory, RepositoryFactory
+
+from core.models import Repository
+from utils.counts import CountMode, count_queryset
+
+
+class CountQuerysetTests(TestCase):
+    def setUp(self):
+        self.owner = OwnerFactory()
+        RepositoryFactory(author=self.owner, name="a")
+        RepositoryFactory(author=self.owner, name="b")
+        RepositoryFactory(author=self.owner, name="c")
+        self.queryset = Repository.objects.filter(author=self.owner).order_by("name")
+
+    def test_exact_count(self):
+        assert count_queryset(self.queryset) == 3
+
+    def test_estimated_count_small_estimate(self):
+        # the planner estimate is below the threshold so we count exactly
+        assert count_queryset(self.queryset, CountMode.ESTIMATED) == 3
+
+    @override_settings(PAGINATION_EXACT_COUNT_THRESHOLD=0)
+    def test_estimated_count(self):
+        with self.assertNumQueries(1):
+            count = count_queryset(self.queryset, CountMode.ESTIMATED)
+        assert isinstance(count, int)
+        assert count >= 0
+
+    @override_settings(PAGINATION_COUNT_CACHE_TTL_SECONDS=300)
+    @patch("utils.counts.get_redis_connection")
+    def test_cached_count(self, get_redis_connection_mock):
+        get_redis_connection_mock.return_value = fakeredis.FakeStrictRedis()
+
+        assert count_queryset(self.queryset, CountMode.CACHED) == 3
+
+        RepositoryFactory(author=self.owner, name="d")
+        with self.assertNumQueries(0):
+            assert count_queryset(self.queryset, CountMode.CACHED) == 3
+
+        # different querysets are cached separately
+        assert count_queryset(self.queryset.filter(name="d"), CountMode.CACHED) == 1
+
+    @override_settings(PAGINATION_COUNT_CACHE_TTL_SECONDS=0)
+    @patch("utils.counts.get_redis_connection")
+    def test_cached_count_disabled(self, get_redis_connection_mock):
+        assert count_queryset(self.queryset, CountMode.CACHED) == 3
+        get_redis_connection_mock.assert_not_called()
+
+    @override_settings(PAGINATION_COUNT_CACHE_TTL_SECONDS=300)
+    @patch("utils.counts.get_redis_connection")
+    def test_cached_count_redis_unavailable(self, get_redis_connection_mock):
+        get_redis_connection_mock.side_effect = OSError("unavailable")
+
+        assert count_queryset(self.queryset, CountMode.CACHED) == 3
+
+    @override_settings(PAGINATION_COUNT_CACHE_TTL_SECONDS=300)
+    @patch("utils.counts.get_redis_connection")
+    def test_cached_count_redis_error(self, get_redis_connection_mock):
+        redis = fakeredis.FakeStrictRedis()
+        redis.get = MagicMock(side_effect=ConnectionError("unavailable"))
+        get_redis_connection_mock.return_value = redis
+
+        assert count_queryset(self.queryset, CountMode.CACHED) == 3
@@ -0,0 +1,56 @@
+import fnmatch
+
+import pytest
+from shared.utils.match import match
+
+from utils.match import any_path_matcher, path_matcher
+
+PATHS = [
+    "src/app.py",
+    "src/app.go",
+    "src/vendor/lib.py",
+    "tests/test_app.py",
+    "README.md",
+    "docs/index.md",
+]
+
+
+@pytest.mark.parametrize(
+    "patterns",
+    [
+        None,
+        [],
+        [""],
+        [r"^src/.*"],
+        [r".*\.py$", r".*\.md$"],
+        [r"!^src/vendor/.*"],
+        [r"^src/.*", r"!^src/vendor/.*"],
+        [r"^!tests/.*", r".*\.py$"],
+        ["README.md"],
+        [r"(?i)^readme"],
+        [r"^(src|tests)/\1"],
+    ],
+)
+def test_path_matcher_same_as_match(patterns):
+    expected = [path for path in PATHS if match(patterns, path)]
+
+    assert path_matcher(patterns).filter(PATHS) == expected
+    assert [path for path in PATHS if path_matcher(patterns).match(path)] == expected
+
+
+def test_path_matcher_cached_by_pattern_set():
+    assert path_matcher([r"^src/.*", r".*\.md$"]) is path_matcher(
+        [r".*\.md$", r"^src/.*"]
+    )
+    assert path_matcher([r"^src/.*"]) is not path_matcher([r"^tests/.*"])
+
+
+def test_any_path_matcher():
+    patterns = [fnmatch.translate("*.md"), r"^tests/"]
+
+    assert any_path_matcher(patterns, timeout=2).filter(PATHS) == [
+        "tests/test_app.py",
+        "README.md",
+        "docs/index.md",
+    ]
+    assert any_path_matcher([]).filter(PATHS) == []
@@ -0,0 +1,126 @@
+import os
+import threading
+
+from utils.sampling_profiler import (
+    StackSampler,
+    get_sampler,
+    start_sampler,
+    stop_sampler,
+)
+
+
+class Request:
+    def __init__(self, name):
+        self.name = name
+
+
+def sampler(tmp_path, **kwargs):
+    return StackSampler(str(tmp_path), label=lambda request: request.name, **kwargs)
+
+
+def handle_request(sampler):
+    sampler.sample()
+
+
+def test_sample_labelled_by_request(tmp_path):
+    stack_sampler = sampler(tmp_path)
+
+    # threads not serving a request aren't sampled
+    stack_sampler.sample()
+    assert not stack_sampler.stacks
+
+    with stack_sampler.sampling(Request("graphql.MyRepos")):
+        handle_request(stack_sampler)
+        with stack_sampler.sampling(Request("nested")):
+            stack_sampler.sample()
+        handle_request(stack_sampler)
+
+    ((stack, count), (nested, nested_count)) = stack_sampler.stacks.most_common()
+    assert stack.startswith("graphql.MyRepos;")
+    assert stack.endswith(
+        ";test_sampling_profiler.py:handle_request"
+        ";utils/sampling_profiler.py:StackSampler.sample"
+    )
+    assert count == 2
+    assert nested.startswith("nested;")
+    assert nested_count == 1
+
+
+def test_sample_max_depth(tmp_path):
+    stack_sampler = sampler(tmp_path, max_depth=2)
+
+    with stack_sampler.sampling(Request("view")):
+        handle_request(stack_sampler)
+
+    assert list(stack_sampler.stacks) == [
+        "view;test_sampling_profiler.py:handle_request"
+        ";utils/sampling_profiler.py:StackSampler.sample"
+    ]
+
+
+def test_frame_names_by_module(tmp_path):
+    stack_sampler = sampler(tmp_path)
+
+    assert stack_sampler._frame_name(StackSampler.sample.__code__) == (
+        "utils/sampling_profiler.py:StackSampler.sample"
+    )
+    assert stack_sampler._frame_name(threading.Thread.run.__code__) == (
+        "threading.py:Thread.run"
+    )
+
+
+def test_request_sampled_once(tmp_path):
+    stack_sampler = sampler(tmp_path)
+    request = Request("graphql.MyRepos")
+    samples = []
+
+    def serve_in_thread():
+        # e.g. the event loop serving the request for `async_to_sync`
+        with stack_sampler.sampling(request):
+            stack_sampler.sample()
+            samples.append(dict(stack_sampler.stacks))
+
+    with stack_sampler.sampling(request):
+        thread = threading.Thread(target=serve_in_thread)
+        thread.start()
+        thread.join()
+        handle_request(stack_sampler)
+
+    ((stack, count),) = samples[0].items()
+    assert "serve_in_thread" in stack
+    assert count == 1
+    # the waiting thread is sampled again once the other one is done
+    assert sum(stack_sampler.stacks.values()) == 2
+
+
+def test_flush(tmp_path):
+    stack_sampler = sampler(tmp_path)
+    assert stack_sampler.flush() is None
+
+    with stack_sampler.sampling(Request("view")):
+        handle_request(stack_sampler)
+        handle_request(stack_sampler)
+
+    path = stack_sampler.flush()
+    assert os.listdir(tmp_path) == [os.path.basename(path)]
+    with open(path) as f:
+        (line,) = f.read().splitlines()
+    stack, count = line.rsplit(" ", 1)
+    assert stack.startswith("view;")
+    assert count == "2"
+    assert not stack_sampler.stacks
+
+
+def test_sampler_thread(tmp_path):
+    stack_sampler = sampler(tmp_path, interval=0.001)
+    done = threading.Event()
+
+    start_sampler(stack_sampler)
+    assert get_sampler() is stack_sampler
+    with stack_sampler.sampling(Request("view")):
+        done.wait(0.1)
+    stop_sampler()
+
+    assert get_sampler() is None
+    (path,) = os.listdir(tmp_path)
+    assert path.endswith(".folded")